@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+
+from benchmarks import harness, history
+from benchmarks.cases import CASES
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time every solver at several input sizes and compare "
+        "the results with the stored baseline.",
+    )
+    parser.add_argument(
+        "cases", nargs="*", help="only run these cases or days, e.g. day1"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="also store the results with the current commit in the "
+        "history, see python -m benchmarks.history",
+    )
+    parser.add_argument("--history", default=history.HISTORY_PATH)
+    args = parser.parse_args()
+
+    cases = [
+        case
+        for case in CASES
+        if not args.cases
+        or case.name in args.cases
+        or case.name.split(".")[0] in args.cases
+    ]
+    results = harness.run_benchmarks(cases, args.repeats, verbose=True)
+    print()
+    print(harness.format_scaling(results))
+
+    if args.record:
+        run_id = history.record(results, args.history)
+        print(f"\nRun {run_id} recorded in {args.history}")
+
+    if args.update_baseline:
+        updated = harness.load_results(args.baseline) or {}
+        updated.update(results)
+        harness.save_results(updated, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        sys.exit(0)
+
+    baseline = harness.load_results(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline found at {args.baseline}")
+        sys.exit(1)
+
+    tolerance = args.tolerance
+    regressions = harness.compare_to_baseline(results, baseline, tolerance)
+    for r in regressions:
+        print(
+            f"REGRESSION {r.case} x{r.scale} {r.metric}: "
+            f"{r.baseline:.6g} -> {r.current:.6g}"
+        )
+    if regressions:
+        sys.exit(1)
+    print(f"\nNo regression beyond {args.tolerance:.0%} of the baseline")
@@ -0,0 +1,381 @@
+import functools
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+from src.aoc2022.days import (
+    day1,
+    day2,
+    day3,
+    day4,
+    day5,
+    day6,
+    day7,
+    day8,
+    day9,
+    day10,
+    day11,
+    day12,
+    day13,
+    day14,
+    day15,
+    day16,
+)
+
+DEFAULT_SCALES = (0.5, 1, 2, 4)
+"""
+Input sizes, relative to the real puzzle input, used by most cases
+"""
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    Data class describing how to benchmark a solver
+
+    :param name: unique name of the case, ``dayN.function``
+    :type name: str
+
+    :param day: day whose generator and ``parse_input`` are used
+    :type day: int
+
+    :param solver: function being timed
+    :type solver: Callable
+
+    :param make_args: builds the solver arguments from the parsed input
+    :type make_args: Callable[[Any], Tuple]
+
+    :param scales: input sizes the solver is timed at
+    :type scales: Sequence[float]
+
+    :param mutates: whether the solver modifies its arguments in place, in
+        which case they are rebuilt before every call
+    :type mutates: bool
+    """
+
+    name: str
+    day: int
+    solver: Callable
+    make_args: Callable[[Any], Tuple]
+    scales: Sequence[float] = DEFAULT_SCALES
+    mutates: bool = False
+
+
+def as_args(parsed: Any) -> Tuple:
+    """Pass the parsed input as the only argument of the solver"""
+    return (parsed,)
+
+
+def make_day2_args(parsed: Tuple) -> Tuple:
+    """Score the rounds parsed as (move, move)"""
+    return (parsed[0], day2.point_mappings_part_1)
+
+
+def make_day12_args(parsed: Tuple) -> Tuple:
+    """Run the search from the end position"""
+    height_map, _, end = parsed
+    return (height_map, end)
+
+
+def make_day13_args(parsed: List[Tuple]) -> Tuple:
+    """Sort every packet of every pair"""
+    return ([packet for pair in parsed for packet in pair],)
+
+
+def make_day14_args(parsed: Tuple) -> Tuple:
+    """Simulate the cave with a floor, which fills the whole triangle"""
+    return day14.add_floor_to_map(*parsed)
+
+
+def make_day15_args(parsed: List[Tuple]) -> Tuple:
+    """Scan the row used by part 1"""
+    return (parsed, 2_000_000)
+
+
+def make_day16_args(parsed: day16.Graph) -> Tuple:
+    """Search from the start valve with the time limit of part 1"""
+    return (parsed, "AA", 30)
+
+
+def make_day16_dual_args(parsed: day16.Graph) -> Tuple:
+    """Search from the start valve with the time limit of part 2"""
+    return (parsed, "AA", 26)
+
+
+CASES = [
+    BenchmarkCase(
+        "day1.get_largest_group_sum",
+        1,
+        day1.get_largest_group_sum,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day1.get_3_largest_group_sum",
+        1,
+        day1.get_3_largest_group_sum,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day1.get_k_largest_group_sum",
+        1,
+        functools.partial(day1.get_k_largest_group_sum, k=100),
+        as_args,
+    ),
+    BenchmarkCase(
+        "day2.calculate_points",
+        2,
+        day2.calculate_points,
+        make_day2_args,
+    ),
+    BenchmarkCase(
+        "day3.count_total_priority",
+        3,
+        day3.count_total_priority,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day3.count_triplet_priority",
+        3,
+        day3.count_triplet_priority,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day4.solve_part_2",
+        4,
+        day4.solve_part_2,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day5.transfer_multiple_items",
+        5,
+        day5.transfer_multiple_items,
+        tuple,
+        mutates=True,
+    ),
+    BenchmarkCase(
+        "day6.detect_start_of_packet",
+        6,
+        functools.partial(day6.detect_start_of_packet, num_distinct=14),
+        as_args,
+        scales=(1, 4, 16, 64),
+    ),
+    BenchmarkCase(
+        "day7.get_directories_under_size",
+        7,
+        functools.partial(day7.get_directories_under_size, max_size=100_000),
+        as_args,
+    ),
+    BenchmarkCase(
+        "day8.count_visible_trees",
+        8,
+        day8.count_visible_trees,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day8.get_max_scenic_score",
+        8,
+        day8.get_max_scenic_score,
+        as_args,
+    ),
+    BenchmarkCase(
+        "day9.get_multi_knot_positions",
+        9,
+        functools.partial(day9.get_multi_knot_positions, num_knots=10),
+        as_args,
+    ),
+    BenchmarkCase(
+        "day10.get_total_signal_strength",
+        10,
+        day10.get_total_signal_strength,
+        as_args,
+        scales=(1, 4, 16, 64),
+    ),
+    BenchmarkCase(
+        "day11.compute_number_of_counted_items_no_div",
+        11,
+        functools.partial(day11.compute_number_of_counted_items_no_div, 1_000),
+        as_args,
+        scales=(1, 2, 4),
+    ),
+    BenchmarkCase(
+        "day12.get_distance_matrix",
+        12,
+        day12.get_distance_matrix,
+        make_day12_args,
+    ),
+    BenchmarkCase(
+        "day13.sort_packets",
+        13,
+        day13.sort_packets,
+        make_day13_args,
+    ),
+    BenchmarkCase(
+        "day14.simulate_sand_falling",
+        14,
+        day14.simulate_sand_falling,
+        make_day14_args,
+        scales=(0.125, 0.25, 0.5, 1),
+    ),
+    BenchmarkCase(
+        "day15.count_scanned_location",
+        15,
+        day15.count_scanned_location,
+        make_day15_args,
+        scales=(1, 4, 16, 64),
+    ),
+    BenchmarkCase(
+        "day16.get_optimal_sequence",
+        16,
+        day16.get_optimal_sequence,
+        make_day16_args,
+        scales=(0.1, 0.125, 0.15),
+    ),
+    BenchmarkCase(
+        "day16.get_optimal_dual_sequence",
+        16,
+        day16.get_optimal_dual_sequence,
+        make_day16_dual_args,
+        scales=(0.1, 0.125, 0.15),
+    ),
+]
+"""
+Every benchmarked solver
+"""
+
+DIFFERENTIAL_CASES: Dict[str, str] = {
+    "day1.get_largest_group_sum": "day1.get_largest_group_sum",
+    "day1.get_3_largest_group_sum": "day1.get_3_largest_group_sum",
+    "day1.get_k_largest_group_sum": "day1.get_k_largest_group_sum",
+    "day3.get_shared_element": "day3.count_total_priority",
+    "day3.get_triplet_shared_element": "day3.count_triplet_priority",
+    "day8.count_visible_trees": "day8.count_visible_trees",
+    "day8.get_max_scenic_score": "day8.get_max_scenic_score",
+    "day15.count_scanned_location": "day15.count_scanned_location",
+    # Numba kernels, registered only when Numba is installed
+    "day8.compute_scenic_score": "day8.get_max_scenic_score",
+    "day9.get_multi_knot_positions": "day9.get_multi_knot_positions",
+    "graphs.bfs": "day12.get_distance_matrix",
+    "day14.simulate_grain_of_sand": "day14.simulate_sand_falling",
+}
+"""
+Registry name of every solver with several implementations, to the name
+of the benchmark case running it on generated inputs
+"""
+
+
+LINEAR = 1.5
+"""
+Largest growth exponent accepted for a solver doing linear work. The
+fitted exponent of a linear solver is about 1, timer noise and caches move
+it by a few tenths, and a quadratic solver fits about 2.
+"""
+
+N_LOG_N = 1.6
+"""
+Largest growth exponent accepted for a solver doing n log n work
+"""
+
+
+class GrowthBound(NamedTuple):
+    """
+    Data class declaring how fast the time of a benchmark case may grow
+    with the input size
+
+    :param case: name of the benchmark case
+    :type case: str
+
+    :param scales: doubling input sizes the growth exponent is fitted on
+    :type scales: Sequence[float]
+
+    :param max_exponent: largest growth exponent accepted
+    :type max_exponent: float
+    """
+
+    case: str
+    scales: Sequence[float]
+    max_exponent: float
+
+
+GROWTH_BOUNDS = [
+    GrowthBound("day1.get_largest_group_sum", (8, 16, 32, 64), LINEAR),
+    GrowthBound("day3.count_total_priority", (1, 2, 4, 8), LINEAR),
+    GrowthBound("day6.detect_start_of_packet", (4, 8, 16, 32), LINEAR),
+    GrowthBound("day7.get_directories_under_size", (2, 4, 8, 16), LINEAR),
+    GrowthBound(
+        "day9.get_multi_knot_positions",
+        (0.125, 0.25, 0.5, 1),
+        LINEAR,
+    ),
+    GrowthBound("day10.get_total_signal_strength", (8, 16, 32, 64), LINEAR),
+    # linear in the area of the grid, which the scale grows
+    GrowthBound("day12.get_distance_matrix", (0.5, 1, 2, 4), LINEAR),
+    GrowthBound("day13.sort_packets", (1, 2, 4, 8), N_LOG_N),
+]
+"""
+Solvers whose complexity is checked, at sizes where the smallest call
+takes about a millisecond so that the fit is not dominated by noise
+"""
+
+
+class MemoryBudget(NamedTuple):
+    """
+    Data class describing the peak memory allowed to parse a generated
+    input and solve one part
+
+    :param day: day number
+    :type day: int
+
+    :param part: part number, 1 or 2
+    :type part: int
+
+    :param scale: input size the budget applies to
+    :type scale: float
+
+    :param limit: maximum peak memory, in bytes
+    :type limit: int
+    """
+
+    day: int
+    part: int
+    scale: float
+    limit: int
+
+
+KIB = 1024
+
+MEMORY_BUDGETS = [
+    MemoryBudget(1, 1, 1, 384 * KIB),
+    MemoryBudget(1, 2, 1, 384 * KIB),
+    MemoryBudget(2, 1, 1, 1152 * KIB),
+    MemoryBudget(2, 2, 1, 1152 * KIB),
+    MemoryBudget(3, 1, 1, 176 * KIB),
+    MemoryBudget(3, 2, 1, 176 * KIB),
+    MemoryBudget(4, 1, 1, 128 * KIB),
+    MemoryBudget(4, 2, 1, 128 * KIB),
+    MemoryBudget(5, 1, 1, 80 * KIB),
+    MemoryBudget(5, 2, 1, 80 * KIB),
+    MemoryBudget(6, 1, 1, 64 * KIB),
+    MemoryBudget(6, 2, 1, 64 * KIB),
+    MemoryBudget(7, 1, 1, 384 * KIB),
+    MemoryBudget(7, 2, 1, 384 * KIB),
+    MemoryBudget(8, 1, 0.5, 176 * KIB),
+    MemoryBudget(8, 2, 0.5, 128 * KIB),
+    MemoryBudget(9, 1, 0.5, 2048 * KIB),
+    MemoryBudget(9, 2, 0.5, 832 * KIB),
+    MemoryBudget(10, 1, 1, 64 * KIB),
+    MemoryBudget(10, 2, 1, 64 * KIB),
+    # part 2 runs 10 000 rounds whatever the scale, too slow for the tier
+    MemoryBudget(11, 1, 1, 64 * KIB),
+    MemoryBudget(12, 1, 0.5, 320 * KIB),
+    MemoryBudget(12, 2, 0.5, 320 * KIB),
+    MemoryBudget(13, 1, 0.5, 288 * KIB),
+    MemoryBudget(13, 2, 0.5, 288 * KIB),
+    MemoryBudget(14, 1, 1, 72 * KIB),
+    MemoryBudget(14, 2, 0.125, 64 * KIB),
+    MemoryBudget(15, 1, 1, 64 * KIB),
+    MemoryBudget(15, 2, 1, 1408 * KIB),
+    MemoryBudget(16, 1, 0.1, 64 * KIB),
+    MemoryBudget(16, 2, 0.1, 64 * KIB),
+]
+"""
+Peak memory budget of every part, about 1.5 times the measured peak so
+that only real regressions fail the memory tests, and at least 64 KiB so
+that small allocations of tracers such as coverage are not reported
+"""
@@ -0,0 +1,283 @@
+import argparse
+import contextlib
+import copy
+import functools
+import importlib
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
+
+from benchmarks.cases import CASES, DIFFERENTIAL_CASES, BenchmarkCase
+from src.aoc2022 import generators, implementations, runner
+
+
+class Comparison(NamedTuple):
+    """
+    Data class representing one implementation of a solver run on one
+    generated input
+
+    :param solver: registry name of the solver, ``dayN.function``
+    :type solver: str
+
+    :param implementation: name of the implementation
+    :type implementation: str
+
+    :param case: name of the benchmark case that was run
+    :type case: str
+
+    :param scale: input size relative to the real puzzle input
+    :type scale: float
+
+    :param seconds: best wall time over the repeats, in seconds
+    :type seconds: float
+
+    :param speedup: wall time of the reference divided by this one
+    :type speedup: float
+
+    :param agrees: whether the answer is the one of the reference
+    :type agrees: bool
+    """
+
+    solver: str
+    implementation: str
+    case: str
+    scale: float
+    seconds: float
+    speedup: float
+    agrees: bool
+
+
+def answers_agree(reference: Any, answer: Any) -> bool:
+    """
+    Compare two answers, arrays element-wise
+
+    :param reference: answer of the reference implementation
+    :type reference: Any
+
+    :param answer: answer of another implementation
+    :type answer: Any
+
+    :return: whether the answers are equal
+    :rtype: bool
+    """
+    if isinstance(reference, np.ndarray) or isinstance(answer, np.ndarray):
+        return bool(np.array_equal(reference, answer))
+    return bool(reference == answer)
+
+
+def rebind(
+    call: Callable, candidates: Iterable[Callable], function: Callable
+) -> Callable:
+    """
+    Make a benchmark case call the selected implementation. Cases holding
+    an implementation itself, possibly in a ``functools.partial``, call it
+    without the module, so they are pointed at the selected one; other
+    cases go through the module and are kept.
+
+    :param call: solver of the benchmark case
+    :type call: Callable
+
+    :param candidates: every implementation of the compared solver
+    :type candidates: Iterable[Callable]
+
+    :param function: selected implementation
+    :type function: Callable
+
+    :return: function calling the selected implementation
+    :rtype: Callable
+    """
+    candidates = list(candidates)
+    if any(call is candidate for candidate in candidates):
+        return function
+    if isinstance(call, functools.partial) and any(
+        call.func is candidate for candidate in candidates
+    ):
+        return functools.partial(function, *call.args, **call.keywords)
+    return call
+
+
+@contextlib.contextmanager
+def using_references(solver_name: str) -> Iterator[None]:
+    """
+    Make every solver other than the compared one use its reference
+    implementation inside a block, so that the reference run of a solver
+    calling accelerated code, e.g. a Numba kernel selected at import, runs
+    the original code only
+
+    :param solver_name: registry name of the compared solver, left as is
+    :type solver_name: str
+
+    :return: context manager restoring the implementations in use
+    :rtype: Iterator[None]
+    """
+    with contextlib.ExitStack() as stack:
+        for name in list(implementations.REGISTRY):
+            if name != solver_name:
+                stack.enter_context(
+                    implementations.using(name, implementations.REFERENCE)
+                )
+        yield
+
+
+def compare(
+    solver_name: str,
+    case: BenchmarkCase,
+    scale: float,
+    repeats: int = 3,
+    seed: int = 0,
+) -> List[Comparison]:
+    """
+    Run a benchmark case with every implementation of a solver in turn,
+    on the same generated input
+
+    :param solver_name: registry name of the solver, ``dayN.function``
+    :type solver_name: str
+
+    :param case: benchmark case calling the solver
+    :type case: BenchmarkCase
+
+    :param scale: input size relative to the real puzzle input
+    :type scale: float
+
+    :param repeats: number of timed calls, the fastest one is kept
+    :type repeats: int
+
+    :param seed: seed for the input generator
+    :type seed: int
+
+    :return: one comparison per implementation, the reference first
+    :rtype: List[Comparison]
+    """
+    module = importlib.import_module(runner.discover_days()[case.day])
+    raw_data = generators.generate_input(case.day, scale, seed)
+    parsed = module.parse_input(raw_data)
+    solver = implementations.REGISTRY[solver_name]
+
+    timings = {}
+    for name in solver:
+        with contextlib.ExitStack() as stack:
+            if name == implementations.REFERENCE:
+                stack.enter_context(using_references(solver_name))
+            in_use = implementations.using(solver_name, name)
+            function = stack.enter_context(in_use)
+            call = rebind(case.solver, solver.values(), function)
+            best = float("inf")
+            for _ in range(repeats):
+                arguments = case.make_args(
+                    copy.deepcopy(parsed) if case.mutates else parsed
+                )
+                start = time.perf_counter()
+                answer = call(*arguments)
+                best = min(best, time.perf_counter() - start)
+        timings[name] = (best, answer)
+
+    reference_seconds, reference_answer = timings[implementations.REFERENCE]
+    return [
+        Comparison(
+            solver_name,
+            name,
+            case.name,
+            scale,
+            seconds,
+            reference_seconds / seconds if seconds > 0 else float("inf"),
+            answers_agree(reference_answer, answer),
+        )
+        for name, (seconds, answer) in timings.items()
+    ]
+
+
+def run_differential(
+    solver_names: Optional[Sequence[str]] = None,
+    repeats: int = 3,
+    verbose: bool = False,
+) -> List[Comparison]:
+    """
+    Compare every implementation of the selected solvers at every scale of
+    their benchmark case
+
+    :param solver_names: solvers to compare, all of DIFFERENTIAL_CASES if
+        None
+    :type solver_names: Optional[Sequence[str]]
+
+    :param repeats: number of timed calls per implementation
+    :type repeats: int
+
+    :param verbose: print each comparison as it completes
+    :type verbose: bool
+
+    :return: comparisons ordered by solver, scale and implementation
+    :rtype: List[Comparison]
+    """
+    cases = {case.name: case for case in CASES}
+    comparisons = []
+    for solver_name in solver_names or list(DIFFERENTIAL_CASES):
+        if solver_name not in implementations.REGISTRY:
+            # optional implementations, e.g. the Numba ones without Numba
+            if verbose:
+                print(f"{solver_name:<36} skipped, not registered")
+            continue
+        case = cases[DIFFERENTIAL_CASES[solver_name]]
+        for scale in case.scales:
+            for comparison in compare(solver_name, case, scale, repeats):
+                comparisons.append(comparison)
+                if verbose:
+                    print(format_comparison(comparison), flush=True)
+    return comparisons
+
+
+def format_comparison(comparison: Comparison) -> str:
+    """
+    Render a comparison as one line
+
+    :param comparison: the comparison to render
+    :type comparison: Comparison
+
+    :return: rendered line
+    :rtype: str
+    """
+    status = "ok" if comparison.agrees else "MISMATCH"
+    return (
+        f"{comparison.solver:<36} x{comparison.scale:<6} "
+        f"{comparison.implementation:<12} {comparison.seconds:10.5f}s "
+        f"x{comparison.speedup:<8.2f} {status}"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None):  # pragma: no cover
+    """
+    Command line entry point, see ``python -m benchmarks.differential -h``
+
+    :param argv: command line arguments, ``sys.argv`` if None
+    :type argv: Optional[Sequence[str]]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.differential",
+        description="Check that every implementation of a solver gives the "
+        "answer of the reference one, and report their speedup.",
+    )
+    parser.add_argument(
+        "solvers", nargs="*", help="only compare these solvers, e.g. day8.x"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    comparisons = run_differential(args.solvers, args.repeats, verbose=True)
+    mismatches = [c for c in comparisons if not c.agrees]
+    for c in mismatches:
+        print(f"MISMATCH {c.solver} {c.implementation} x{c.scale}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,405 @@
+import copy
+import importlib
+import json
+import math
+import time
+import tracemalloc
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from benchmarks.cases import CASES, BenchmarkCase
+from src.aoc2022 import generators
+from src.aoc2022 import metrics as work_counters
+from src.aoc2022 import runner
+
+results_type = Dict[str, Dict[str, Dict[str, float]]]
+
+ABSOLUTE_SLACK = {"seconds": 0.001, "peak_memory": 64 * 1024}
+"""
+Increase allowed on top of the relative tolerance, so that timer noise on
+sub-millisecond calls and small allocations are not reported. Only these
+metrics are compared with the baseline, work counters are informative.
+"""
+
+
+class Measurement(NamedTuple):
+    """
+    Data class representing the cost of one solver at one input size
+
+    :param seconds: best wall time over the repeats, in seconds
+    :type seconds: float
+
+    :param peak_memory: peak memory allocated during one call, in bytes
+    :type peak_memory: int
+
+    :param counters: work counted by the metrics registry during one call
+    :type counters: Dict[str, int]
+    """
+
+    seconds: float
+    peak_memory: int
+    counters: Dict[str, int]
+
+
+class Regression(NamedTuple):
+    """
+    Data class representing a measurement worse than the baseline
+
+    :param case: name of the benchmark case
+    :type case: str
+
+    :param scale: input size of the measurement
+    :type scale: str
+
+    :param metric: ``seconds`` or ``peak_memory``
+    :type metric: str
+
+    :param baseline: value stored in the baseline
+    :type baseline: float
+
+    :param current: value measured in this run
+    :type current: float
+    """
+
+    case: str
+    scale: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def get_args_factory(
+    case: BenchmarkCase, scale: float, seed: int = 0
+) -> Callable[[], Tuple]:
+    """
+    Generate and parse an input, and get a function building fresh solver
+    arguments from it
+
+    :param case: the benchmark case
+    :type case: BenchmarkCase
+
+    :param scale: input size relative to the real puzzle input
+    :type scale: float
+
+    :param seed: seed for the input generator
+    :type seed: int
+
+    :return: function returning the arguments of one solver call
+    :rtype: Callable[[], Tuple]
+    """
+    module = importlib.import_module(runner.discover_days()[case.day])
+    raw_data = generators.generate_input(case.day, scale, seed)
+    parsed = module.parse_input(raw_data)
+
+    def make_args():
+        if case.mutates:
+            return case.make_args(copy.deepcopy(parsed))
+        return case.make_args(parsed)
+
+    return make_args
+
+
+def time_solver(
+    case: BenchmarkCase, make_args: Callable[[], Tuple], repeats: int
+) -> float:
+    """
+    Time the solver of a case, excluding the preparation of its arguments
+
+    :param case: the benchmark case
+    :type case: BenchmarkCase
+
+    :param make_args: function returning the arguments of one call
+    :type make_args: Callable[[], Tuple]
+
+    :param repeats: number of timed calls, the fastest one is kept
+    :type repeats: int
+
+    :return: best wall time over the repeats, in seconds
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        args = make_args()
+        start = time.perf_counter()
+        case.solver(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(
+    case: BenchmarkCase, scale: float, repeats: int = 3, seed: int = 0
+) -> Measurement:
+    """
+    Time a solver on a generated input and record its peak memory and work
+    counters. Parsing and argument preparation are excluded from all
+    measurements.
+
+    :param case: the benchmark case
+    :type case: BenchmarkCase
+
+    :param scale: input size relative to the real puzzle input
+    :type scale: float
+
+    :param repeats: number of timed calls, the fastest one is kept
+    :type repeats: int
+
+    :param seed: seed for the input generator
+    :type seed: int
+
+    :return: time, peak memory and work counters of the solver
+    :rtype: Measurement
+    """
+    make_args = get_args_factory(case, scale, seed)
+    best = time_solver(case, make_args, repeats)
+
+    args = make_args()
+    before = work_counters.snapshot()
+    tracemalloc.start()
+    try:
+        case.solver(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    counters = work_counters.difference(before, work_counters.snapshot())
+
+    return Measurement(best, peak_memory, counters)
+
+
+def measure_memory(day: int, part: int, scale: float, seed: int = 0) -> int:
+    """
+    Record the peak memory of parsing a generated input and solving one
+    part. The part is solved once beforehand, untraced, so that imports
+    done on first use are not counted.
+
+    :param day: day number
+    :type day: int
+
+    :param part: part number, 1 or 2
+    :type part: int
+
+    :param scale: input size relative to the real puzzle input
+    :type scale: float
+
+    :param seed: seed for the input generator
+    :type seed: int
+
+    :return: peak memory allocated while parsing and solving, in bytes
+    :rtype: int
+    """
+    module = importlib.import_module(runner.discover_days()[day])
+    solver = getattr(module, f"solve_part_{part}")
+    raw_data = generators.generate_input(day, scale, seed)
+    solver(module.parse_input(raw_data))
+
+    tracemalloc.start()
+    try:
+        solver(module.parse_input(raw_data))
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+
+def fit_exponent(sizes: Sequence[float], seconds: Sequence[float]) -> float:
+    """
+    Fit ``seconds = a * sizes ** k`` by least squares in log-log space.
+    Linear work gives k close to 1, n log n slightly more and quadratic
+    work close to 2.
+
+    :param sizes: input sizes, at least two distinct ones
+    :type sizes: Sequence[float]
+
+    :param seconds: time measured at each size
+    :type seconds: Sequence[float]
+
+    :return: the empirical growth exponent k
+    :rtype: float
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def measure_growth(
+    case: BenchmarkCase,
+    scales: Sequence[float],
+    repeats: int = 5,
+    seed: int = 0,
+) -> float:
+    """
+    Time a solver at several input sizes and fit its growth exponent
+
+    :param case: the benchmark case
+    :type case: BenchmarkCase
+
+    :param scales: input sizes, relative to the real puzzle input
+    :type scales: Sequence[float]
+
+    :param repeats: number of timed calls per size, the fastest is kept
+    :type repeats: int
+
+    :param seed: seed for the input generator
+    :type seed: int
+
+    :return: the empirical growth exponent of the solver
+    :rtype: float
+    """
+    seconds = [
+        time_solver(case, get_args_factory(case, scale, seed), repeats)
+        for scale in scales
+    ]
+    return fit_exponent(scales, seconds)
+
+
+def run_benchmarks(
+    cases: Iterable[BenchmarkCase] = CASES,
+    repeats: int = 3,
+    verbose: bool = False,
+) -> results_type:
+    """
+    Measure every case at every one of its scales
+
+    :param cases: the benchmark cases to run
+    :type cases: Iterable[BenchmarkCase]
+
+    :param repeats: number of timed calls per measurement
+    :type repeats: int
+
+    :param verbose: print each measurement as it completes
+    :type verbose: bool
+
+    :return: nested dict of case name, scale, metric name, value
+    :rtype: Dict[str, Dict[str, Dict[str, float]]]
+    """
+    results: results_type = {}
+    for case in cases:
+        results[case.name] = {}
+        for scale in case.scales:
+            seconds, peak_memory, counters = measure(case, scale, repeats)
+            results[case.name][str(scale)] = {
+                "seconds": seconds,
+                "peak_memory": peak_memory,
+                **counters,
+            }
+            if verbose:
+                print(
+                    f"{case.name:<48} x{scale:<6} {seconds:10.5f}s "
+                    f"{peak_memory / 1024:10.1f} KiB",
+                    flush=True,
+                )
+    return results
+
+
+def compare_to_baseline(
+    results: results_type, baseline: results_type, tolerance: float
+) -> List[Regression]:
+    """
+    Find the measurements that are worse than the baseline by more than the
+    tolerance plus ``ABSOLUTE_SLACK``. Measurements missing from the
+    baseline are ignored.
+
+    :param results: measurements of this run
+    :type results: Dict[str, Dict[str, Dict[str, float]]]
+
+    :param baseline: stored measurements
+    :type baseline: Dict[str, Dict[str, Dict[str, float]]]
+
+    :param tolerance: allowed relative increase, 0.25 allows 25% slower
+    :type tolerance: float
+
+    :return: the regressions found
+    :rtype: List[Regression]
+    """
+    regressions = []
+    for case_name, scales in results.items():
+        for scale, metrics in scales.items():
+            baseline_metrics = baseline.get(case_name, {}).get(scale)
+            if baseline_metrics is None:
+                continue
+            for metric, value in metrics.items():
+                if metric not in ABSOLUTE_SLACK:
+                    continue
+                baseline_value = baseline_metrics[metric]
+                limit = baseline_value * (1 + tolerance)
+                if value > limit + ABSOLUTE_SLACK[metric]:
+                    regression = Regression(
+                        case_name, scale, metric, baseline_value, value
+                    )
+                    regressions.append(regression)
+    return regressions
+
+
+def load_results(file_path: str) -> Optional[results_type]:
+    """
+    Load stored measurements
+
+    :param file_path: path of the JSON file
+    :type file_path: str
+
+    :return: the stored measurements, None if the file does not exist
+    :rtype: Optional[Dict[str, Dict[str, Dict[str, float]]]]
+    """
+    try:
+        with open(file_path, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def save_results(results: results_type, file_path: str):
+    """
+    Store measurements as JSON
+
+    :param results: measurements to store
+    :type results: Dict[str, Dict[str, Dict[str, float]]]
+
+    :param file_path: path of the JSON file
+    :type file_path: str
+    """
+    with open(file_path, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def format_scaling(results: results_type) -> str:
+    """
+    Render the scaling curve of every case, with the time ratio between
+    consecutive sizes and the work counters
+
+    :param results: measurements to render
+    :type results: Dict[str, Dict[str, Dict[str, float]]]
+
+    :return: rendered curves
+    :rtype: str
+    """
+    lines = []
+    for case_name, scales in results.items():
+        lines.append(case_name)
+        previous = None
+        for scale, metrics in scales.items():
+            seconds = metrics["seconds"]
+            ratio = "" if previous is None else f"x{seconds / previous:.2f}"
+            counters = "".join(
+                f" {name}={int(value)}"
+                for name, value in metrics.items()
+                if name not in ABSOLUTE_SLACK
+            )
+            lines.append(
+                f"    x{scale:<8} {seconds:10.5f}s "
+                f"{metrics['peak_memory'] / 1024:10.1f} KiB {ratio:>8}"
+                f"{counters}"
+            )
+            previous = seconds
+    return "\n".join(lines)
@@ -0,0 +1,332 @@
+import argparse
+import contextlib
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from benchmarks.harness import ABSOLUTE_SLACK, results_type
+
+HISTORY_PATH = os.path.join(os.path.dirname(__file__), "history.sqlite")
+"""
+Default location of the benchmark history, kept out of version control
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    git_commit TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    case_name TEXT NOT NULL,
+    scale TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, case_name, scale, metric)
+);
+"""
+
+
+class Point(NamedTuple):
+    """
+    Data class representing one measurement of a benchmark run
+
+    :param run_id: number of the run, increasing with time
+    :type run_id: int
+
+    :param commit: git commit the run measured
+    :type commit: str
+
+    :param value: value of the metric
+    :type value: float
+    """
+
+    run_id: int
+    commit: str
+    value: float
+
+
+class Slowdown(NamedTuple):
+    """
+    Data class representing a metric that got worse and stayed worse
+
+    :param case: name of the benchmark case
+    :type case: str
+
+    :param scale: input size of the measurement
+    :type scale: str
+
+    :param metric: ``seconds`` or ``peak_memory``
+    :type metric: str
+
+    :param commit: commit of the first run that was slower
+    :type commit: str
+
+    :param before: best value of the runs before that commit
+    :type before: float
+
+    :param after: value measured at that commit
+    :type after: float
+    """
+
+    case: str
+    scale: str
+    metric: str
+    commit: str
+    before: float
+    after: float
+
+
+series_type = Dict[str, Dict[str, Dict[str, List[Point]]]]
+
+
+@contextlib.contextmanager
+def connect(file_path: str) -> Iterator[sqlite3.Connection]:
+    """
+    Open the history database, creating its tables if needed, and commit
+    the changes made in the block
+
+    :param file_path: path of the SQLite file
+    :type file_path: str
+
+    :return: context manager giving the connection
+    :rtype: Iterator[sqlite3.Connection]
+    """
+    with contextlib.closing(sqlite3.connect(file_path)) as connection:
+        with connection:
+            connection.executescript(SCHEMA)
+            yield connection
+
+
+def get_commit() -> str:
+    """
+    Get the commit of the working tree, marked ``-dirty`` when it has
+    uncommitted changes
+
+    :return: abbreviated commit hash, ``unknown`` outside of a git checkout
+    :rtype: str
+    """
+    try:
+        completed = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip()
+
+
+def record(
+    results: results_type,
+    file_path: str = HISTORY_PATH,
+    commit: Optional[str] = None,
+) -> int:
+    """
+    Store the measurements of a benchmark run
+
+    :param results: measurements returned by harness.run_benchmarks
+    :type results: Dict[str, Dict[str, Dict[str, float]]]
+
+    :param file_path: path of the SQLite file
+    :type file_path: str
+
+    :param commit: commit measured, the current one if None
+    :type commit: Optional[str]
+
+    :return: number of the new run
+    :rtype: int
+    """
+    if commit is None:
+        commit = get_commit()
+    with connect(file_path) as connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (git_commit, recorded_at) VALUES (?, ?)",
+            (commit, time.time()),
+        )
+        run_id = cursor.lastrowid
+        assert run_id is not None
+        connection.executemany(
+            "INSERT INTO measurements VALUES (?, ?, ?, ?, ?)",
+            [
+                (run_id, case_name, scale, metric, value)
+                for case_name, scales in results.items()
+                for scale, metrics in scales.items()
+                for metric, value in metrics.items()
+            ],
+        )
+    return run_id
+
+
+def load_series(
+    file_path: str = HISTORY_PATH,
+    cases: Optional[Sequence[str]] = None,
+) -> series_type:
+    """
+    Load the history of the compared metrics, ``seconds`` and
+    ``peak_memory``, oldest run first
+
+    :param file_path: path of the SQLite file
+    :type file_path: str
+
+    :param cases: only load these cases or days, e.g. ``day1``, all if None
+    :type cases: Optional[Sequence[str]]
+
+    :return: nested dict of case name, scale, metric name, points
+    :rtype: Dict[str, Dict[str, Dict[str, List[Point]]]]
+    """
+    with connect(file_path) as connection:
+        rows = connection.execute(
+            "SELECT m.case_name, m.scale, m.metric, r.id, r.git_commit, "
+            "m.value FROM measurements AS m JOIN runs AS r "
+            "ON m.run_id = r.id ORDER BY m.case_name, "
+            "CAST(m.scale AS REAL), m.metric, r.id"
+        ).fetchall()
+
+    series: series_type = {}
+    for case_name, scale, metric, run_id, commit, value in rows:
+        day = case_name.split(".")[0]
+        selected = not cases or case_name in cases or day in cases
+        if metric not in ABSOLUTE_SLACK or not selected:
+            continue
+        metrics = series.setdefault(case_name, {}).setdefault(scale, {})
+        metrics.setdefault(metric, []).append(Point(run_id, commit, value))
+    return series
+
+
+def find_slowdown(
+    points: Sequence[Point], slack: float, tolerance: float
+) -> Optional[int]:
+    """
+    Find where a metric got worse for good: the first point from which
+    every point exceeds the best earlier one by more than the tolerance
+    plus the slack. A slow run followed by a fast one is noise and is not
+    reported.
+
+    :param points: measurements of the metric, oldest first
+    :type points: Sequence[Point]
+
+    :param slack: absolute increase always allowed
+    :type slack: float
+
+    :param tolerance: allowed relative increase, 0.25 allows 25% slower
+    :type tolerance: float
+
+    :return: index of the first slow point, None if the metric did not
+        get worse
+    :rtype: Optional[int]
+    """
+    values = [point.value for point in points]
+    first_slow = None
+    for index in range(len(values) - 1, 0, -1):
+        limit = min(values[:index]) * (1 + tolerance) + slack
+        if min(values[index:]) <= limit:
+            break
+        first_slow = index
+    return first_slow
+
+
+def find_slowdowns(series: series_type, tolerance: float) -> List[Slowdown]:
+    """
+    Find the metrics that got worse and the commit where it first showed
+
+    :param series: history returned by load_series
+    :type series: Dict[str, Dict[str, Dict[str, List[Point]]]]
+
+    :param tolerance: allowed relative increase, 0.25 allows 25% slower
+    :type tolerance: float
+
+    :return: the slowdowns found
+    :rtype: List[Slowdown]
+    """
+    slowdowns = []
+    for case_name, scales in series.items():
+        for scale, metrics in scales.items():
+            for metric, points in metrics.items():
+                slack = ABSOLUTE_SLACK[metric]
+                index = find_slowdown(points, slack, tolerance)
+                if index is None:
+                    continue
+                before = min(point.value for point in points[:index])
+                slowdown = Slowdown(
+                    case_name,
+                    scale,
+                    metric,
+                    points[index].commit,
+                    before,
+                    points[index].value,
+                )
+                slowdowns.append(slowdown)
+    return slowdowns
+
+
+def format_trends(series: series_type) -> str:
+    """
+    Render the trend of every case: for each size, the first, best and
+    latest time and memory, and the latest time relative to the first
+
+    :param series: history returned by load_series
+    :type series: Dict[str, Dict[str, Dict[str, List[Point]]]]
+
+    :return: rendered trends
+    :rtype: str
+    """
+    lines = []
+    for case_name, scales in series.items():
+        lines.append(case_name)
+        for scale, metrics in scales.items():
+            seconds = [point.value for point in metrics.get("seconds", [])]
+            memory = [point.value for point in metrics.get("peak_memory", [])]
+            if not seconds or not memory:
+                continue
+            lines.append(
+                f"    x{scale:<8} {len(seconds):>3} runs "
+                f"first {seconds[0]:10.5f}s best {min(seconds):10.5f}s "
+                f"last {seconds[-1]:10.5f}s x{seconds[-1] / seconds[0]:<6.2f}"
+                f"{memory[-1] / 1024:10.1f} KiB"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None):  # pragma: no cover
+    """
+    Command line entry point, see ``python -m benchmarks.history -h``
+
+    :param argv: command line arguments, ``sys.argv`` if None
+    :type argv: Optional[Sequence[str]]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.history",
+        description="Report the trend of every solver over the recorded "
+        "benchmark runs, see python -m benchmarks --record, and the commit "
+        "where each slowdown first appeared.",
+    )
+    parser.add_argument(
+        "cases", nargs="*", help="only report these cases or days, e.g. day1"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--history", default=HISTORY_PATH)
+    args = parser.parse_args(argv)
+
+    series = load_series(args.history, args.cases)
+    if not series:
+        print(f"No recorded runs in {args.history}")
+        sys.exit(1)
+    print(format_trends(series))
+
+    slowdowns = find_slowdowns(series, args.tolerance)
+    for s in slowdowns:
+        print(
+            f"SLOWDOWN {s.case} x{s.scale} {s.metric} since {s.commit}: "
+            f"{s.before:.6g} -> {s.after:.6g}"
+        )
+    sys.exit(1 if slowdowns else 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List, NamedTuple, Optional, Sequence
+
+from src.aoc2022 import runner
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_ROOT = os.path.dirname(BENCHMARKS_DIRECTORY)
+"""
+Directory the measured interpreters run from, so that ``src`` is importable
+"""
+
+HEAVY_MODULES = ("numpy",)
+"""
+Dependencies that must only be imported by the code that uses them
+"""
+
+LIGHT_DAYS = (1, 2, 3, 4, 5, 6)
+"""
+Days expected to start in tens of milliseconds
+"""
+
+
+class StartupMeasurement(NamedTuple):
+    """
+    Data class representing the startup cost of importing a module
+
+    :param module: fully qualified name of the imported module
+    :type module: str
+
+    :param import_time: cumulative import time reported by
+        ``python -X importtime``, in seconds
+    :type import_time: float
+
+    :param process_time: wall time of the whole interpreter run, in seconds
+    :type process_time: float
+
+    :param heavy_imports: heavy modules imported along with the module
+    :type heavy_imports: List[str]
+    """
+
+    module: str
+    import_time: float
+    process_time: float
+    heavy_imports: List[str]
+
+
+def parse_importtime(stderr: str, module: str) -> float:
+    """
+    Get the cumulative import time of a module from ``-X importtime`` output
+
+    :param stderr: standard error of the interpreter
+    :type stderr: str
+
+    :param module: fully qualified name of the module
+    :type module: str
+
+    :return: cumulative import time in seconds
+    :rtype: float
+    """
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+    raise ValueError(f"{module} not found in the importtime output")
+
+
+def measure_startup(module: str, repeats: int = 3) -> StartupMeasurement:
+    """
+    Import a module in fresh interpreters and keep the fastest run
+
+    :param module: fully qualified name of the module
+    :type module: str
+
+    :param repeats: number of interpreters started
+    :type repeats: int
+
+    :return: import and process times of the fastest run
+    :rtype: StartupMeasurement
+    """
+    heavy = ", ".join(repr(name) for name in HEAVY_MODULES)
+    code = (
+        f"import {module}, sys; "
+        f"print(*[m for m in ({heavy},) if m in sys.modules "
+        f"and not type(sys.modules[m]).__name__.startswith('_Lazy')])"
+    )
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=REPOSITORY_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        process_time = time.perf_counter() - start
+        measurement = StartupMeasurement(
+            module,
+            parse_importtime(completed.stderr, module),
+            process_time,
+            completed.stdout.split(),
+        )
+        if best is None or process_time < best.process_time:
+            best = measurement
+    assert best is not None
+    return best
+
+
+def main(argv: Optional[Sequence[str]] = None):  # pragma: no cover
+    """
+    Command line entry point, see ``python -m benchmarks.startup --help``
+
+    :param argv: command line arguments, ``sys.argv`` if None
+    :type argv: Optional[Sequence[str]]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Measure the import time of the runner and of every day "
+        "in fresh interpreters.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--limit",
+        type=float,
+        default=0.1,
+        help="maximum process time in seconds for days "
+        + ", ".join(str(day) for day in LIGHT_DAYS),
+    )
+    args = parser.parse_args(argv)
+
+    modules = [runner.__name__] + list(runner.discover_days().values())
+    light_modules = [runner.discover_days()[day] for day in LIGHT_DAYS]
+
+    failures = []
+    print(f"{'module':<28} {'import (ms)':>12} {'process (ms)':>13}  heavy")
+    for module in modules:
+        measurement = measure_startup(module, args.repeats)
+        print(
+            f"{module:<28} {measurement.import_time * 1e3:12.1f} "
+            f"{measurement.process_time * 1e3:13.1f}  "
+            f"{' '.join(measurement.heavy_imports)}"
+        )
+        if measurement.heavy_imports:
+            failures.append(f"{module} imports {measurement.heavy_imports}")
+        too_slow = measurement.process_time > args.limit
+        if module in light_modules and too_slow:
+            failures.append(f"{module} starts in more than {args.limit}s")
+
+    for failure in failures:
+        print(f"FAILURE {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
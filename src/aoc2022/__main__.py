@@ -0,0 +1,4 @@
+from src.aoc2022.runner import main
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import importlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from src.aoc2022 import runner, utils
+
+answers_type = Tuple[runner.answer_type, runner.answer_type]
+
+
+def solve_inputs(day: int, raw_data_list: List[str]) -> List[answers_type]:
+    """
+    Solve both parts of a day for many inputs in this process. Days
+    defining ``solve_batch`` solve all the inputs at once, the others parse
+    and solve every input in turn, once per part since some solvers modify
+    their parsed input.
+
+    :param day: day number
+    :type day: int
+
+    :param raw_data_list: raw text of every input
+    :type raw_data_list: List[str]
+
+    :return: answers to part 1 and part 2 of every input, in order
+    :rtype: List[Tuple[Union[int, str], Union[int, str]]]
+    """
+    module = importlib.import_module(runner.discover_days()[day])
+    if hasattr(module, "solve_batch"):
+        return module.solve_batch(raw_data_list)
+
+    answers = []
+    for raw_data in raw_data_list:
+        part_1 = module.solve_part_1(module.parse_input(raw_data))
+        part_2 = module.solve_part_2(module.parse_input(raw_data))
+        answers.append((part_1, part_2))
+    return answers
+
+
+def solve_files(day: int, data_paths: Sequence[str]) -> List[answers_type]:
+    """
+    Read and solve a chunk of inputs, the job run by each worker
+
+    :param day: day number
+    :type day: int
+
+    :param data_paths: paths of the puzzle inputs
+    :type data_paths: Sequence[str]
+
+    :return: answers to part 1 and part 2 of every input, in order
+    :rtype: List[Tuple[Union[int, str], Union[int, str]]]
+    """
+    raw_data_list = [utils.get_raw_data(path) for path in data_paths]
+    return solve_inputs(day, raw_data_list)
+
+
+def solve_batch(
+    day: int,
+    data_paths: Sequence[str],
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List[answers_type]:
+    """
+    Solve both parts of a day for many puzzle inputs, for instance one per
+    user. The inputs are split in chunks solved on a process pool, so every
+    worker imports the day and builds its lookup tables once.
+
+    :param day: day number
+    :type day: int
+
+    :param data_paths: paths of the puzzle inputs
+    :type data_paths: Sequence[str]
+
+    :param max_workers: number of worker processes, one per CPU if None, 0
+        to solve every input in this process
+    :type max_workers: Optional[int]
+
+    :param chunk_size: number of inputs per job, by default enough for 4
+        jobs per worker
+    :type chunk_size: Optional[int]
+
+    :return: answers to part 1 and part 2 of every input, in order
+    :rtype: List[Tuple[Union[int, str], Union[int, str]]]
+    """
+    if day not in runner.discover_days():
+        raise ValueError(f"Invalid day {day}")
+
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = max(1, math.ceil(len(data_paths) / (4 * workers)))
+    chunks = [
+        data_paths[start : start + chunk_size]  # noqa: E203
+        for start in range(0, len(data_paths), chunk_size)
+    ]
+
+    if max_workers == 0 or len(chunks) <= 1:
+        return solve_files(day, data_paths)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(solve_files, day, c) for c in chunks]
+        return [answers for f in futures for answers in f.result()]
+
+
+def main(argv: Optional[Sequence[str]] = None):  # pragma: no cover
+    """
+    Command line entry point, see ``python -m src.aoc2022.batch --help``
+
+    :param argv: command line arguments, ``sys.argv`` if None
+    :type argv: Optional[Sequence[str]]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.aoc2022.batch",
+        description="Solve one day for many puzzle inputs in one call.",
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument("paths", nargs="+", help="puzzle inputs")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    answers = solve_batch(args.day, args.paths, max_workers=args.workers)
+    results = [
+        {"path": path, "part_1": part_1, "part_2": part_2}
+        for path, (part_1, part_2) in zip(args.paths, answers)
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,114 @@
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+progress_type = Callable[[int, int], None]
+
+
+class Budget:
+    """
+    Cooperative time budget of a long running solver. The solver calls
+    ``tick`` once per iteration of its main loop, which reports progress
+    and tells it whether it may go on; when the deadline has passed the
+    solver stops and returns the best result found so far, and ``complete``
+    is False.
+
+    :param seconds: time allowed from the creation of the budget, no
+        deadline if None
+    :type seconds: Optional[float]
+
+    :param progress: called with the number of iterations done and the
+        total number of iterations
+    :type progress: Optional[Callable[[int, int], None]]
+
+    :param interval: minimum time between two progress reports, in seconds
+    :type interval: float
+
+    :param clock: monotonic clock, in seconds
+    :type clock: Callable[[], float]
+    """
+
+    def __init__(
+        self,
+        seconds: Optional[float] = None,
+        progress: Optional[progress_type] = None,
+        interval: float = 1.0,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        now = clock()
+        self.deadline = None if seconds is None else now + seconds
+        self.progress = progress
+        self.interval = interval
+        self.clock = clock
+        self.next_report = now
+        self.complete = True
+
+    def tick(self, done: int, total: int) -> bool:
+        """
+        Report progress if the last report is older than the interval, and
+        check the deadline
+
+        :param done: number of iterations done
+        :type done: int
+
+        :param total: total number of iterations
+        :type total: int
+
+        :return: whether the solver may run another iteration
+        :rtype: bool
+        """
+        now = self.clock()
+        if self.progress is not None and now >= self.next_report:
+            self.progress(done, total)
+            self.next_report = now + self.interval
+        if self.deadline is not None and now >= self.deadline:
+            self.complete = False
+        return self.complete
+
+
+class Budgeted(NamedTuple):
+    """
+    Data class representing the result of a solver run within a budget
+
+    :param answer: value returned by the solver, the best one found so far
+        if the budget ran out
+    :type answer: Any
+
+    :param complete: whether the solver finished before the deadline
+    :type complete: bool
+    """
+
+    answer: Any
+    complete: bool
+
+
+def run_within(
+    function: Callable,
+    *args: Any,
+    seconds: Optional[float] = None,
+    progress: Optional[progress_type] = None,
+    interval: float = 1.0,
+) -> Budgeted:
+    """
+    Call a solver taking a ``budget`` keyword argument with a new budget
+
+    :param function: solver accepting ``budget``
+    :type function: Callable
+
+    :param args: arguments of the solver
+    :type args: Any
+
+    :param seconds: time allowed, no deadline if None
+    :type seconds: Optional[float]
+
+    :param progress: called with the iterations done and their total
+    :type progress: Optional[Callable[[int, int], None]]
+
+    :param interval: minimum time between two progress reports, in seconds
+    :type interval: float
+
+    :return: the value returned by the solver and whether it is complete
+    :rtype: Budgeted
+    """
+    budget = Budget(seconds, progress, interval)
+    answer = function(*args, budget=budget)
+    return Budgeted(answer, budget.complete)
@@ -0,0 +1,525 @@
+import contextlib
+import hashlib
+import inspect
+import io
+import json
+import os
+import pickle
+import sqlite3
+import sys
+from types import CodeType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from src.aoc2022 import utils
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
+
+DEFAULT_CACHE_DIRECTORY = os.environ.get(
+    "AOC2022_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "aoc2022"),
+)
+"""
+Directory of the on-disk caches, overridden by ``AOC2022_CACHE_DIR``
+"""
+
+DEFAULT_SIZE_LIMIT = 256 * 1024 * 1024
+"""
+Size in bytes above which the least recently used entries are evicted
+"""
+
+CONSTANT_TYPES = (bool, int, float, str, bytes, tuple, list, dict)
+"""
+Types of the module level values whose repr is part of the code hash
+"""
+
+FILE_EXTENSIONS = (".npy", ".npz", ".pkl")
+"""
+Extensions of the files storing a parsed input
+"""
+
+PACKAGE = __name__.rsplit(".", 1)[0]
+"""
+Package whose modules are followed by the code hash, ``src.aoc2022``
+"""
+
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Hash the bytes of a file without loading it in full
+
+    :param file_path: path of the file
+    :type file_path: str
+
+    :param chunk_size: number of bytes read at a time
+    :type chunk_size: int
+
+    :return: hex digest of the SHA-256 of the file
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_referenced_names(code: CodeType) -> Iterator[str]:
+    """
+    Iterate over the global names used by a code object, including the
+    ones used by nested functions, lambdas and comprehensions
+
+    :param code: code object of a function
+    :type code: CodeType
+
+    :return: iterator of names, possibly repeated
+    :rtype: Iterator[str]
+    """
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from iter_referenced_names(const)
+
+
+def get_project_modules() -> Dict[int, ModuleType]:
+    """
+    Get the imported modules of the package, by id, so that lazily imported
+    modules such as NumPy can be told apart without being loaded
+
+    :return: id of every imported ``src.aoc2022`` module, to the module
+    :rtype: Dict[int, ModuleType]
+    """
+    return {
+        id(module): module
+        for name, module in list(sys.modules.items())
+        if name == PACKAGE or name.startswith(PACKAGE + ".")
+    }
+
+
+def get_code_hash(*functions: Callable) -> str:
+    """
+    Hash the source of functions together with the source of every
+    function and class they use, directly or not, and the repr of the
+    module level constants they read. Uses are followed into the other
+    modules of the package, whether imported as modules, as in
+    ``graphs.bfs``, or by name. Editing any of this code changes the hash,
+    editing unrelated code does not.
+
+    :param functions: functions defined at the top level of a module
+    :type functions: Callable
+
+    :return: hex digest of the SHA-256 of the collected sources
+    :rtype: str
+    """
+    project_modules = get_project_modules()
+    pending: List[Any] = list(reversed(functions))
+    seen: Set[str] = set()
+    sources = []
+
+    while pending:
+        obj = pending.pop()
+        key = f"{obj.__module__}.{obj.__qualname__}"
+        if key in seen:
+            continue
+        seen.add(key)
+        sources.append(inspect.getsource(obj))
+
+        if inspect.isclass(obj):
+            members = vars(obj).values()
+            codes = [m.__code__ for m in members if inspect.isfunction(m)]
+        else:
+            # decorators such as jit.kernel wrap the code that runs
+            codes = [inspect.unwrap(obj).__code__]
+
+        module = sys.modules[obj.__module__]
+        for code in codes:
+            names = list(dict.fromkeys(iter_referenced_names(code)))
+            namespaces = [module]
+            for name in names:
+                value = vars(module).get(name)
+                if id(value) in project_modules:
+                    namespaces.append(project_modules[id(value)])
+
+            # attributes of the modules used, e.g. bfs in graphs.bfs, are
+            # among the names of the code too
+            for namespace in namespaces:
+                for name in names:
+                    value = vars(namespace).get(name)
+                    if inspect.isfunction(value) or inspect.isclass(value):
+                        defined_in = sys.modules.get(value.__module__)
+                        is_local = defined_in is module
+                        if is_local or id(defined_in) in project_modules:
+                            pending.append(value)
+                    elif isinstance(value, CONSTANT_TYPES):
+                        constant = f"{namespace.__name__}.{name}"
+                        if constant not in seen:
+                            seen.add(constant)
+                            sources.append(f"{constant} = {value!r}")
+
+    return hashlib.sha256("\n".join(sources).encode()).hexdigest()
+
+
+def is_array(value: Any) -> bool:
+    """
+    Check whether a value is a NumPy array, without importing NumPy
+
+    :param value: value to check
+    :type value: Any
+
+    :return: whether the value is an ndarray
+    :rtype: bool
+    """
+    value_type = type(value)
+    is_numpy = value_type.__module__ == "numpy"
+    return is_numpy and value_type.__name__ == "ndarray"
+
+
+def dump_parsed(parsed: Any) -> Tuple[str, bytes]:
+    """
+    Serialize a parsed input. NumPy arrays are stored as ``.npy``, tuples
+    holding arrays as ``.npz`` with their other items pickled, everything
+    else is pickled.
+
+    :param parsed: structure returned by a ``parse_input``
+    :type parsed: Any
+
+    :raises pickle.PicklingError: if the structure cannot be pickled, for
+        instance because it holds lambdas
+
+    :return: file extension, serialized bytes
+    :rtype: Tuple[str, bytes]
+    """
+    buffer = io.BytesIO()
+    if is_array(parsed):
+        np.save(buffer, parsed, allow_pickle=False)
+        return ".npy", buffer.getvalue()
+
+    if isinstance(parsed, tuple) and any(is_array(item) for item in parsed):
+        items: Dict[str, Any] = {}
+        for idx, item in enumerate(parsed):
+            if is_array(item):
+                items[f"array_{idx}"] = item
+            else:
+                pickled = dump_pickle(item)
+                items[f"pickle_{idx}"] = np.frombuffer(pickled, np.uint8)
+        np.savez(buffer, **items)
+        return ".npz", buffer.getvalue()
+
+    return ".pkl", dump_pickle(parsed)
+
+
+def dump_pickle(value: Any) -> bytes:
+    """
+    Pickle a value, reporting every failure as a PicklingError
+
+    :param value: value to pickle
+    :type value: Any
+
+    :raises pickle.PicklingError: if the value cannot be pickled
+
+    :return: pickled bytes
+    :rtype: bytes
+    """
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (AttributeError, TypeError) as e:
+        raise pickle.PicklingError(str(e)) from e
+
+
+def load_parsed(file_path: str) -> Any:
+    """
+    Deserialize a parsed input stored by ``dump_parsed``
+
+    :param file_path: path of the stored file
+    :type file_path: str
+
+    :return: the parsed input
+    :rtype: Any
+    """
+    if file_path.endswith(".npy"):
+        return np.load(file_path, allow_pickle=False)
+
+    if file_path.endswith(".npz"):
+        with np.load(file_path, allow_pickle=False) as archive:
+            items = {}
+            for name in archive.files:
+                kind, idx = name.split("_")
+                if kind == "array":
+                    items[int(idx)] = archive[name]
+                else:
+                    items[int(idx)] = pickle.loads(archive[name].tobytes())
+        return tuple(items[idx] for idx in range(len(items)))
+
+    with open(file_path, "rb") as file:
+        return pickle.load(file)
+
+
+class ParseCache:
+    """
+    On-disk cache of the output of the ``parse_input`` of each day. Entries
+    are keyed on the hash of the input bytes and on the code hash of the
+    parser, and the least recently used ones are evicted once the cache
+    grows past its size limit.
+
+    :param directory: directory holding the cached files
+    :type directory: str
+
+    :param size_limit: maximum total size of the cached files, in bytes
+    :type size_limit: int
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIRECTORY,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+    ):
+        self.directory = os.path.join(directory, "parsed")
+        self.size_limit = size_limit
+
+    def get_key(self, module: ModuleType, input_hash: str) -> str:
+        """
+        Build the cache key of a parsed input
+
+        :param module: day module providing ``parse_input``
+        :type module: ModuleType
+
+        :param input_hash: hash of the input bytes
+        :type input_hash: str
+
+        :return: key, also used as file name stem
+        :rtype: str
+        """
+        day_name = module.__name__.rsplit(".", 1)[-1]
+        parser_hash = get_code_hash(module.parse_input)
+        return f"{day_name}-{input_hash[:24]}-{parser_hash[:16]}"
+
+    def load(self, key: str) -> Any:
+        """
+        Load a cached parsed input, marking it as recently used
+
+        :param key: key returned by ``get_key``
+        :type key: str
+
+        :raises KeyError: if the key is not in the cache
+
+        :return: the parsed input
+        :rtype: Any
+        """
+        for extension in FILE_EXTENSIONS:
+            file_path = os.path.join(self.directory, key + extension)
+            try:
+                parsed = load_parsed(file_path)
+                os.utime(file_path)
+            except FileNotFoundError:  # missing, or evicted by another run
+                continue
+            return parsed
+        raise KeyError(key)
+
+    def store(self, key: str, parsed: Any) -> bool:
+        """
+        Store a parsed input, then evict old entries if needed. Structures
+        that cannot be pickled are not stored.
+
+        :param key: key returned by ``get_key``
+        :type key: str
+
+        :param parsed: structure returned by ``parse_input``
+        :type parsed: Any
+
+        :return: whether the structure was stored
+        :rtype: bool
+        """
+        try:
+            extension, data = dump_parsed(parsed)
+        except (pickle.PicklingError, ValueError):  # lambdas, object arrays
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        file_path = os.path.join(self.directory, key + extension)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, file_path)  # atomic for concurrent runs
+
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Delete the least recently used entries until the cache fits within
+        its size limit
+        """
+        try:
+            file_names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+
+        entries = []
+        for file_name in file_names:
+            if not file_name.endswith(FILE_EXTENSIONS):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, file_name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file_name))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_name in sorted(entries):
+            if total_size <= self.size_limit:
+                break
+            try:
+                os.remove(os.path.join(self.directory, file_name))
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def parse(
+        self,
+        module: ModuleType,
+        file_path: str,
+        input_hash: Optional[str] = None,
+    ) -> Any:
+        """
+        Parse an input file with the ``parse_input`` of a day, loading the
+        result from the cache when the input and the parser are unchanged
+
+        :param module: day module providing ``parse_input``
+        :type module: ModuleType
+
+        :param file_path: path of the puzzle input
+        :type file_path: str
+
+        :param input_hash: hash of the input bytes, computed if None
+        :type input_hash: Optional[str]
+
+        :return: the parsed input
+        :rtype: Any
+        """
+        if input_hash is None:
+            input_hash = hash_file(file_path)
+        key = self.get_key(module, input_hash)
+        try:
+            return self.load(key)
+        except KeyError:
+            pass
+
+        parsed = module.parse_input(utils.get_raw_data(file_path))
+        self.store(key, parsed)
+        return parsed
+
+
+class AnswerCache:
+    """
+    SQLite store of the answers of each part, keyed on the day, the part,
+    the hash of the input bytes and the code hash of the solver. Editing a
+    solver only invalidates the answers of the parts that use the edited
+    code.
+
+    :param directory: directory holding the database
+    :type directory: str
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIRECTORY):
+        os.makedirs(directory, exist_ok=True)
+        self.file_path = os.path.join(directory, "answers.sqlite")
+        with self.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "day INTEGER, part INTEGER, input_hash TEXT, code_hash TEXT, "
+                "answer TEXT, "
+                "PRIMARY KEY (day, part, input_hash, code_hash))"
+            )
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection, waiting for the writes of concurrent runs, commit
+        the changes made in the block and close it
+
+        :return: context manager giving the connection
+        :rtype: Iterator[sqlite3.Connection]
+        """
+        connection = sqlite3.connect(self.file_path, timeout=30)
+        with contextlib.closing(connection):
+            with connection:
+                yield connection
+
+    def load(
+        self, day: int, part: int, input_hash: str, code_hash: str
+    ) -> Union[int, str]:
+        """
+        Load a stored answer
+
+        :param day: day number
+        :type day: int
+
+        :param part: part number, 1 or 2
+        :type part: int
+
+        :param input_hash: hash of the input bytes
+        :type input_hash: str
+
+        :param code_hash: code hash of the solver
+        :type code_hash: str
+
+        :raises KeyError: if no answer is stored for this key
+
+        :return: the stored answer
+        :rtype: Union[int, str]
+        """
+        key = (day, part, input_hash, code_hash)
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT answer FROM answers WHERE day = ? AND part = ? "
+                "AND input_hash = ? AND code_hash = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def store(
+        self,
+        day: int,
+        part: int,
+        input_hash: str,
+        code_hash: str,
+        answer: Union[int, str],
+    ):
+        """
+        Store an answer, replacing any answer stored for the same key
+
+        :param day: day number
+        :type day: int
+
+        :param part: part number, 1 or 2
+        :type part: int
+
+        :param input_hash: hash of the input bytes
+        :type input_hash: str
+
+        :param code_hash: code hash of the solver
+        :type code_hash: str
+
+        :param answer: answer returned by the solver
+        :type answer: Union[int, str]
+        """
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                (day, part, input_hash, code_hash, json.dumps(answer)),
+            )
@@ -1,23 +1,107 @@
-from typing import List, Tuple
+from __future__ import annotations
 
-from src.aoc2022.utils import get_raw_data
+import heapq
+import itertools
+import math
+import mmap
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from src.aoc2022 import implementations
+from src.aoc2022.utils import (
+    blocks_type,
+    buffer_type,
+    get_raw_data,
+    lazy_import,
+    map_raw_data,
+    split_blocks,
+)
 
-def parse_data_to_array(raw_data: str) -> List[List[int]]:
+if TYPE_CHECKING:
+    import json
+    from concurrent import futures
+
+    import numpy as np
+else:
+    futures = lazy_import("concurrent.futures")
+    json = lazy_import("json")
+    np = lazy_import("numpy")
+
+MAX_DIGITS = 18
+"""
+Most digits of a value parsed by parse_data_to_groups, the largest power
+of ten held by an int64
+"""
+
+
+class Groups(NamedTuple):
+    """
+    Data class representing groups of integers in two flat arrays, group i
+    being ``values[offsets[i]:offsets[i + 1]]``
+
+    :param values: every value, group after group
+    :type values: np.ndarray
+
+    :param offsets: start of every group in values, plus the number of
+        values
+    :type offsets: np.ndarray
+    """
+
+    values: np.ndarray
+    offsets: np.ndarray
+
+
+groups_type = Union[List[List[int]], Groups]
+
+CHUNK_BYTES = 64 * 1024 * 1024
+"""
+Size of the byte ranges reduced by each job of the parallel solver, which
+bounds the memory of a worker
+"""
+
+
+class ChunkTop(NamedTuple):
+    """
+    Data class representing the reduction of a byte range of the input
+
+    :param num_groups: number of groups in the range
+    :type num_groups: int
+
+    :param top: index in the range and sum of its k largest groups,
+        without the missing groups
+    :type top: List[Tuple[int, int]]
+    """
+
+    num_groups: int
+    top: List[Tuple[int, int]]
+
+
+def parse_data_to_array(raw_data: blocks_type) -> List[List[int]]:
     """
     Parses the raw text input into lists of numerical values,
     with one list per grouping of lines
 
-    :param raw_data: Raw text data to be parsed
-    :type raw_data: str
+    :param raw_data: Raw text data to be parsed, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
 
     :return: Parsed integer values
     :rtype: List[List[int]]
     """
-    raw_data = raw_data.replace(" ", "").strip()
-    line_groups = [group for group in raw_data.split("\n\n") if len(group) > 0]
+    if isinstance(raw_data, str):
+        raw_data = raw_data.replace(" ", "")
 
-    parsed_data = [[int(e) for e in g.split("\n")] for g in line_groups]
+    parsed_data = [[int(e) for e in g] for g in split_blocks(raw_data)]
 
     return parsed_data
 
@@ -43,6 +127,55 @@ def get_largest_group_sum(groups: List[List[int]]) -> Tuple[int, int]:
     return max_idx, max_value
 
 
+def get_k_largest_group_sum(
+    groups: List[List[int]],
+    k: int,
+) -> List[Tuple[int, int]]:
+    """Finds the k groups with the largest sums in O(n log k), keeping the k
+    best groups seen so far in a min-heap whose root is the one to drop
+    next. Ties go to the earliest group, and when there are fewer than k
+    groups the missing ones are reported as (0, -1).
+
+    :param groups: A list of groups, where each group is a list of integers
+    :type groups: List[List[int]]
+
+    :param k: number of groups to find
+    :type k: int
+
+    :return: Index of the k groups with the largest sums + corresponding
+        sums, smallest sum first
+    :rtype: List[Tuple[int, int]]
+    """
+    return select_k_largest(map(sum, groups), k)
+
+
+def select_k_largest(sums: Iterable[int], k: int) -> List[Tuple[int, int]]:
+    """Selects the k largest sums of a stream with a min-heap of size k
+
+    :param sums: sum of every group, in group order
+    :type sums: Iterable[int]
+
+    :param k: number of sums selected
+    :type k: int
+
+    :return: Index and sum of the k largest groups, smallest first
+    :rtype: List[Tuple[int, int]]
+    """
+    if k <= 0:
+        return []
+
+    # (sum, -index) orders ties so that later groups are dropped first
+    heap: List[Tuple[int, int]] = []
+    for idx, sum_ in enumerate(sums):
+        if len(heap) < k:
+            heapq.heappush(heap, (sum_, -idx))
+        elif sum_ > heap[0][0]:
+            heapq.heapreplace(heap, (sum_, -idx))
+
+    missing = [(0, -1)] * (k - len(heap))
+    return missing + [(-neg_idx, sum_) for sum_, neg_idx in sorted(heap)]
+
+
 def get_3_largest_group_sum(groups: List[List[int]]) -> List[Tuple[int, int]]:
     """Finds the 3 top group with the largests sums
 
@@ -52,40 +185,882 @@ def get_3_largest_group_sum(groups: List[List[int]]) -> List[Tuple[int, int]]:
     :return: Index of the 3 groups with the largests sums + corresponding sums
     :rtype: List[Tuple[int, int]]
     """
+    return get_k_largest_group_sum(groups, 3)
 
-    top_val = -1  # smallest since all integers are guaranteed positive
-    top_idx = 0
 
-    mid_val = -1  # smallest since all integers are guaranteed positive
-    mid_idx = 0
+def iter_group_sums(lines: Iterable[str]) -> Iterator[int]:
+    """Sums the groups of a stream of lines one line at a time, holding
+    only the sum of the current group
 
-    bot_val = -1  # smallest since all integers are guaranteed positive
-    bot_idx = 0
+    :param lines: lines of the input, e.g. an open file or utils.iter_lines
+    :type lines: Iterable[str]
 
-    for idx, group in enumerate(groups):
-        sum_ = sum(group)
-        if sum_ <= bot_val:
-            pass
-        elif (sum_ > bot_val) and (sum_ <= mid_val):
-            bot_val = sum_
-            bot_idx = idx
-        elif (sum_ > mid_val) and (sum_ <= top_val):
-            bot_val = mid_val
-            bot_idx = mid_idx
-
-            mid_val = sum_
-            mid_idx = idx
+    :return: iterator of the sum of every group
+    :rtype: Iterator[int]
+    """
+    sum_ = 0
+    in_group = False
+    for line in lines:
+        line = line.strip()
+        if line:
+            sum_ += int(line)
+            in_group = True
+        elif in_group:
+            yield sum_
+            sum_ = 0
+            in_group = False
+    if in_group:
+        yield sum_
+
+
+def stream_k_largest_group_sum(
+    lines: Iterable[str],
+    k: int,
+) -> List[Tuple[int, int]]:
+    """Finds the k groups with the largest sums in a single pass over the
+    lines, in O(k) memory however long the input is
+
+    :param lines: lines of the input, e.g. an open file or utils.iter_lines
+    :type lines: Iterable[str]
+
+    :param k: number of groups to find
+    :type k: int
+
+    :return: Index of the k groups with the largest sums + corresponding
+        sums, smallest sum first
+    :rtype: List[Tuple[int, int]]
+    """
+    return select_k_largest(iter_group_sums(lines), k)
+
+
+def solve_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Computes the answers to both parts in a single pass over the lines,
+    without parsing the whole input
+
+    :param lines: lines of the input, e.g. an open file or utils.iter_lines
+    :type lines: Iterable[str]
+
+    :return: Sum of the largest group and of the 3 largest groups
+    :rtype: Tuple[int, int]
+    """
+    top_3 = stream_k_largest_group_sum(lines, 3)
+    return top_3[-1][1], sum(t[1] for t in top_3)
+
+
+def parse_data_to_groups(
+    raw_data: Union[str, buffer_type, blocks_type],
+) -> Groups:
+    """
+    Parses the raw input into flat arrays without building a list per
+    group. Text and bytes are parsed with array operations only: the digits
+    of every line are weighted by powers of ten and summed per line, and a
+    group ends wherever lines without digits separate two values.
+
+    :param raw_data: Raw text, bytes returned by map_raw_data, or blocks of
+        lines
+    :type raw_data: Union[str, bytes, mmap.mmap, Iterable[List[str]]]
+
+    :return: values and group offsets
+    :rtype: Groups
+    """
+    if isinstance(raw_data, str):
+        raw_data = raw_data.encode()
+    if not isinstance(raw_data, (bytes, mmap.mmap)):
+        blocks = [[int(line) for line in block] for block in raw_data]
+        return to_groups(blocks)
+
+    data = np.frombuffer(raw_data, dtype=np.uint8)
+    digit_positions = np.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+    if digit_positions.size == 0:
+        return Groups(np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64))
+
+    # line of every digit, as the number of newlines before it
+    line_type = np.int32 if data.size < 2**31 else np.int64
+    line_starts = np.cumsum(data == ord("\n"), dtype=line_type)
+    lines = line_starts[digit_positions]
+    is_first = np.empty(lines.size, dtype=bool)
+    is_first[0] = True
+    is_first[1:] = lines[1:] != lines[:-1]
+    firsts = np.flatnonzero(is_first)
+    lasts = np.append(firsts[1:], lines.size) - 1
+
+    # each digit weighs ten to the number of digits after it in its line
+    exponents = np.repeat(lasts, np.diff(np.append(firsts, lines.size)))
+    exponents -= np.arange(lines.size)
+    powers = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+    digits = data[digit_positions].astype(np.int64) - ord("0")
+    values = np.add.reduceat(digits * powers[exponents], firsts)
+
+    # values on consecutive lines are in the same group
+    value_lines = lines[firsts]
+    is_group_start = np.empty(values.size, dtype=bool)
+    is_group_start[0] = True
+    is_group_start[1:] = np.diff(value_lines) > 1
+    offsets = np.append(np.flatnonzero(is_group_start), values.size)
+    return Groups(values, offsets.astype(np.int64))
+
+
+def to_groups(groups: groups_type) -> Groups:
+    """
+    Converts lists of integers to flat arrays
+
+    :param groups: A list of groups, or groups already converted
+    :type groups: Union[List[List[int]], Groups]
+
+    :return: values and group offsets
+    :rtype: Groups
+    """
+    if isinstance(groups, Groups):
+        return groups
+    lengths = np.fromiter(map(len, groups), dtype=np.int64, count=len(groups))
+    offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.fromiter(
+        itertools.chain.from_iterable(groups),
+        dtype=np.int64,
+        count=int(offsets[-1]),
+    )
+    return Groups(values, offsets)
+
+
+def get_group_sums(groups: Groups) -> np.ndarray:
+    """
+    Sums every group with one segmented reduction
+
+    :param groups: values and group offsets
+    :type groups: Groups
+
+    :return: sum of every group, 0 for empty groups
+    :rtype: np.ndarray
+    """
+    values, offsets = groups
+    starts = offsets[:-1]
+    sums = np.zeros(starts.size, dtype=np.int64)
+    # reduceat sums from each start to the next one, so empty groups, which
+    # hold no values, are left out
+    not_empty = starts < offsets[1:]
+    if np.any(not_empty):
+        sums[not_empty] = np.add.reduceat(values, starts[not_empty])
+    return sums
+
+
+def select_top_k(sums: np.ndarray, k: int) -> List[Tuple[int, int]]:
+    """
+    Selects the k largest sums in linear time with a partition, then sorts
+    only those. Like the loop based solvers, the earliest group wins ties
+    and missing groups are reported as (0, -1).
+
+    :param sums: sum of every group
+    :type sums: np.ndarray
+
+    :param k: number of sums selected
+    :type k: int
+
+    :return: Index and sum of the k largest groups, smallest first
+    :rtype: List[Tuple[int, int]]
+    """
+    count = min(k, sums.size)
+    if count <= 0:
+        chosen = np.zeros(0, dtype=np.int64)
+    elif count < sums.size:
+        kth = np.argpartition(sums, sums.size - count)[sums.size - count]
+        threshold = sums[kth]
+        above = np.flatnonzero(sums > threshold)
+        ties = np.flatnonzero(sums == threshold)[: count - above.size]
+        chosen = np.concatenate((above, ties))
+    else:
+        chosen = np.arange(sums.size)
+
+    # largest sum first, then earliest index
+    chosen = chosen[np.lexsort((chosen, -sums[chosen]))][::-1]
+    missing = [(0, -1)] * (k - count)
+    return missing + list(zip(chosen.tolist(), sums[chosen].tolist()))
+
+
+@implementations.implements(get_largest_group_sum, "vectorized")
+def get_largest_group_sum_vectorized(groups: groups_type) -> Tuple[int, int]:
+    """Finds the group with the largest sum, with array operations
+
+    :param groups: A list of groups, or groups returned by
+        parse_data_to_groups
+    :type groups: Union[List[List[int]], Groups]
+
+    :return: Index of the group with the largest sum and corresponding sum
+    :rtype: Tuple[int, int]
+    """
+    return select_top_k(get_group_sums(to_groups(groups)), 1)[0]
+
+
+@implementations.implements(get_3_largest_group_sum, "vectorized")
+def get_3_largest_group_sum_vectorized(
+    groups: groups_type,
+) -> List[Tuple[int, int]]:
+    """Finds the 3 groups with the largest sums, with array operations
+
+    :param groups: A list of groups, or groups returned by
+        parse_data_to_groups
+    :type groups: Union[List[List[int]], Groups]
+
+    :return: Index of the 3 groups with the largests sums + corresponding sums
+    :rtype: List[Tuple[int, int]]
+    """
+    return select_top_k(get_group_sums(to_groups(groups)), 3)
+
+
+@implementations.implements(get_k_largest_group_sum, "vectorized")
+def get_k_largest_group_sum_vectorized(
+    groups: groups_type, k: int
+) -> List[Tuple[int, int]]:
+    """Finds the k groups with the largest sums, with array operations
+
+    :param groups: A list of groups, or groups returned by
+        parse_data_to_groups
+    :type groups: Union[List[List[int]], Groups]
+
+    :param k: number of groups to find
+    :type k: int
+
+    :return: Index of the k groups with the largest sums + corresponding
+        sums, smallest sum first
+    :rtype: List[Tuple[int, int]]
+    """
+    return select_top_k(get_group_sums(to_groups(groups)), k)
+
+
+def find_group_boundary(buffer: buffer_type, position: int) -> int:
+    """
+    Finds the first blank line starting after a position, where the input
+    can be cut without splitting a group
+
+    :param buffer: bytes of the input
+    :type buffer: Union[bytes, mmap.mmap]
+
+    :param position: offset from which to search
+    :type position: int
+
+    :return: offset of the start of the blank line, or the size of the
+        input if there is none
+    :rtype: int
+    """
+    if position <= 0:
+        return 0
+    size = len(buffer)
+    line_end = buffer.find(b"\n", position)
+    while line_end != -1:
+        line_start = line_end + 1
+        line_end = buffer.find(b"\n", line_start)
+        line_stop = size if line_end == -1 else line_end
+        line = buffer[line_start:line_stop]
+        if line.strip() == b"":
+            return line_start
+    return size
+
+
+def split_into_chunks(
+    buffer: buffer_type,
+    chunk_bytes: int,
+) -> List[Tuple[int, int]]:
+    """
+    Splits the input into byte ranges of about chunk_bytes, cut at blank
+    lines so that every group lies in a single range
+
+    :param buffer: bytes of the input
+    :type buffer: Union[bytes, mmap.mmap]
+
+    :param chunk_bytes: target size of a range
+    :type chunk_bytes: int
+
+    :return: start and end offset of every range, in order
+    :rtype: List[Tuple[int, int]]
+    """
+    size = len(buffer)
+    num_chunks = max(1, math.ceil(size / chunk_bytes))
+    bounds = [0]
+    for i in range(1, num_chunks):
+        target = max(bounds[-1], i * size // num_chunks)
+        boundary = find_group_boundary(buffer, target)
+        if boundary > bounds[-1]:
+            bounds.append(boundary)
+    if bounds[-1] < size or size == 0:
+        bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def reduce_chunk(file_path: str, start: int, end: int, k: int) -> ChunkTop:
+    """
+    Reduces a byte range of the input to its number of groups and its k
+    largest groups, the job run by each worker
+
+    :param file_path: path of the input
+    :type file_path: str
+
+    :param start: offset of the first byte of the range
+    :type start: int
+
+    :param end: offset after the last byte of the range
+    :type end: int
+
+    :param k: number of groups kept
+    :type k: int
+
+    :return: number of groups and top k of the range
+    :rtype: ChunkTop
+    """
+    with map_raw_data(file_path) as buffer:
+        sums = get_group_sums(parse_data_to_groups(buffer[start:end]))
+    return ChunkTop(sums.size, select_top_k(sums, min(k, sums.size)))
+
+
+def merge_chunk_tops(
+    chunk_tops: Iterable[ChunkTop],
+    k: int,
+) -> List[Tuple[int, int]]:
+    """
+    Merges the top k of consecutive ranges into the top k of the input,
+    shifting the indices of every range by the groups of the ranges before
+
+    :param chunk_tops: reductions of the ranges, in input order
+    :type chunk_tops: Iterable[ChunkTop]
+
+    :param k: number of groups to find
+    :type k: int
+
+    :return: Index of the k groups with the largest sums + corresponding
+        sums, smallest sum first
+    :rtype: List[Tuple[int, int]]
+    """
+    if k <= 0:
+        return []
+    candidates: List[Tuple[int, int]] = []
+    offset = 0
+    for num_groups, top in chunk_tops:
+        candidates.extend((sum_, -(offset + idx)) for idx, sum_ in top)
+        offset += num_groups
+    # largest sums first, and the earliest group first among equal sums
+    best = sorted(candidates, reverse=True)[:k]
+    missing = [(0, -1)] * (k - len(best))
+    return missing + [(-neg_idx, sum_) for sum_, neg_idx in reversed(best)]
+
+
+def get_k_largest_group_sum_parallel(
+    file_path: str,
+    k: int,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> List[Tuple[int, int]]:
+    """
+    Finds the k groups with the largest sums of an input file on a process
+    pool. The file is cut at blank lines into byte ranges, each worker maps
+    the file and reduces its ranges with the array engine, and the results
+    are merged with the group indices of the whole file.
+
+    :param file_path: path of the input
+    :type file_path: str
+
+    :param k: number of groups to find
+    :type k: int
+
+    :param max_workers: number of worker processes, one per CPU if None, 0
+        to reduce every range in this process
+    :type max_workers: Optional[int]
+
+    :param chunk_bytes: target size of a range, see CHUNK_BYTES
+    :type chunk_bytes: int
+
+    :return: Index of the k groups with the largest sums + corresponding
+        sums, smallest sum first
+    :rtype: List[Tuple[int, int]]
+    """
+    with map_raw_data(file_path) as buffer:
+        # ranges no larger than needed to give every worker some work
+        workers = max_workers or os.cpu_count() or 1
+        size = max(1, min(chunk_bytes, math.ceil(len(buffer) / workers)))
+        chunks = split_into_chunks(buffer, size)
+
+    if max_workers == 0 or len(chunks) <= 1:
+        chunk_tops = [reduce_chunk(file_path, *c, k) for c in chunks]
+        return merge_chunk_tops(chunk_tops, k)
+
+    with futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        jobs = [
+            executor.submit(reduce_chunk, file_path, start, end, k)
+            for start, end in chunks
+        ]
+        return merge_chunk_tops([job.result() for job in jobs], k)
+
+
+def get_priority(index: int) -> int:
+    """
+    Gives a group its priority in the leaderboard tree, a hash of its index
+    so that the tree is balanced like a random treap while staying
+    reproducible from the group sums alone
+
+    :param index: index of the group
+    :type index: int
+
+    :return: 64-bit priority
+    :rtype: int
+    """
+    # splitmix64 finalizer
+    value = (index + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+
+class RankNode:
+    """
+    Node of the leaderboard tree, a treap ordered by rank, whose subtrees
+    know their number of groups and the total of their sums
+
+    :param sum_: sum of the group
+    :type sum_: int
+
+    :param index: index of the group
+    :type index: int
+    """
+
+    __slots__ = ("key", "priority", "left", "right", "size", "total")
+
+    def __init__(self, sum_: int, index: int):
+        # the largest sum ranks first, then the earliest group
+        self.key = (-sum_, index)
+        self.priority = get_priority(index)
+        self.left: Optional[RankNode] = None
+        self.right: Optional[RankNode] = None
+        self.size = 1
+        self.total = sum_
+
+    def refresh(self):
+        """
+        Recompute the size and total of the subtree from its children
+        """
+        self.size = 1
+        self.total = -self.key[0]
+        for child in (self.left, self.right):
+            if child is not None:
+                self.size += child.size
+                self.total += child.total
+
+
+def split_tree(
+    node: Optional[RankNode],
+    key: Tuple[int, int],
+) -> Tuple[Optional[RankNode], Optional[RankNode]]:
+    """
+    Splits a tree into the groups ranked before a key and the other ones
+
+    :param node: root of the tree
+    :type node: Optional[RankNode]
+
+    :param key: (-sum, index) where the tree is split
+    :type key: Tuple[int, int]
+
+    :return: roots of the groups before the key and of the other ones
+    :rtype: Tuple[Optional[RankNode], Optional[RankNode]]
+    """
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = split_tree(node.right, key)
+        node.refresh()
+        return node, right
+    left, node.left = split_tree(node.left, key)
+    node.refresh()
+    return left, node
+
+
+def merge_trees(
+    left: Optional[RankNode],
+    right: Optional[RankNode],
+) -> Optional[RankNode]:
+    """
+    Joins two trees, every group of the left one ranking before the groups
+    of the right one
+
+    :param left: root of the first tree
+    :type left: Optional[RankNode]
+
+    :param right: root of the second tree
+    :type right: Optional[RankNode]
+
+    :return: root of the joined tree
+    :rtype: Optional[RankNode]
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = merge_trees(left.right, right)
+        left.refresh()
+        return left
+    right.left = merge_trees(left, right.left)
+    right.refresh()
+    return right
+
+
+def build_tree(nodes: List[RankNode]) -> Optional[RankNode]:
+    """
+    Builds a tree in linear time from nodes sorted by rank
+
+    :param nodes: nodes in rank order
+    :type nodes: List[RankNode]
+
+    :return: root of the tree
+    :rtype: Optional[RankNode]
+    """
+    # the right spine of the tree, where every new node goes
+    spine: List[RankNode] = []
+    for node in nodes:
+        last = None
+        while spine and spine[-1].priority < node.priority:
+            last = spine.pop()
+        node.left = last
+        if spine:
+            spine[-1].right = node
+        spine.append(node)
+    if not spine:
+        return None
+
+    # children are refreshed before their parents
+    order = []
+    pending = [spine[0]]
+    while pending:
+        node = pending.pop()
+        order.append(node)
+        pending.extend(c for c in (node.left, node.right) if c is not None)
+    for node in reversed(order):
+        node.refresh()
+    return spine[0]
+
+
+class GroupLeaderboard:
+    """
+    Ranking of groups that keeps up with appended groups and values. Each
+    update and each query on the largest group, the sum of the top k or the
+    rank of a group takes O(log n), with the groups kept in a tree ordered
+    by rank. Like get_k_largest_group_sum, the earliest group ranks first
+    among equal sums and missing groups count as (0, -1).
+
+    Values are added to the last group until it is ended, as a blank line
+    ends a group in the puzzle input, while whole groups are added closed.
+
+    :param sums: sum of every group already known, in order
+    :type sums: Iterable[int]
+
+    :param is_open: whether values can still be added to the last group
+    :type is_open: bool
+    """
+
+    def __init__(self, sums: Iterable[int] = (), is_open: bool = False):
+        self.sums = list(sums)
+        self.is_open = is_open and len(self.sums) > 0
+        nodes = [RankNode(sum_, idx) for idx, sum_ in enumerate(self.sums)]
+        nodes.sort(key=lambda node: node.key)
+        self.root = build_tree(nodes)
+
+    def __len__(self) -> int:
+        return len(self.sums)
+
+    def insert(self, index: int):
+        """
+        Insert a group in the tree with its current sum
+
+        :param index: index of the group
+        :type index: int
+        """
+        node = RankNode(self.sums[index], index)
+        # walk down to where the node's priority puts it, counting it in the
+        # subtrees it joins, then split what is below between its children
+        parent = None
+        current = self.root
+        while current is not None and current.priority > node.priority:
+            current.size += 1
+            current.total += node.total
+            parent = current
+            current = current.left if node.key < current.key else current.right
+        node.left, node.right = split_tree(current, node.key)
+        node.refresh()
+        self.attach(parent, node.key, node)
+
+    def remove(self, index: int):
+        """
+        Remove a group from the tree
+
+        :param index: index of the group
+        :type index: int
+        """
+        key = (-self.sums[index], index)
+        parent = None
+        current = self.root
+        while current is not None and current.key != key:
+            current.size -= 1
+            current.total -= self.sums[index]
+            parent = current
+            current = current.left if key < current.key else current.right
+        if current is not None:
+            children = merge_trees(current.left, current.right)
+            self.attach(parent, key, children)
+
+    def attach(
+        self,
+        parent: Optional[RankNode],
+        key: Tuple[int, int],
+        node: Optional[RankNode],
+    ):
+        """
+        Put a subtree under a parent, or at the root
+
+        :param parent: new parent of the subtree, None for the root
+        :type parent: Optional[RankNode]
+
+        :param key: key of a group of the subtree, telling on which side of
+            the parent it goes
+        :type key: Tuple[int, int]
+
+        :param node: root of the subtree, possibly empty
+        :type node: Optional[RankNode]
+        """
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
         else:
-            bot_val = mid_val
-            bot_idx = mid_idx
+            parent.right = node
+
+    def add_value(self, value: int):
+        """
+        Add a value to the last group, or to a new group if it was ended
+
+        :param value: value added
+        :type value: int
+        """
+        if not self.is_open:
+            self.sums.append(value)
+            self.is_open = True
+        else:
+            self.remove(len(self.sums) - 1)
+            self.sums[-1] += value
+        self.insert(len(self.sums) - 1)
+
+    def end_group(self):
+        """
+        End the last group, the next value starts a new one
+        """
+        self.is_open = False
+
+    def add_group(self, values: Iterable[int]):
+        """
+        Add a whole group, after ending the last one
+
+        :param values: values of the group
+        :type values: Iterable[int]
+        """
+        self.sums.append(sum(values))
+        self.is_open = False
+        self.insert(len(self.sums) - 1)
+
+    def add_lines(self, lines: Iterable[str]):
+        """
+        Add the values of lines of input, a blank line ending a group
+
+        :param lines: lines of the input, e.g. an open file
+        :type lines: Iterable[str]
+        """
+        for line in lines:
+            line = line.strip()
+            if line:
+                self.add_value(int(line))
+            else:
+                self.end_group()
+
+    def largest(self) -> Tuple[int, int]:
+        """
+        Find the group with the largest sum
+
+        :return: Index of the group with the largest sum and corresponding
+            sum, (0, -1) if there is no group
+        :rtype: Tuple[int, int]
+        """
+        node = self.root
+        if node is None:
+            return 0, -1
+        while node.left is not None:
+            node = node.left
+        return node.key[1], -node.key[0]
+
+    def top_k_sum(self, k: int) -> int:
+        """
+        Sum the k largest group sums, missing groups counting as -1 like in
+        solve_part_2
+
+        :param k: number of groups summed
+        :type k: int
+
+        :return: total of the k largest sums
+        :rtype: int
+        """
+        total = -max(k - len(self.sums), 0)
+        remaining = min(k, len(self.sums))
+        node = self.root
+        while node is not None and remaining > 0:
+            left_size = 0 if node.left is None else node.left.size
+            if remaining <= left_size:
+                node = node.left
+                continue
+            if node.left is not None:
+                total += node.left.total
+            total -= node.key[0]
+            remaining -= left_size + 1
+            node = node.right
+        return total
+
+    def rank(self, index: int) -> int:
+        """
+        Find the rank of a group, 0 for the largest
+
+        :param index: index of the group
+        :type index: int
+
+        :raises IndexError: if there is no such group
+
+        :return: number of groups ranked before it
+        :rtype: int
+        """
+        if not 0 <= index < len(self.sums):
+            raise IndexError(f"Invalid group index {index}")
+        key = (-self.sums[index], index)
+        rank = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                rank += 1 + (0 if node.left is None else node.left.size)
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Get the state of the leaderboard, from which it is rebuilt
+
+        :return: JSON serializable state
+        :rtype: Dict[str, Any]
+        """
+        return {"sums": list(self.sums), "is_open": self.is_open}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> GroupLeaderboard:
+        """
+        Rebuild a leaderboard in linear time after sorting the sums
+
+        :param state: state returned by to_state
+        :type state: Dict[str, Any]
+
+        :return: the leaderboard
+        :rtype: GroupLeaderboard
+        """
+        return cls(state["sums"], state["is_open"])
+
+    def save(self, file_path: str):
+        """
+        Write a checkpoint of the leaderboard as JSON. The file is replaced
+        at once, so an interrupted save leaves the previous checkpoint.
+
+        :param file_path: path of the checkpoint
+        :type file_path: str
+        """
+        temporary_path = f"{file_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(self.to_state(), file)
+        os.replace(temporary_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: str) -> GroupLeaderboard:
+        """
+        Resume a leaderboard from a checkpoint written by save
 
-            mid_val = top_val
-            mid_idx = top_idx
+        :param file_path: path of the checkpoint
+        :type file_path: str
+
+        :return: the leaderboard
+        :rtype: GroupLeaderboard
+        """
+        with open(file_path, "r") as file:
+            return cls.from_state(json.load(file))
+
+
+def parse_input(raw_data: blocks_type) -> List[List[int]]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw text data to be parsed, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
+
+    :return: Parsed integer values
+    :rtype: List[List[int]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(groups: List[List[int]]) -> int:
+    """
+    Computes the answer to part 1, the largest group sum
+
+    :param groups: A list of groups, where each group is a list of integers
+    :type groups: List[List[int]]
+
+    :return: Sum of the largest group
+    :rtype: int
+    """
+    _, sum_ = get_largest_group_sum(groups)
+    return sum_
+
+
+def solve_part_2(groups: List[List[int]]) -> int:
+    """
+    Computes the answer to part 2, the total of the 3 largest group sums
+
+    :param groups: A list of groups, where each group is a list of integers
+    :type groups: List[List[int]]
+
+    :return: Sum of the 3 largest group sums
+    :rtype: int
+    """
+    return sum([t[1] for t in get_3_largest_group_sum(groups)])
+
+
+def solve_batch(raw_data_list: List[str]) -> List[Tuple[int, int]]:
+    """
+    Solves both parts for many inputs at once. The group sums of every
+    input are sorted in a single array, then the largest sums of each input
+    are read at the end of its segment.
+
+    :param raw_data_list: Raw text of every input
+    :type raw_data_list: List[str]
+
+    :return: Answers to part 1 and part 2 of every input
+    :rtype: List[Tuple[int, int]]
+    """
+    sums = [np.zeros(0, dtype=np.int64)]
+    lengths = []
+    missing = np.full(3, -1, dtype=np.int64)
+    for raw_data in raw_data_list:
+        group_sums = get_group_sums(parse_data_to_groups(raw_data))
+        # like the scalar solvers, missing groups count as -1
+        sums.extend([group_sums, missing])
+        lengths.append(group_sums.size + 3)
 
-            top_val = sum_
-            top_idx = idx
+    values = np.concatenate(sums)
+    owners = np.repeat(np.arange(len(lengths)), lengths)
+    sorted_values = values[np.lexsort((values, owners))]
+    ends = np.cumsum(lengths, dtype=np.int64)
 
-    return [(bot_idx, bot_val), (mid_idx, mid_val), (top_idx, top_val)]
+    largest = sorted_values[ends - 1]
+    top_3 = largest + sorted_values[ends - 2] + sorted_values[ends - 3]
+    return list(zip(largest.tolist(), top_3.tolist()))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -97,6 +1072,5 @@ if __name__ == "__main__":  # pragma: no cover
         f" with a total of {sum_} calories"
     )
 
-    top_groups = get_3_largest_group_sum(parsed_data)
-    top_calories = sum([t[1] for t in top_groups])
+    top_calories = solve_part_2(parsed_data)
     print(f"The top 3 elves are carrying {top_calories} calories")
@@ -1,20 +1,27 @@
-from typing import Generator, List, Tuple
+from __future__ import annotations
 
-from src.aoc2022 import utils
+from typing import TYPE_CHECKING, Generator, List, Tuple
 
+from src.aoc2022 import metrics, utils
 
-def parse_data_to_array(raw_data: str) -> List[List[str]]:
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
+
+
+def parse_data_to_array(raw_data: utils.lines_type) -> List[List[str]]:
     """
     Parse the raw data into a 1D list of instruction sets
 
-    :param raw_data: Raw data containing numerical data
-    :type raw_data: str
+    :param raw_data: Raw data containing numerical data, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: parsed matrix of values
     :rtype: List[List[str]]
     """
     parsed_list = []
-    for line in raw_data.split("\n"):
+    for line in utils.split_lines(raw_data):
         instructions = line.split(" ")
         parsed_list.append(instructions)
 
@@ -36,20 +43,24 @@ def simulate_cpu_state_machine(
     register_value = 1
     cycle = 0
 
-    for instruction_set in instructions:
-        match instruction_set:  # noqa
-            case ["noop"]:  # noqa: E211
-                cycle += 1
-                yield (cycle, register_value)
-            case ["addx", num]:  # noqa: E211
-                value = int(num)  # noqa: F821
-                cycle += 1
-                yield (cycle, register_value)
-                cycle += 1
-                yield (cycle, register_value)
-                register_value += value
-            case _:  # noqa: E211
-                raise ValueError(f"Invalid CPU instruction {instruction_set}")
+    try:
+        for instruction_set in instructions:
+            match instruction_set:  # noqa
+                case ["noop"]:  # noqa: E211
+                    cycle += 1
+                    yield (cycle, register_value)
+                case ["addx", num]:  # noqa: E211
+                    value = int(num)  # noqa: F821
+                    cycle += 1
+                    yield (cycle, register_value)
+                    cycle += 1
+                    yield (cycle, register_value)
+                    register_value += value
+                case _:  # noqa: E211
+                    message = f"Invalid CPU instruction {instruction_set}"
+                    raise ValueError(message)
+    finally:  # also reached when the generator is closed early
+        metrics.increment("day10.cycles_simulated", cycle)
 
 
 def get_total_signal_strength(instructions: List[List[str]]) -> int:
@@ -101,6 +112,89 @@ def render_cpu_pixel_values(instructions: List[List[str]]) -> str:
     return "".join(render_chars[1:])  # remove leading newline
 
 
+def parse_input(raw_data: utils.lines_type) -> List[List[str]]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data containing the instructions, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: parsed list of instructions
+    :rtype: List[List[str]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(instructions: List[List[str]]) -> int:
+    """
+    Computes the answer to part 1, the total signal strength
+
+    :param instructions: List of instructions to execute
+    :type instructions: List[List[str]]
+
+    :return: total signal strength
+    :rtype: int
+    """
+    return get_total_signal_strength(instructions)
+
+
+def solve_part_2(instructions: List[List[str]]) -> str:
+    """
+    Computes the answer to part 2, the rendered console
+
+    :param instructions: List of instructions to execute
+    :type instructions: List[List[str]]
+
+    :return: rendered console output
+    :rtype: str
+    """
+    return render_cpu_pixel_values(instructions)
+
+
+def solve_batch(raw_data_list: List[str]) -> List[Tuple[int, str]]:
+    """
+    Solves both parts for many inputs at once. Every token of a program
+    lasts one cycle, ``addx`` being followed by its operand, so the register
+    value during each cycle of every input is a cumulative sum over one
+    padded array of register increments.
+
+    :param raw_data_list: Raw data of every input
+    :type raw_data_list: List[str]
+
+    :return: Answers to part 1 and part 2 of every input
+    :rtype: List[Tuple[int, str]]
+    """
+    programs = [
+        [0 if token in ("noop", "addx") else int(token) for token in tokens]
+        for tokens in (raw_data.split() for raw_data in raw_data_list)
+    ]
+    lengths = np.array([len(program) for program in programs])
+    width = int(lengths.max(initial=0))
+
+    increments = np.zeros((len(programs), width), dtype=np.int64)
+    for row, program in enumerate(programs):
+        increments[row, : len(program)] = program
+    registers = 1 + np.cumsum(increments, axis=1) - increments
+
+    cycles = np.arange(1, width + 1)
+    is_sampled = ((cycles - 20) % 40 == 0) & (cycles <= lengths[:, None])
+    strengths = (cycles * registers * is_sampled).sum(axis=1)
+
+    line_width = 40
+    is_lit = np.abs(registers - (cycles - 1) % line_width) <= 1
+    pixels = np.where(is_lit, ord("#"), ord(".")).astype(np.uint8)
+
+    answers = []
+    for row, length in enumerate(lengths.tolist()):
+        chars = pixels[row, :length].tobytes().decode()
+        lines = [
+            chars[start : start + line_width]  # noqa: E203
+            for start in range(0, length, line_width)
+        ]
+        answers.append((int(strengths[row]), "\n".join(lines)))
+    return answers
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     raw_data = utils.get_raw_data("./src/aoc2022/data/day10.txt")
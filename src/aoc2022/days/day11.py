@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Callable, Dict, List, NamedTuple
+from typing import Callable, Dict, List, NamedTuple, Union
 
 from src.aoc2022 import utils
 
@@ -68,36 +68,40 @@ class Monkey(NamedTuple):
         )
 
 
-def parse_data_to_dict(raw_data: str) -> Dict[int, Monkey]:
+def parse_data_to_dict(raw_data: utils.blocks_type) -> Dict[int, Monkey]:
     """
     Parse the raw data intoa dict of monkeys
 
-    :param raw_data: Raw data containing numerical data
-    :type raw_data: str
+    :param raw_data: Raw data containing numerical data, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
 
     :return: parsed dict of Monkey id, Monkey
     :rtype: Dict[int, Monkey]
     """
 
     parsed_monkeys = {}
-    for idx, block in enumerate(raw_data.split("\n\n")):
+    for idx, block in enumerate(utils.split_blocks(raw_data)):
         monkey = parse_block(block)
         parsed_monkeys[idx] = monkey
 
     return parsed_monkeys
 
 
-def parse_block(raw_data_block: str) -> Monkey:
+def parse_block(raw_data_block: Union[str, List[str]]) -> Monkey:
     """
     Parse block of raw data to a single monkey monkey
 
-    :param raw_data_block: Raw data containing data for single monkey
-    :type raw_data_block: str
+    :param raw_data_block: Raw data containing data for single monkey, or
+        its lines
+    :type raw_data_block: Union[str, List[str]]
 
     :return: parsed Monkey instance
     :rtype: Monkey
     """
-    lines = raw_data_block.split("\n")
+    if isinstance(raw_data_block, str):
+        lines = raw_data_block.split("\n")
+    else:
+        lines = raw_data_block
 
     starting_items_string = lines[1].strip().split(": ")[1]
     starting_items = [int(e) for e in starting_items_string.split(", ")]
@@ -226,6 +230,62 @@ def compute_number_of_counted_items_no_div(
     return checked_items
 
 
+def get_monkey_business(counted_items: Dict[int, int]) -> int:
+    """
+    Compute the monkey business, the product of the two largest counts
+
+    :param counted_items: Examined items counts for each monkey id
+    :type counted_items: Dict[int, int]
+
+    :return: product of the two largest examined item counts
+    :rtype: int
+    """
+    sorted_values = sorted(counted_items.values())
+    return sorted_values[-1] * sorted_values[-2]
+
+
+def parse_input(raw_data: utils.blocks_type) -> Dict[int, Monkey]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data containing the monkey descriptions, or blocks
+        of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
+
+    :return: parsed dict of Monkey id, Monkey
+    :rtype: Dict[int, Monkey]
+    """
+    return parse_data_to_dict(raw_data)
+
+
+def solve_part_1(monkeys: Dict[int, Monkey]) -> int:
+    """
+    Computes the answer to part 1, the monkey business after 20 rounds
+
+    :param monkeys: Monkeys instances to simulate playing the game
+    :type monkeys: Dict[int, Monkey]
+
+    :return: monkey business after 20 rounds
+    :rtype: int
+    """
+    return get_monkey_business(compute_number_of_counted_items(20, monkeys))
+
+
+def solve_part_2(monkeys: Dict[int, Monkey]) -> int:
+    """
+    Computes the answer to part 2, the monkey business after 10_000 rounds
+    without the division rule
+
+    :param monkeys: Monkeys instances to simulate playing the game
+    :type monkeys: Dict[int, Monkey]
+
+    :return: monkey business after 10_000 rounds
+    :rtype: int
+    """
+    counted_items = compute_number_of_counted_items_no_div(10_000, monkeys)
+    return get_monkey_business(counted_items)
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     num_rounds = 20
@@ -234,13 +294,11 @@ if __name__ == "__main__":  # pragma: no cover
     parsed_data = parse_data_to_dict(raw_data)
 
     counted_items = compute_number_of_counted_items(num_rounds, parsed_data)
-    sorted_values = sorted(counted_items.values())
-    max_mul = sorted_values[-1] * sorted_values[-2]
+    max_mul = get_monkey_business(counted_items)
     print(f"The max priorities multiplied are : {max_mul}")
 
     num_rounds = 10_000
 
     res = compute_number_of_counted_items_no_div(num_rounds, parsed_data)
-    sorted_values = sorted(res.values())
-    max_mul = sorted_values[-1] * sorted_values[-2]
+    max_mul = get_monkey_business(res)
     print(f"The max priorities multiplied are : {max_mul}")
@@ -1,97 +1,135 @@
-from typing import Tuple
+from __future__ import annotations
 
-import numpy as np
+import string
+from typing import TYPE_CHECKING, Tuple
 
-from src.aoc2022 import utils
+from src.aoc2022 import graphs, grids, metrics, utils
 
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
 
-def parse_data_to_array(raw_data: str) -> np.ndarray:
+parsed_type = Tuple["np.ndarray", Tuple[int, int], Tuple[int, int]]
+
+
+HEIGHTS = grids.make_table(
+    {
+        **{letter: i for i, letter in enumerate(string.ascii_lowercase)},
+        "S": 0,
+        "E": 25,
+    }
+)
+"""
+Translation of the map characters to heights, the start is at height a
+and the end at height z
+"""
+
+
+def parse_data_to_array(raw_data: grids.grid_source_type) -> parsed_type:
     """
-    Parse the raw data into a 1D list of instruction sets
+    Parse the raw data into a height map indexed by column then row, and
+    the positions of the start and of the end
 
-    :param raw_data: Raw data containing numerical data
-    :type raw_data: str
+    :param raw_data: Raw data containing the height map, bytes or lines
+    :type raw_data: Union[str, bytes, mmap.mmap, Iterable[str]]
 
-    :return: parsed matrix of values
-    :rtype: List[List[str]]
+    :return: parsed height map, start position and end position
+    :rtype: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]
     """
+    heights, markers = grids.load_grid(raw_data, HEIGHTS, "SE")
+    if "S" not in markers or "E" not in markers:
+        raise ValueError("The height map has no start or no end")
+    start_row, start_column = markers["S"]
+    end_row, end_column = markers["E"]
 
-    rows = []
+    # signed, so that the climb between two cells can be negative
+    height_map = heights.view(np.int8).transpose()
+    return height_map, (start_column, start_row), (end_column, end_row)
 
-    base_value = ord("a")
 
-    start_pos = None
-    end_pos = None
+def can_step_back(heights: np.ndarray, next_heights: np.ndarray) -> np.ndarray:
+    """
+    Check moves walked from the end towards the start, which are allowed
+    when the forward move climbs at most one
 
-    for i, line in enumerate(raw_data.split("\n")):  # row number
-        values = []
-        for j, char in enumerate(line.strip()):  # col number
-            if char == "S":
-                values.append(0)
-                start_pos = (j, i)
-            elif char == "E":
-                values.append(ord("z") - base_value)
-                end_pos = (j, i)
-            else:
-                values.append(ord(char) - base_value)
-        rows.append(np.array(values))
+    :param heights: heights of the cells moved from
+    :type heights: np.ndarray
 
-    return np.array(rows).transpose(), start_pos, end_pos
+    :param next_heights: heights of the cells moved to
+    :type next_heights: np.ndarray
+
+    :return: flag per move, whether it is allowed
+    :rtype: np.ndarray
+    """
+    return heights - next_heights <= 1
 
 
 def get_distance_matrix(data: np.ndarray, pos: Tuple[int, int]) -> np.ndarray:
     """
-    Compute the breadth-first distance matrix from aa starting position
+    Compute the breadth-first distance matrix from aa starting position,
+    walking the moves backwards from the end
 
     :param data: Height map for the traversal
     :type data: np.ndarray
 
-    :param pos: starting position for the depth-first search
+    :param pos: starting position for the breadth-first search
     :type pos: Tuple[int, int]
 
     :return: the shortest distance from the starting pos to all other points
     :rtype: np.ndarray
     """
-    distances = np.full(data.shape, -1)
-    distances[pos] = 0
-    visited = np.full(data.shape, 0, dtype=bool)
+    graph = graphs.from_grid(data, can_step_back)
+    source = int(np.ravel_multi_index(pos, data.shape))
+    distances = graphs.bfs(graph, [source]).reshape(data.shape)
 
-    visit_stack = [pos]
+    nodes_expanded = int(np.count_nonzero(distances >= 0))
+    metrics.increment("day12.bfs_nodes_expanded", nodes_expanded)
+    return distances
 
-    max_x, max_y = data.shape
 
-    deltas = [
-        (-1, 0),
-        (1, 0),
-        (0, -1),
-        (0, 1),
-    ]
+def parse_input(raw_data: utils.lines_type) -> parsed_type:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data containing the height map, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
-    while len(visit_stack) > 0:
-        x, y = visit_stack.pop(0)
+    :return: parsed height map, start position and end position
+    :rtype: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]
+    """
+    return parse_data_to_array(raw_data)
 
-        if visited[x, y]:
-            pass
-        else:
 
-            visited[x, y] = True
+def solve_part_1(data: parsed_type) -> int:
+    """
+    Computes the answer to part 1, the shortest path from start to end
 
-            for dx, dy in deltas:
-                new_x = x + dx
-                new_y = y + dy
+    :param data: parsed height map, start position and end position
+    :type data: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]
 
-                valid_x = new_x >= 0 and new_x < max_x
-                valid_y = new_y >= 0 and new_y < max_y
+    :return: length of the shortest path
+    :rtype: int
+    """
+    height_map, start, end = data
+    distance_matrix = get_distance_matrix(height_map, end)
+    return int(distance_matrix[start])
 
-                if valid_x and valid_y:
 
-                    valid_pos = data[x, y] - data[new_x, new_y] <= 1
+def solve_part_2(data: parsed_type) -> int:
+    """
+    Computes the answer to part 2, the shortest path from any lowest point
 
-                    if valid_pos and (not visited[new_x, new_y]):
-                        distances[new_x, new_y] = distances[x, y] + 1
-                        visit_stack.append((new_x, new_y))
+    :param data: parsed height map, start position and end position
+    :type data: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]
 
-    return distances
+    :return: length of the shortest path from any lowest point
+    :rtype: int
+    """
+    height_map, _, end = data
+    distance_matrix = get_distance_matrix(height_map, end)
+    values = [e for e in distance_matrix[height_map == 0] if e != -1]
+    return int(min(values))
 
 
 if __name__ == "__main__":  # pragma: no cover
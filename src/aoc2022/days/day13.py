@@ -4,34 +4,35 @@ import functools
 import json
 from typing import List, Tuple, Union
 
-from src.aoc2022 import utils
+from src.aoc2022 import metrics, profiling, utils
 
 val_type = Union[List, int]
 pack_type = List[val_type]
+pair_type = Tuple[pack_type, pack_type]
 
 
-def parse_data_to_array(raw_data: str) -> List[Tuple[pack_type, pack_type]]:
+def parse_data_to_array(
+    raw_data: utils.blocks_type,
+) -> List[Tuple[pack_type, pack_type]]:
     """
     Parse raw data into a list of packet tuples
 
-    :param raw_data: Raw data to parse into packets
-    :type raw_data: str
+    :param raw_data: Raw data to parse into packets, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
 
     :return: a list of all packet pairs
     :rtype: List[Tuple[List, List]]
     """
-    packets = raw_data.split("\n\n")
-
     packet_pairs = []
 
-    for packet in packets:
-        top_packet, bot_packet = packet.split("\n")
+    for top_packet, bot_packet in utils.split_blocks(raw_data):
         pair = (json.loads(top_packet), json.loads(bot_packet))
         packet_pairs.append(pair)
 
     return packet_pairs
 
 
+@profiling.profiled
 def element_is_equal(left_val: val_type, right_val: val_type) -> int:
     """
     Perform ternary comparison on two elements. Returns following:
@@ -89,30 +90,58 @@ def sort_packets(packets: List[pack_type]) -> List[pack_type]:
     :return: List of sorted packets
     :rtype: List[pack_type]
     """
-    packet_ordering_func = functools.cmp_to_key(element_is_equal)
+    comparisons = 0
+
+    def counted_element_is_equal(
+        left_val: val_type,
+        right_val: val_type,
+    ) -> int:
+        nonlocal comparisons
+        comparisons += 1
+        return element_is_equal(left_val, right_val)
+
+    packet_ordering_func = functools.cmp_to_key(counted_element_is_equal)
     sorted_packets = sorted(packets, key=packet_ordering_func, reverse=True)
 
+    metrics.increment("day13.comparisons", comparisons)
     return sorted_packets
 
 
-if __name__ == "__main__":  # pragma: no cover
+def count_ordered_pairs(packet_pairs: List[pair_type]) -> int:
+    """
+    Sum the (1-based) indices of the packet pairs that are in the right order
 
-    raw_data = utils.get_raw_data("./src/aoc2022/data/day13.txt")
-    parsed_data = parse_data_to_array(raw_data)
+    :param packet_pairs: a list of all packet pairs
+    :type packet_pairs: List[Tuple[List, List]]
 
+    :return: sum of the indices of the ordered pairs
+    :rtype: int
+    """
     sum_ = 0
 
-    for i, pair in enumerate(parsed_data):
+    for i, pair in enumerate(packet_pairs):
         left_packet, right_packet = pair
         res = element_is_equal(left_packet, right_packet)
         if res == 1:
             sum_ += i + 1
 
-    print(f"{sum_} pairs are in the correct order")
+    return sum_
+
+
+def get_decoder_key(packet_pairs: List[pair_type]) -> int:
+    """
+    Compute the decoder key, the product of the positions of the divider
+    packets once all packets are sorted
 
+    :param packet_pairs: a list of all packet pairs
+    :type packet_pairs: List[Tuple[List, List]]
+
+    :return: the decoder key
+    :rtype: int
+    """
     divider_packets: List = [[[2]], [[6]]]
-    all_packets = divider_packets
-    for left_packet, right_packet in parsed_data:
+    all_packets = [p for p in divider_packets]
+    for left_packet, right_packet in packet_pairs:
         all_packets.append(left_packet)
         all_packets.append(right_packet)
 
@@ -121,4 +150,57 @@ if __name__ == "__main__":  # pragma: no cover
     packet_1_key = sorted_packets.index(divider_packets[0]) + 1
     packet_2_key = sorted_packets.index(divider_packets[1]) + 1
 
-    print(f"The decoder key is {packet_1_key * packet_2_key}")
+    return packet_1_key * packet_2_key
+
+
+def parse_input(raw_data: utils.blocks_type) -> List[pair_type]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data to parse into packets, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
+
+    :return: a list of all packet pairs
+    :rtype: List[Tuple[List, List]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(packet_pairs: List[pair_type]) -> int:
+    """
+    Computes the answer to part 1, the sum of the ordered pair indices
+
+    :param packet_pairs: a list of all packet pairs
+    :type packet_pairs: List[Tuple[List, List]]
+
+    :return: sum of the indices of the ordered pairs
+    :rtype: int
+    """
+    return count_ordered_pairs(packet_pairs)
+
+
+def solve_part_2(packet_pairs: List[pair_type]) -> int:
+    """
+    Computes the answer to part 2, the decoder key
+
+    :param packet_pairs: a list of all packet pairs
+    :type packet_pairs: List[Tuple[List, List]]
+
+    :return: the decoder key
+    :rtype: int
+    """
+    return get_decoder_key(packet_pairs)
+
+
+if __name__ == "__main__":  # pragma: no cover
+
+    raw_data = utils.get_raw_data("./src/aoc2022/data/day13.txt")
+    parsed_data = parse_data_to_array(raw_data)
+
+    sum_ = count_ordered_pairs(parsed_data)
+
+    print(f"{sum_} pairs are in the correct order")
+
+    decoder_key = get_decoder_key(parsed_data)
+
+    print(f"The decoder key is {decoder_key}")
@@ -1,18 +1,23 @@
-from typing import Tuple
+from __future__ import annotations
 
-import numpy as np
+from typing import TYPE_CHECKING, Tuple
 
-from src.aoc2022 import utils
+from src.aoc2022 import jit, metrics, profiling, utils
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
 
 
 def parse_data_to_array(
-    raw_data: str, starting_point: Tuple[int, int]
+    raw_data: utils.lines_type, starting_point: Tuple[int, int]
 ) -> Tuple[np.ndarray, Tuple[int, int]]:
     """
     Parse raw data into a grid of air/stone cells
 
-    :param raw_data: Raw data to parse into packets
-    :type raw_data: str
+    :param raw_data: Raw data to parse into packets, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :param starting_point: Starting point from where sand is dropped
     :type starting_point: Tuple[int, int]
@@ -26,7 +31,7 @@ def parse_data_to_array(
     max_y_value = starting_point[1]
     paths = []
 
-    for line in raw_data.split("\n"):
+    for line in utils.split_lines(raw_data):
         coords = line.split(" -> ")
         path = []
         for i in range(len(coords)):
@@ -45,7 +50,8 @@ def parse_data_to_array(
         paths.append(path)
 
     shape = (max_x_value - min_x_value + 1, max_y_value - min_y_value + 1)
-    map_ = np.zeros(shape)
+    # cells are 0 for air, 1 for rock and 2 for sand, one byte is enough
+    map_ = np.zeros(shape, dtype=np.uint8)
 
     normalized_starting_point = (
         starting_point[0] - min_x_value,
@@ -102,7 +108,7 @@ def add_floor_to_map(
     copy_top = 0
     copy_bot = map_.shape[1]
 
-    new_map = np.zeros((width, height))
+    new_map = np.zeros((width, height), dtype=map_.dtype)
     new_map[copy_left:copy_right, copy_top:copy_bot] = map_
     new_map[:, -1] = 1
 
@@ -111,6 +117,7 @@ def add_floor_to_map(
     return new_map, new_starting_point
 
 
+@profiling.profiled
 def simulate_grain_of_sand(
     map_: np.ndarray, starting_point: Tuple[int, int]
 ) -> Tuple[int, int]:
@@ -130,9 +137,11 @@ def simulate_grain_of_sand(
     # TODO: this can be optimized with dynamic programming
     x, y = starting_point
     max_x, max_y = map_.shape
+    settled_point = (-1, -1)
+    steps = 0
     while (x >= 0) and (x < max_x) and (y >= 0) and (y < max_y - 1):
         if map_[x, y] != 0:
-            return (-1, -1)
+            break
         if map_[x, y + 1] == 0:
             y += 1
         else:
@@ -143,8 +152,76 @@ def simulate_grain_of_sand(
                 x += 1
                 y += 1
             else:
-                return (x, y)
-    return (-1, -1)
+                settled_point = (x, y)
+                break
+        steps += 1
+
+    metrics.increment("day14.cells_stepped", steps)
+    return settled_point
+
+
+@jit.kernel
+def drop_grain(map_: np.ndarray, x: int, y: int) -> Tuple[int, int, int]:
+    """
+    Compiled loop of simulate_grain_of_sand
+
+    :param map_: The map through which the grain of sand falls
+    :type map_: np.ndarray
+
+    :param x: first coordinate of the starting point
+    :type x: int
+
+    :param y: second coordinate of the starting point
+    :type y: int
+
+    :raises IndexError: if the grain moves right of the last column, as
+        the index of simulate_grain_of_sand does
+
+    :return: the settled cell, (-1, -1) if the grain fell off the map, and
+        the number of cells stepped
+    :rtype: Tuple[int, int, int]
+    """
+    max_x, max_y = map_.shape
+    steps = 0
+    while (x >= 0) and (x < max_x) and (y >= 0) and (y < max_y - 1):
+        if map_[x, y] != 0:
+            break
+        if map_[x, y + 1] == 0:
+            y += 1
+        elif map_[x - 1, y + 1] == 0:
+            x -= 1
+            y += 1
+        elif x + 1 == max_x:
+            # nopython mode does not check bounds, NumPy raises here
+            raise IndexError("The grain of sand left the map on the right")
+        elif map_[x + 1, y + 1] == 0:
+            x += 1
+            y += 1
+        else:
+            return x, y, steps
+        steps += 1
+    return -1, -1, steps
+
+
+@jit.accelerates(simulate_grain_of_sand)
+def simulate_grain_of_sand_compiled(
+    map_: np.ndarray, starting_point: Tuple[int, int]
+) -> Tuple[int, int]:
+    """
+    Simulate a grain of sand falling through the map with a compiled loop
+
+    :param map_: The map through which the grain of sand falls
+    :type map_: np.ndarray
+
+    :param starting_point: Starting point from where sand is dropped
+    :type starting_point: Tuple[int, int]
+
+    :return: The updated cell that the grain of sand falls onto
+    :rtype: Tuple[int, int]
+    """
+    x, y, steps = drop_grain(map_, *starting_point)
+    metrics.increment("day14.cells_stepped", steps)
+    return (x, y)
 
 
 def render_map(map_: np.ndarray, start_point: Tuple[int, int]) -> str:
@@ -186,13 +263,74 @@ def simulate_sand_falling(
     """
     map_ = map_.copy()
     updated_point = simulate_grain_of_sand(map_, starting_point)
+    grains = 1
 
     while updated_point != (-1, -1):
         map_[updated_point] = 2
         updated_point = simulate_grain_of_sand(map_, starting_point)
+        grains += 1
+
+    metrics.increment("day14.grains_simulated", grains)
     return map_
 
 
+def count_grains_of_sand(map_: np.ndarray) -> int:
+    """
+    Count the grains of sand that have settled in the map
+
+    :param map_: map after the sand has been simulated
+    :type map_: np.ndarray
+
+    :return: number of grains of sand at rest
+    :rtype: int
+    """
+    return int(map_[map_ == 2].shape[0])
+
+
+def parse_input(
+    raw_data: utils.lines_type,
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Parses the puzzle input for the runner, with sand dropped from (500, 0)
+
+    :param raw_data: Raw data containing the rock paths, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: the generated map and updated starting point
+    :rtype: Tuple[np.ndarray, Tuple[int, int]]
+    """
+    return parse_data_to_array(raw_data, (500, 0))
+
+
+def solve_part_1(data: Tuple[np.ndarray, Tuple[int, int]]) -> int:
+    """
+    Computes the answer to part 1, the grains of sand before overflowing
+
+    :param data: the map and starting point
+    :type data: Tuple[np.ndarray, Tuple[int, int]]
+
+    :return: number of grains of sand at rest
+    :rtype: int
+    """
+    map_, start = data
+    return count_grains_of_sand(simulate_sand_falling(map_, start))
+
+
+def solve_part_2(data: Tuple[np.ndarray, Tuple[int, int]]) -> int:
+    """
+    Computes the answer to part 2, the grains of sand with a floor added
+
+    :param data: the map and starting point
+    :type data: Tuple[np.ndarray, Tuple[int, int]]
+
+    :return: number of grains of sand at rest
+    :rtype: int
+    """
+    map_with_floor, start_with_floor = add_floor_to_map(*data)
+    sand_filled_map = simulate_sand_falling(map_with_floor, start_with_floor)
+    return count_grains_of_sand(sand_filled_map)
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     starting_point = (500, 0)
@@ -203,7 +341,7 @@ if __name__ == "__main__":  # pragma: no cover
 
     sand_filled_map = simulate_sand_falling(map_, new_start)
 
-    print(f"{sand_filled_map[sand_filled_map == 2].shape[0]} grains fell")
+    print(f"{count_grains_of_sand(sand_filled_map)} grains fell")
 
     if verbose:
         print("Before :")
@@ -214,7 +352,7 @@ if __name__ == "__main__":  # pragma: no cover
     map_with_floor, start_with_floor = add_floor_to_map(map_, new_start)
     sand_filled_map = simulate_sand_falling(map_with_floor, start_with_floor)
 
-    print(f"{sand_filled_map[sand_filled_map == 2].shape[0]} grains fell")
+    print(f"{count_grains_of_sand(sand_filled_map)} grains fell")
 
     if verbose:
         print("Before :")
@@ -1,16 +1,29 @@
-from typing import List, Optional, Tuple
+from __future__ import annotations
 
-from src.aoc2022 import utils
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from src.aoc2022 import budget as budgets
+from src.aoc2022 import implementations, intervals, utils
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
+
+ROWS_PER_BLOCK = 512
+"""
+Number of rows whose gaps are searched at once in part 2
+"""
 
 
 def parse_data_to_array(
-    raw_data: str,
+    raw_data: utils.lines_type,
 ) -> List[Tuple[int, int, int, int]]:
     """
     Parse raw data into a list of sensor/closest beacon locations
 
-    :param raw_data: Raw data to parse into sensor/beacon locations
-    :type raw_data: str
+    :param raw_data: Raw data to parse into sensor/beacon locations, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: the parsed sensor/beacon locations
     :rtype: List[Tuple[int, int]]
@@ -18,7 +31,7 @@ def parse_data_to_array(
 
     coordinate_pairs = []
 
-    for line in raw_data.split("\n"):
+    for line in utils.split_lines(raw_data):
         sensor_str, beacon_str = line.split(": ")
 
         sensor_prefix = "Sensor at "
@@ -34,6 +47,24 @@ def parse_data_to_array(
     return coordinate_pairs
 
 
+def get_sensor_arrays(
+    beacon_sensor_locations: List[Tuple[int, int, int, int]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split the sensor/beacon locations into arrays
+
+    :param beacon_sensor_locations: List of sensor/beacon locations
+    :type beacon_sensor_locations: List[Tuple[int, int, int, int]]
+
+    :return: x and y of the sensors, and their scan radius
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    locations = np.array(beacon_sensor_locations, dtype=np.int64)
+    sensor_x, sensor_y, beacon_x, beacon_y = locations.reshape(-1, 4).T
+    radius = np.abs(beacon_x - sensor_x) + np.abs(beacon_y - sensor_y)
+    return sensor_x, sensor_y, radius
+
+
 def count_scanned_location(
     beacon_sensor_locations: List[Tuple[int, int, int, int]],
     row_number: int,
@@ -81,6 +112,9 @@ def count_scanned_location(
         [t[2] for t in beacon_sensor_locations if t[3] == row_number]
     )
 
+    if len(ranges) == 0:
+        return [], 0
+
     sorted_ranges = sorted(ranges, key=lambda t: t[0])
     range_stack = [sorted_ranges[0]]
 
@@ -103,6 +137,142 @@ def count_scanned_location(
     return range_stack, total_count
 
 
+@implementations.implements(count_scanned_location, "vectorized")
+def count_scanned_location_vectorized(
+    beacon_sensor_locations: List[Tuple[int, int, int, int]],
+    row_number: int,
+    bounding_range: Optional[Tuple[int, int]] = None,
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Count how many locations have been scanned given the beacon/sensor
+    locations and the row number, with an IntervalSet. As in
+    count_scanned_location, ranges that only touch are kept apart and
+    ranges outside the bounding range are moved onto its nearest bound.
+
+    :param beacon_sensor_locations: List of sensor/beacon locations
+    :type beacon_sensor_locations: List[Tuple[int, int, int, int]]
+
+    :param row_number: The row for which to count the scan locations
+    :type row_number: int
+
+    :param bounding_range: an optional bounding range for scan range
+    :type bounding_range: Optional[Tuple[int, int]]
+
+    :return: the ranges scanned as well as the total number of scanned cells
+    :rtype: Tuple[List[Tuple[int, int]], int]
+    """
+    sensor_x, sensor_y, radius = get_sensor_arrays(beacon_sensor_locations)
+
+    # sensors further than their radius from the row scan nothing
+    half_widths = radius - np.abs(sensor_y - row_number)
+    reaches_row = half_widths >= 0
+    starts = (sensor_x - half_widths)[reaches_row]
+    ends = (sensor_x + half_widths)[reaches_row]
+    if bounding_range is not None:
+        starts = np.clip(starts, *bounding_range)
+        ends = np.clip(ends, *bounding_range)
+    scanned = intervals.IntervalSet(starts, ends, join_touching=False)
+
+    potential_beacons = set(
+        [t[2] for t in beacon_sensor_locations if t[3] == row_number]
+    )
+    row_beacons = sorted(potential_beacons)
+    total_count = scanned.length() - scanned.count_members(row_beacons)
+
+    return scanned.to_list(), total_count
+
+
+def find_tuning_frequency(
+    beacon_sensor_locations: List[Tuple[int, int, int, int]],
+    max_coordinate: int,
+    budget: Optional[budgets.Budget] = None,
+    block_size: int = ROWS_PER_BLOCK,
+) -> int:
+    """
+    Find the only uncovered position in the square [0, max_coordinate] and
+    compute its tuning frequency. The rows are scanned by blocks, and the
+    search stops at the deadline of the budget, if any, without having
+    found the position.
+
+    :param beacon_sensor_locations: List of sensor/beacon locations
+    :type beacon_sensor_locations: List[Tuple[int, int, int, int]]
+
+    :param max_coordinate: upper bound of the search area on both axes
+    :type max_coordinate: int
+
+    :param budget: optional time budget, ticked once per block of rows
+    :type budget: Optional[Budget]
+
+    :param block_size: number of rows scanned at once
+    :type block_size: int
+
+    :return: the tuning frequency, or -1 if no uncovered position is found
+    :rtype: int
+    """
+    sensor_x, sensor_y, radius = get_sensor_arrays(beacon_sensor_locations)
+    num_rows = max_coordinate + 1
+
+    for first_row in range(0, num_rows, block_size):
+        if budget is not None and not budget.tick(first_row, num_rows):
+            break
+
+        rows = np.arange(first_row, min(first_row + block_size, num_rows))
+        half_widths = radius - np.abs(sensor_y - rows[:, np.newaxis])
+        gaps = intervals.find_first_gaps(
+            sensor_x - half_widths,
+            sensor_x + half_widths,
+            0,
+            max_coordinate,
+        )
+
+        found = np.flatnonzero(gaps >= 0)
+        if found.size > 0:
+            x_coord = int(gaps[found[0]])
+            return x_coord * 4_000_000 + int(rows[found[0]])
+
+    return -1
+
+
+def parse_input(raw_data: utils.lines_type) -> List[Tuple[int, int, int, int]]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data to parse into sensor/beacon locations, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: the parsed sensor/beacon locations
+    :rtype: List[Tuple[int, int, int, int]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(locations: List[Tuple[int, int, int, int]]) -> int:
+    """
+    Computes the answer to part 1, the scanned locations on row 2_000_000
+
+    :param locations: List of sensor/beacon locations
+    :type locations: List[Tuple[int, int, int, int]]
+
+    :return: number of locations that cannot contain a beacon
+    :rtype: int
+    """
+    _, location_count = count_scanned_location(locations, 2_000_000)
+    return location_count
+
+
+def solve_part_2(locations: List[Tuple[int, int, int, int]]) -> int:
+    """
+    Computes the answer to part 2, the tuning frequency of the distress beacon
+
+    :param locations: List of sensor/beacon locations
+    :type locations: List[Tuple[int, int, int, int]]
+
+    :return: the tuning frequency
+    :rtype: int
+    """
+    return find_tuning_frequency(locations, 4_000_000)
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     row_to_analyze = 2_000_000
@@ -115,14 +285,5 @@ if __name__ == "__main__":  # pragma: no cover
     )
     print(f"{location_count} locations are sure to not contain a beacon")
 
-    min_x, max_x = 0, 4_000_000
-
-    for i in range(min_x, max_x):
-        ranges, location_count = count_scanned_location(
-            sensor_beacon_coordinates, i, bounding_range=(min_x, max_x)
-        )
-
-        if len(ranges) != 1:
-            x_coord = ranges[0][1] + 1
-            print(f"The tuning frequence is {x_coord * 4_000_000 + i}")
-            break
+    frequency = find_tuning_frequency(sensor_beacon_coordinates, 4_000_000)
+    print(f"The tuning frequence is {frequency}")
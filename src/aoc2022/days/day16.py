@@ -1,7 +1,15 @@
+from __future__ import annotations
+
 import itertools
-from typing import Dict, Generator, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Set, Tuple
+
+from src.aoc2022 import budget as budgets
+from src.aoc2022 import graphs, metrics, utils
 
-from src.aoc2022 import utils
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
 
 
 class Graph:
@@ -19,10 +27,14 @@ class Graph:
         self.flow_rates = flow_rates
         self.valves = sorted(list(self.flow_rates.keys()))
         self.connections = cons
+        self.csr, self.names = graphs.from_adjacency(cons)
+        self.indices = {name: i for i, name in enumerate(self.names)}
+
+        distances = graphs.all_pairs_bfs(self.csr)
         self.distance_matrix = {}
         for node in flow_rates.keys():
-            distances = self.compute_distance_matrix(node)
-            self.distance_matrix[node] = distances
+            row = distances[self.indices[node]]
+            self.distance_matrix[node] = self.to_distance_dict(row)
 
     def get_valves(self) -> List[str]:
         """
@@ -91,22 +103,21 @@ class Graph:
         :return: shortest distance from starting node to all other nodes
         :rtype: Dict[str, int]
         """
-        distances = {start: 0}
+        distances = graphs.bfs(self.csr, [self.indices[start]])
+        return self.to_distance_dict(distances)
 
-        stack = [start]
-        visited = set()
+    def to_distance_dict(self, distances: np.ndarray) -> Dict[str, int]:
+        """
+        Name the distances computed on the CSR graph
 
-        while stack:
-            node = stack.pop(0)
-            if node not in visited:
-                visited.add(node)
-                for neighbour in self.get_connections(node):
-                    stack.append(neighbour)
-                    increment_dist = distances[node] + 1
-                    default_dist = distances.get(neighbour, increment_dist)
-                    distances[neighbour] = min(default_dist, increment_dist)
+        :param distances: distance of every node, -1 if unreachable
+        :type distances: np.ndarray
 
-        return distances
+        :return: node name to distance, for the reachable nodes
+        :rtype: Dict[str, int]
+        """
+        reachable = np.flatnonzero(distances >= 0)
+        return {self.names[i]: int(distances[i]) for i in reachable}
 
     def time_aware_permutations(
         self, position: str, remaining_valves: Set[str], remaining_time: int
@@ -144,12 +155,12 @@ class Graph:
                     yield [(position, remaining_time)] + subsearch
 
 
-def parse_data_to_graph(raw_data: str) -> Graph:
+def parse_data_to_graph(raw_data: utils.lines_type) -> Graph:
     """
     Parse raw data into a Graph of valves and connections
 
-    :param raw_data: Raw data to parse into Graph
-    :type raw_data: str
+    :param raw_data: Raw data to parse into Graph, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: the parsed Graph data
     :rtype: Graph
@@ -158,7 +169,7 @@ def parse_data_to_graph(raw_data: str) -> Graph:
     connections = {}
     flow_rates = {}
 
-    for line in raw_data.split("\n"):
+    for line in utils.split_lines(raw_data):
         flow_rate_str, connection_str = line.split("; ")
 
         valve_name_str, flow_rate_str = flow_rate_str.split("rate=")
@@ -207,23 +218,30 @@ def get_optimal_sequence(
 
     search_valves = set(non_zero_valves)
     paths = graph.time_aware_permutations(start, search_valves, total_time)
+    num_paths = 0
 
     for path in paths:
-
+        num_paths += 1
         score = sum([v * graph.get_flow_rate(k) for k, v in path])
 
         if score > max_:
             max_ = score
             max_path = path
 
+    metrics.increment("day16.permutations_yielded", num_paths)
     return max_path, max_
 
 
 def get_optimal_dual_sequence(
-    graph: Graph, start: str, total_time: int
+    graph: Graph,
+    start: str,
+    total_time: int,
+    budget: Optional[budgets.Budget] = None,
 ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]], int]:
     """
-    Compute the optimal valve opening sequence for two agents
+    Compute the optimal valve opening sequence for two agents. At the
+    deadline of the budget, if any, the best partition of the valves found
+    so far is returned.
 
     :param graph: Graph of valves to open
     :type graph: Graph
@@ -234,6 +252,9 @@ def get_optimal_dual_sequence(
     :param total_time: total time for valve sequence
     :type total_time: int
 
+    :param budget: optional time budget, ticked once per partition
+    :type budget: Optional[Budget]
+
     :return: Optimal paths for elephant and person, and associated score
     :rtype: Tuple[List[Tuple[str, int]], List[Tuple[str, int]], int]
     """
@@ -247,7 +268,10 @@ def get_optimal_dual_sequence(
     max_paths: Tuple[path_type, path_type] = ([], [])
 
     partition_flag_combinations = itertools.product([True, False], repeat=n)
+    num_partitions = 2**n
     for idx, bool_flags in enumerate(partition_flag_combinations):
+        if budget is not None and not budget.tick(idx, num_partitions):
+            break
 
         elephant_valves = [real_valves[i] for i in range(n) if bool_flags[i]]
         person_valves = [real_valves[i] for i in range(n) if not bool_flags[i]]
@@ -283,6 +307,48 @@ def get_optimal_dual_sequence(
     return *max_paths, max_
 
 
+def parse_input(raw_data: utils.lines_type) -> Graph:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data to parse into Graph, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: the parsed Graph data
+    :rtype: Graph
+    """
+    return parse_data_to_graph(raw_data)
+
+
+def solve_part_1(graph: Graph) -> int:
+    """
+    Computes the answer to part 1, the best pressure released in 30 minutes
+
+    :param graph: Graph of valves to open
+    :type graph: Graph
+
+    :return: maximum pressure released
+    :rtype: int
+    """
+    _, score = get_optimal_sequence(graph, "AA", 30)
+    return score
+
+
+def solve_part_2(graph: Graph) -> int:
+    """
+    Computes the answer to part 2, the best pressure released in 26 minutes
+    with the help of an elephant
+
+    :param graph: Graph of valves to open
+    :type graph: Graph
+
+    :return: maximum pressure released
+    :rtype: int
+    """
+    _, _, score = get_optimal_dual_sequence(graph, "AA", 26)
+    return score
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     raw_data = utils.get_raw_data("./src/aoc2022/data/day16.txt")
@@ -1,7 +1,19 @@
+from __future__ import annotations
+
 from enum import Enum
-from typing import Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+from src.aoc2022.utils import (
+    get_raw_data,
+    lazy_import,
+    lines_type,
+    split_lines,
+)
 
-from src.aoc2022.utils import get_raw_data
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
 
 
 class Move(Enum):
@@ -43,18 +55,81 @@ class Strategy(Enum):
 
 
 union_dict_type = Union[Dict[str, Move], Dict[str, Strategy]]
+parsed_type = List[Tuple[int, int]]
+
+move_mapping: Dict[str, Move] = {
+    "A": Move.ROCK,
+    "B": Move.PAPER,
+    "C": Move.SCISSORS,
+    "X": Move.ROCK,
+    "Y": Move.PAPER,
+    "Z": Move.SCISSORS,
+}
+
+strategy_mapping: Dict[str, Strategy] = {
+    "X": Strategy.LOSE,
+    "Y": Strategy.DRAW,
+    "Z": Strategy.WIN,
+}
+
+LOSE_PTS = 0
+DRAW_PTS = 3
+WIN_PTS = 6
+
+ROCK_PTS = 1
+PAPER_PTS = 2
+SCISSORS_PTS = 3
+
+point_mappings_part_1: Dict[Tuple[int, int], int] = {
+    (Move.ROCK.value, Move.ROCK.value): ROCK_PTS + DRAW_PTS,
+    (Move.PAPER.value, Move.ROCK.value): ROCK_PTS + LOSE_PTS,
+    (Move.SCISSORS.value, Move.ROCK.value): ROCK_PTS + WIN_PTS,
+    (Move.ROCK.value, Move.PAPER.value): PAPER_PTS + WIN_PTS,
+    (Move.PAPER.value, Move.PAPER.value): PAPER_PTS + DRAW_PTS,
+    (Move.SCISSORS.value, Move.PAPER.value): PAPER_PTS + LOSE_PTS,
+    (Move.ROCK.value, Move.SCISSORS.value): SCISSORS_PTS + LOSE_PTS,
+    (Move.PAPER.value, Move.SCISSORS.value): SCISSORS_PTS + WIN_PTS,
+    (Move.SCISSORS.value, Move.SCISSORS.value): SCISSORS_PTS + DRAW_PTS,
+}
+
+point_mappings_part_2: Dict[Tuple[int, int], int] = {
+    (Move.ROCK.value, Strategy.LOSE.value): SCISSORS_PTS + LOSE_PTS,
+    (Move.PAPER.value, Strategy.LOSE.value): ROCK_PTS + LOSE_PTS,
+    (Move.SCISSORS.value, Strategy.LOSE.value): PAPER_PTS + LOSE_PTS,
+    (Move.ROCK.value, Strategy.DRAW.value): ROCK_PTS + DRAW_PTS,
+    (Move.PAPER.value, Strategy.DRAW.value): PAPER_PTS + DRAW_PTS,
+    (Move.SCISSORS.value, Strategy.DRAW.value): SCISSORS_PTS + DRAW_PTS,
+    (Move.ROCK.value, Strategy.WIN.value): PAPER_PTS + WIN_PTS,
+    (Move.PAPER.value, Strategy.WIN.value): SCISSORS_PTS + WIN_PTS,
+    (Move.SCISSORS.value, Strategy.WIN.value): ROCK_PTS + WIN_PTS,
+}
+
+round_tokens: List[str] = [
+    "A X",
+    "A Y",
+    "A Z",
+    "B X",
+    "B Y",
+    "B Z",
+    "C X",
+    "C Y",
+    "C Z",
+]
+"""
+Text of the 9 possible rounds, in the row order of get_round_points
+"""
 
 
 def parse_data(
-    raw_data: str,
+    raw_data: lines_type,
     l_mapping: Dict[str, Move],
     r_mapping: union_dict_type,
 ) -> List[Tuple[int, int]]:
     """
     Parses the raw text input into lists of tuples of (Enum, Enum)
 
-    :param raw_data: Raw text data to be parsed
-    :type raw_data: str
+    :param raw_data: Raw text data to be parsed, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :param l_mapping: Mapping to convert string to enum value
     :type l_mapping:
@@ -65,9 +140,7 @@ def parse_data(
     :return: List of parsed tuples
     :rtype: List[Tuple[Enum, Enum]]
     """
-    raw_data = raw_data.strip()
-    rows = raw_data.split("\n")
-    values = [row.strip().split(" ") for row in rows]
+    values = [row.strip().split(" ") for row in split_lines(raw_data)]
 
     parsed_data = []
     for left_token, right_token in values:
@@ -99,62 +172,103 @@ def calculate_points(
     return sum(values)
 
 
-if __name__ == "__main__":  # pragma: no cover
-    move_mapping: Dict[str, Move] = {
-        "A": Move.ROCK,
-        "B": Move.PAPER,
-        "C": Move.SCISSORS,
-        "X": Move.ROCK,
-        "Y": Move.PAPER,
-        "Z": Move.SCISSORS,
-    }
-
-    strategy_mapping: Dict[str, Strategy] = {
-        "X": Strategy.LOSE,
-        "Y": Strategy.DRAW,
-        "Z": Strategy.WIN,
-    }
-
-    LOSE_PTS = 0
-    DRAW_PTS = 3
-    WIN_PTS = 6
-
-    ROCK_PTS = 1
-    PAPER_PTS = 2
-    SCISSORS_PTS = 3
-
-    point_mappings_part_1: Dict[Tuple[int, int], int] = {
-        (Move.ROCK.value, Move.ROCK.value): ROCK_PTS + DRAW_PTS,
-        (Move.PAPER.value, Move.ROCK.value): ROCK_PTS + LOSE_PTS,
-        (Move.SCISSORS.value, Move.ROCK.value): ROCK_PTS + WIN_PTS,
-        (Move.ROCK.value, Move.PAPER.value): PAPER_PTS + WIN_PTS,
-        (Move.PAPER.value, Move.PAPER.value): PAPER_PTS + DRAW_PTS,
-        (Move.SCISSORS.value, Move.PAPER.value): PAPER_PTS + LOSE_PTS,
-        (Move.ROCK.value, Move.SCISSORS.value): SCISSORS_PTS + LOSE_PTS,
-        (Move.PAPER.value, Move.SCISSORS.value): SCISSORS_PTS + WIN_PTS,
-        (Move.SCISSORS.value, Move.SCISSORS.value): SCISSORS_PTS + DRAW_PTS,
-    }
-
-    point_mappings_part_2: Dict[Tuple[int, int], int] = {
-        (Move.ROCK.value, Strategy.LOSE.value): SCISSORS_PTS + LOSE_PTS,
-        (Move.PAPER.value, Strategy.LOSE.value): ROCK_PTS + LOSE_PTS,
-        (Move.SCISSORS.value, Strategy.LOSE.value): PAPER_PTS + LOSE_PTS,
-        (Move.ROCK.value, Strategy.DRAW.value): ROCK_PTS + DRAW_PTS,
-        (Move.PAPER.value, Strategy.DRAW.value): PAPER_PTS + DRAW_PTS,
-        (Move.SCISSORS.value, Strategy.DRAW.value): SCISSORS_PTS + DRAW_PTS,
-        (Move.ROCK.value, Strategy.WIN.value): PAPER_PTS + WIN_PTS,
-        (Move.PAPER.value, Strategy.WIN.value): SCISSORS_PTS + WIN_PTS,
-        (Move.SCISSORS.value, Strategy.WIN.value): ROCK_PTS + WIN_PTS,
-    }
+def parse_input(raw_data: lines_type) -> Tuple[parsed_type, parsed_type]:
+    """
+    Parses the puzzle input for the runner, once with each interpretation
+    of the right column
+
+    :param raw_data: Raw text data to be parsed, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: Rounds parsed as (move, move) and as (move, strategy)
+    :rtype: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]
+    """
+    lines = list(split_lines(raw_data))
+    return (
+        parse_data(lines, move_mapping, move_mapping),
+        parse_data(lines, move_mapping, strategy_mapping),
+    )
+
+
+def solve_part_1(rounds: Tuple[parsed_type, parsed_type]) -> int:
+    """
+    Computes the answer to part 1, the score of the naive strategy
+
+    :param rounds: Parsed rounds as returned by parse_input
+    :type rounds: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]
+
+    :return: Total score across all rounds
+    :rtype: int
+    """
+    return calculate_points(rounds[0], point_mappings_part_1)
+
+
+def solve_part_2(rounds: Tuple[parsed_type, parsed_type]) -> int:
+    """
+    Computes the answer to part 2, the score of the correct strategy
 
+    :param rounds: Parsed rounds as returned by parse_input
+    :type rounds: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]
+
+    :return: Total score across all rounds
+    :rtype: int
+    """
+    return calculate_points(rounds[1], point_mappings_part_2)
+
+
+def get_round_points() -> np.ndarray:
+    """
+    Builds the point mappings as a matrix with one row per round token and
+    one column per part
+
+    :return: Points of each round for part 1 and part 2
+    :rtype: np.ndarray
+    """
+    points = []
+    for token in round_tokens:
+        left, right = token.split(" ")
+        moves = (move_mapping[left].value, move_mapping[right].value)
+        strategy = (move_mapping[left].value, strategy_mapping[right].value)
+        points.append(
+            [
+                point_mappings_part_1[moves],
+                point_mappings_part_2[strategy],
+            ]
+        )
+    return np.array(points, dtype=np.int64)
+
+
+def solve_batch(raw_data_list: List[str]) -> List[Tuple[int, int]]:
+    """
+    Solves both parts for many inputs at once. Each input is reduced to the
+    number of occurrences of each round token, so the scores of every input
+    are a single product of the count matrix with the point mappings.
+    Unlike parse_input, lines that are not a valid round are ignored.
+
+    :param raw_data_list: Raw text of every input
+    :type raw_data_list: List[str]
+
+    :return: Answers to part 1 and part 2 of every input
+    :rtype: List[Tuple[int, int]]
+    """
+    shape = (len(raw_data_list), len(round_tokens))
+    counts = np.zeros(shape, dtype=np.int64)
+    for row, raw_data in enumerate(raw_data_list):
+        counts[row] = [raw_data.count(token) for token in round_tokens]
+
+    scores = counts @ get_round_points()
+    return [(part_1, part_2) for part_1, part_2 in scores.tolist()]
+
+
+if __name__ == "__main__":  # pragma: no cover
     raw_data = get_raw_data(file_path="./src/aoc2022/data/day2.txt")
 
-    parsed_data = parse_data(raw_data, move_mapping, move_mapping)
-    total_points = calculate_points(parsed_data, point_mappings_part_1)
+    parsed_data = parse_input(raw_data)
+
+    total_points = solve_part_1(parsed_data)
 
     print(f"You got {total_points} using the naive strategy.")
 
-    parsed_data = parse_data(raw_data, move_mapping, strategy_mapping)
-    total_points = calculate_points(parsed_data, point_mappings_part_2)
+    total_points = solve_part_2(parsed_data)
 
     print(f"You got {total_points} using the correct strategy.")
@@ -1,6 +1,7 @@
 from typing import List
 
-from src.aoc2022.utils import get_raw_data
+from src.aoc2022 import implementations
+from src.aoc2022.utils import get_raw_data, lines_type, split_lines
 
 
 def item_priority(char: str) -> int:
@@ -18,20 +19,21 @@ def item_priority(char: str) -> int:
         return (ord(char) - 97) + 1
 
 
-def parse_data_to_array(raw_data: str) -> List[List[int]]:
+def parse_data_to_array(raw_data: lines_type) -> List[List[int]]:
     """
     Parses the raw text input into lists of priority values
 
-    :param raw_data: Raw text data to be parsed
-    :type raw_data: str
+    :param raw_data: Raw text data to be parsed, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: Parsed list of lists values
     :rtype: List[List[int]]
     """
-    lines = raw_data.replace(" ", "").strip().split("\n")
+    if isinstance(raw_data, str):
+        raw_data = raw_data.replace(" ", "")
 
     parsed_data = []
-    for line in lines:
+    for line in split_lines(raw_data):
         priority_values = [item_priority(c) for c in line]
 
         parsed_data.append(priority_values)
@@ -67,6 +69,27 @@ def get_shared_element(left_list: List[int], right_list: List[int]) -> int:
     return left_list[idx]
 
 
+@implementations.implements(get_shared_element, "set")
+def get_shared_element_with_set(
+    left_list: List[int],
+    right_list: List[int],
+) -> int:
+    """
+    Get the shared element between the two lists with a set intersection,
+    in linear time instead of sorting both lists
+
+    :param left_list: left list of items
+    :type left_list: List[int]
+
+    :param right_list: right list of items
+    :type right_list: List[int]
+
+    :return: shared element between lists, the smallest if there are many
+    :rtype: int
+    """
+    return min(set(left_list).intersection(right_list))
+
+
 def count_total_priority(items: List[List[int]]) -> int:
     """
     Count the total priority for the 2 compartment case
@@ -125,6 +148,29 @@ def get_triplet_shared_element(
     return l_list[idx]
 
 
+@implementations.implements(get_triplet_shared_element, "set")
+def get_triplet_shared_element_with_set(
+    left_list: List[int], middle_list: List[int], right_list: List[int]
+) -> int:
+    """
+    Get the shared element between the three lists with a set intersection,
+    in linear time instead of sorting the three lists
+
+    :param left_list: left list of items
+    :type left_list: List[int]
+
+    :param middle_list: left list of items
+    :type middle_list: List[int]
+
+    :param right_list: right list of items
+    :type right_list: List[int]
+
+    :return: shared element between lists, the smallest if there are many
+    :rtype: int
+    """
+    return min(set(left_list).intersection(middle_list, right_list))
+
+
 def count_triplet_priority(items: List[List[int]]) -> int:
     """
     Count the total priority for the 3 compartment case
@@ -145,6 +191,45 @@ def count_triplet_priority(items: List[List[int]]) -> int:
     return sum_
 
 
+def parse_input(raw_data: lines_type) -> List[List[int]]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw text data to be parsed, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: Parsed list of lists values
+    :rtype: List[List[int]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(items: List[List[int]]) -> int:
+    """
+    Computes the answer to part 1, the priority of the misplaced items
+
+    :param items: list of all backpack contents
+    :type items: List[List[int]]
+
+    :return: total sum of priority for the shared items
+    :rtype: int
+    """
+    return count_total_priority(items)
+
+
+def solve_part_2(items: List[List[int]]) -> int:
+    """
+    Computes the answer to part 2, the priority of the badges
+
+    :param items: list of all backpack contents
+    :type items: List[List[int]]
+
+    :return: total sum of priority for the shared items
+    :rtype: int
+    """
+    return count_triplet_priority(items)
+
+
 if __name__ == "__main__":  # pragma: no cover
     data = get_raw_data("./src/aoc2022/data/day3.txt")
     parsed_data = parse_data_to_array(data)
@@ -1,24 +1,39 @@
-from typing import List, Tuple
+from __future__ import annotations
 
-from src.aoc2022.utils import get_raw_data
+import re
+from typing import TYPE_CHECKING, List, Tuple
+
+from src.aoc2022 import intervals
+from src.aoc2022.utils import (
+    get_raw_data,
+    lazy_import,
+    lines_type,
+    split_lines,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
 
 row_type = Tuple[int, int, int, int]
 
 
-def parse_data_to_array(raw_data: str) -> List[row_type]:
+def parse_data_to_array(raw_data: lines_type) -> List[row_type]:
     """
     Parses the raw text input into lists of value tuples
 
-    :param raw_data: Raw text data to be parsed
-    :type raw_data: str
+    :param raw_data: Raw text data to be parsed, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: Parsed list of value tuples
     :rtype: List[Tuple[int]]
     """
-    lines = raw_data.replace(" ", "").strip().split("\n")
+    if isinstance(raw_data, str):
+        raw_data = raw_data.replace(" ", "")
 
     parsed_data = []
-    for line in lines:
+    for line in split_lines(raw_data):
 
         first_pair, second_pair = line.split(",")
         first_start, first_end = [int(e) for e in first_pair.split("-")]
@@ -69,16 +84,121 @@ def set_overlaps(ranges: row_type) -> bool:
     return (end - start) >= 0
 
 
+def classify_pairs(pairs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Check every pair of ranges at once for containment and overlap
+
+    :param pairs: 2D array, one row (start_left, end_left, start_right,
+        end_right) per pair
+    :type pairs: np.ndarray
+
+    :return: flags whether one range contains the other, and flags whether
+        the ranges overlap
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    left_start, left_end, right_start, right_end = pairs.T
+    shared = intervals.intersection_sizes(
+        left_start,
+        left_end,
+        right_start,
+        right_end,
+    )
+    smallest = np.minimum(left_end - left_start, right_end - right_start) + 1
+    return shared == smallest, shared > 0
+
+
+def to_pair_array(pairs: List[row_type]) -> np.ndarray:
+    """
+    Convert the parsed pairs into a 2D array
+
+    :param pairs: list of (start_left, end_left, start_right, end_right)
+    :type pairs: List[Tuple[int]]
+
+    :return: one row per pair
+    :rtype: np.ndarray
+    """
+    return np.array(pairs, dtype=np.int64).reshape(-1, 4)
+
+
+def parse_input(raw_data: lines_type) -> List[row_type]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw text data to be parsed, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: Parsed list of value tuples
+    :rtype: List[Tuple[int]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(pairs: List[row_type]) -> int:
+    """
+    Computes the answer to part 1, the number of pairs where one range
+    contains the other
+
+    :param pairs: list of (start_left, end_left, start_right, end_right)
+    :type pairs: List[Tuple[int]]
+
+    :return: number of containing pairs
+    :rtype: int
+    """
+    contains, _ = classify_pairs(to_pair_array(pairs))
+    return int(np.count_nonzero(contains))
+
+
+def solve_part_2(pairs: List[row_type]) -> int:
+    """
+    Computes the answer to part 2, the number of overlapping pairs
+
+    :param pairs: list of (start_left, end_left, start_right, end_right)
+    :type pairs: List[Tuple[int]]
+
+    :return: number of overlapping pairs
+    :rtype: int
+    """
+    _, overlaps = classify_pairs(to_pair_array(pairs))
+    return int(np.count_nonzero(overlaps))
+
+
+def solve_batch(raw_data_list: List[str]) -> List[Tuple[int, int]]:
+    """
+    Solves both parts for many inputs at once, with the pairs of every
+    input in a single array and the flags counted per input
+
+    :param raw_data_list: Raw text of every input
+    :type raw_data_list: List[str]
+
+    :return: Answers to part 1 and part 2 of every input
+    :rtype: List[Tuple[int, int]]
+    """
+    bounds: List[int] = []
+    lengths = []
+    for raw_data in raw_data_list:
+        values = re.findall(r"\d+", raw_data)
+        bounds.extend(map(int, values))
+        lengths.append(len(values) // 4)
+
+    pairs = np.array(bounds, dtype=np.int64).reshape(-1, 4)
+    owners = np.repeat(np.arange(len(lengths)), lengths)
+    contains, overlaps = classify_pairs(pairs)
+
+    counts = [
+        np.bincount(owners, weights=flags, minlength=len(lengths))
+        for flags in (contains, overlaps)
+    ]
+    return list(zip(*(c.astype(np.int64).tolist() for c in counts)))
+
+
 if __name__ == "__main__":  # pragma: no cover
     data = get_raw_data("./src/aoc2022/data/day4.txt")
     parsed_data = parse_data_to_array(data)
 
-    containing_sets = [set_contains_other_set(sets) for sets in parsed_data]
-    containing_count = sum(containing_sets)
+    containing_count = solve_part_1(parsed_data)
 
     print(f"{containing_count} pairs have a set contained by the other.")
 
-    overlapping_sets = [set_overlaps(sets) for sets in parsed_data]
-    overlapping_count = sum(overlapping_sets)
+    overlapping_count = solve_part_2(parsed_data)
 
     print(f"{overlapping_count} pairs overlap.")
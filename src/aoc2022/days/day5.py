@@ -6,19 +6,18 @@ stacks_type = Tuple[List[str], ...]
 moves_type = List[Tuple[int, int, int]]
 
 
-def parse_data(raw_data: str) -> Tuple[stacks_type, moves_type]:
+def parse_data(raw_data: utils.blocks_type) -> Tuple[stacks_type, moves_type]:
     """
     Parses the raw text input into the initial configuration and the move list
 
-    :param raw_data: Raw text data to be parsed
-    :type raw_data: str
+    :param raw_data: Raw text data to be parsed, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
 
     :return: Initial Configuration and move list
     :rtype: List[Tuple[int]]
     """
-    configuration_data, move_data = raw_data.split("\n\n")
+    stack_rows, move_lines = utils.split_blocks(raw_data)
 
-    stack_rows = configuration_data.split("\n")
     reversed_rows = stack_rows[::-1]
     num_stacks = int(reversed_rows[0].split(" ")[-2])
 
@@ -31,7 +30,6 @@ def parse_data(raw_data: str) -> Tuple[stacks_type, moves_type]:
                 stacks[idx].append(value)
 
     moves = []
-    move_lines = move_data.split("\n")
     for move_line in move_lines:
         split_move = move_line.split(" ")
         num_transfer = int(split_move[1])
@@ -104,6 +102,49 @@ def transfer_multiple_items(stacks: stacks_type, moves: moves_type) -> str:
     return "".join(top_boxes)
 
 
+def parse_input(raw_data: utils.blocks_type) -> Tuple[stacks_type, moves_type]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw text data to be parsed, or blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
+
+    :return: Initial Configuration and move list
+    :rtype: Tuple[Tuple[List[str]], List[Tuple[int]]]
+    """
+    return parse_data(raw_data)
+
+
+def solve_part_1(data: Tuple[stacks_type, moves_type]) -> str:
+    """
+    Computes the answer to part 1, moving one box at a time. The stacks are
+    updated in place.
+
+    :param data: Initial Configuration and move list
+    :type data: Tuple[Tuple[List[str]], List[Tuple[int]]]
+
+    :return: value at the top of each stack after moves
+    :rtype: str
+    """
+    stacks, moves = data
+    return transfer_items(stacks, moves)
+
+
+def solve_part_2(data: Tuple[stacks_type, moves_type]) -> str:
+    """
+    Computes the answer to part 2, moving several boxes at a time. The stacks
+    are updated in place.
+
+    :param data: Initial Configuration and move list
+    :type data: Tuple[Tuple[List[str]], List[Tuple[int]]]
+
+    :return: value at the top of each stack after moves
+    :rtype: str
+    """
+    stacks, moves = data
+    return transfer_multiple_items(stacks, moves)
+
+
 if __name__ == "__main__":  # pragma: no cover
     data = utils.get_raw_data("./src/aoc2022/data/day5.txt")
     stacks, moves = parse_data(data)
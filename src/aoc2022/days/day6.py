@@ -1,13 +1,17 @@
+from typing import Union
+
 from src.aoc2022 import utils
 
+sequence_type = Union[str, utils.buffer_type]
+
 
-def detect_start_of_packet(sequence: str, num_distinct: int) -> int:
+def detect_start_of_packet(sequence: sequence_type, num_distinct: int) -> int:
     """
     Identifies the position of the starting packet defined by num_distinct
     consecutive unique characters
 
     :param sequence: Sequence of characters to detect the start packet
-    :type sequence: str
+    :type sequence: Union[str, bytes, mmap.mmap]
 
     :param num_distinct: Number of consecutive distinct characters needed
     :type num_distinct: int
@@ -23,6 +27,49 @@ def detect_start_of_packet(sequence: str, num_distinct: int) -> int:
     return -1
 
 
+def parse_input(raw_data: sequence_type) -> sequence_type:
+    """
+    Parses the puzzle input for the runner. Bytes returned by
+    utils.map_raw_data are used as is, so the datastream is never copied and
+    the mapping must stay open until the parts are solved.
+
+    :param raw_data: Raw text data to be parsed, or bytes
+    :type raw_data: Union[str, bytes, mmap.mmap]
+
+    :return: The datastream buffer
+    :rtype: Union[str, bytes, mmap.mmap]
+    """
+    if isinstance(raw_data, str):
+        return raw_data.strip()
+    return raw_data
+
+
+def solve_part_1(sequence: sequence_type) -> int:
+    """
+    Computes the answer to part 1, the start-of-packet marker
+
+    :param sequence: Sequence of characters to detect the start packet
+    :type sequence: Union[str, bytes, mmap.mmap]
+
+    :return: Position of the end of the starting packet
+    :rtype: int
+    """
+    return detect_start_of_packet(sequence, 4)
+
+
+def solve_part_2(sequence: sequence_type) -> int:
+    """
+    Computes the answer to part 2, the start-of-message marker
+
+    :param sequence: Sequence of characters to detect the start packet
+    :type sequence: Union[str, bytes, mmap.mmap]
+
+    :return: Position of the end of the starting packet
+    :rtype: int
+    """
+    return detect_start_of_packet(sequence, 14)
+
+
 if __name__ == "__main__":  # pragma: no cover
     data = utils.get_raw_data("./src/aoc2022/data/day6.txt")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import Dict, Generator, List, Optional
 
 from src.aoc2022 import utils
@@ -101,18 +102,18 @@ class FileNode:
         return f"FILE : {self.filename} {self.filesize}"
 
 
-def parse_data_to_tree(raw_data: str) -> DirectoryNode:
+def parse_data_to_tree(raw_data: utils.lines_type) -> DirectoryNode:
     """
     Parse the raw data into a tree-structure representing the nodes and files
 
-    :param raw_data: Raw data containing commands
-    :type raw_data: str
+    :param raw_data: Raw data containing commands, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: Root of the directory tree
     :rtype: DirectoryNode
     """
     # get all commands, skip first line for root dir
-    lines = raw_data.split("\n")[1:]
+    lines = itertools.islice(utils.split_lines(raw_data), 1, None)
 
     root = DirectoryNode("/", 0)
     current = root
@@ -196,6 +197,45 @@ def get_smallest_directory_to_delete(
     return min([d.size for d in delete_candidates])
 
 
+def parse_input(raw_data: utils.lines_type) -> DirectoryNode:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data containing commands, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: Root of the directory tree
+    :rtype: DirectoryNode
+    """
+    return parse_data_to_tree(raw_data)
+
+
+def solve_part_1(root: DirectoryNode) -> int:
+    """
+    Computes the answer to part 1, the total size of the small directories
+
+    :param root: root node for the directory/file tree
+    :type root: DirectoryNode
+
+    :return: sum of total sizes for directories under 100_000 bytes
+    :rtype: int
+    """
+    return get_directories_under_size(root, 100_000)
+
+
+def solve_part_2(root: DirectoryNode) -> int:
+    """
+    Computes the answer to part 2, the size of the directory to delete
+
+    :param root: root node for the directory/file tree
+    :type root: DirectoryNode
+
+    :return: size of the directory to delete
+    :rtype: int
+    """
+    return get_smallest_directory_to_delete(root, 70_000_000, 30_000_000)
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     data = utils.get_raw_data("./src/aoc2022/data/day7.txt")
@@ -1,26 +1,34 @@
-from typing import Set, Tuple
+from __future__ import annotations
 
-import numpy as np
+from typing import TYPE_CHECKING, Callable, Dict, List, Set, Tuple
 
-from src.aoc2022 import utils
+from src.aoc2022 import grids, implementations, jit, utils
 
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
 
-def parse_data_to_array(raw_data: str) -> np.ndarray:
+
+DIGITS = grids.make_table({str(digit): digit for digit in range(10)})
+"""
+Translation of the digit characters to tree heights
+"""
+
+
+def parse_data_to_array(raw_data: grids.grid_source_type) -> np.ndarray:
     """
-    Parse the raw data into a 2D list of lists
+    Parse the raw data into a 2D array of tree heights
 
-    :param raw_data: Raw data containing numerical data
-    :type raw_data: str
+    :param raw_data: Raw data containing numerical data, bytes or lines
+    :type raw_data: Union[str, bytes, mmap.mmap, Iterable[str]]
 
     :return: parsed matrix of values
-    :rtype: List[List[int]]
+    :rtype: np.ndarray
     """
-    outer_list = []
-    for line in raw_data.split("\n"):
-        inner_list = [int(e) for e in line]
-        outer_list.append(inner_list)
-
-    return np.array(outer_list)
+    heights, _ = grids.load_grid(raw_data, DIGITS)
+    # signed, so that heights can be compared with -1 and subtracted
+    return heights.view(np.int8)
 
 
 def scan_height_row(height_map: np.ndarray) -> Set[int]:
@@ -146,6 +154,51 @@ def compute_scenic_score(height_map: np.ndarray, pos: Tuple[int, int]) -> int:
     return top_view * bot_view * left_view * right_view
 
 
+@jit.accelerates(compute_scenic_score)
+@jit.kernel
+def compute_scenic_score_compiled(
+    height_map: np.ndarray,
+    pos: Tuple[int, int],
+) -> int:
+    """
+    Compute the scenic view given a starting position, compiled by Numba
+
+    :param height_map: 2D array of heights
+    :type height_map: np.ndarray
+
+    :param pos: tuple of (x, y) positions in the grid
+    :type pos: Tuple[int, int]
+
+    :return: Scenic score of the position given
+    :rtype: int
+    """
+    height, width = height_map.shape
+    x, y = pos
+    start_height = height_map[y, x]
+    score = 1
+
+    # each direction counts the trees up to the first one as tall
+    for step in (-1, 1):
+        view = 0
+        i = x + step
+        while 0 <= i < width:
+            view += 1
+            if height_map[y, i] >= start_height:
+                break
+            i += step
+        score *= view
+
+        view = 0
+        j = y + step
+        while 0 <= j < height:
+            view += 1
+            if height_map[j, x] >= start_height:
+                break
+            j += step
+        score *= view
+    return score
+
+
 def get_max_scenic_score(height_map: np.ndarray) -> int:
     """
     Find the maximum scenic score given the height map
@@ -167,6 +220,194 @@ def get_max_scenic_score(height_map: np.ndarray) -> int:
     return max_
 
 
+def parse_input(raw_data: utils.lines_type) -> np.ndarray:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data containing numerical data, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: parsed matrix of values
+    :rtype: np.ndarray
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(height_map: np.ndarray) -> int:
+    """
+    Computes the answer to part 1, the number of visible trees
+
+    :param height_map: 2D array of heights
+    :type height_map: np.ndarray
+
+    :return: Total count of trees visible from perimeter
+    :rtype: int
+    """
+    return count_visible_trees(height_map)
+
+
+def solve_part_2(height_map: np.ndarray) -> int:
+    """
+    Computes the answer to part 2, the best scenic score
+
+    :param height_map: 2D array of heights
+    :type height_map: np.ndarray
+
+    :return: Maximum possible scenic score
+    :rtype: int
+    """
+    return int(get_max_scenic_score(height_map))
+
+
+def is_visible_from_left(heights: np.ndarray) -> np.ndarray:
+    """
+    Check which trees of a stack of height maps are visible from the first
+    column
+
+    :param heights: 3D array of heights, one height map per input
+    :type heights: np.ndarray
+
+    :return: whether each tree is taller than every tree on its left
+    :rtype: np.ndarray
+    """
+    previous_max = np.full(heights.shape, -1, dtype=heights.dtype)
+    previous_max[..., 1:] = np.maximum.accumulate(heights, axis=2)[..., :-1]
+    return heights > previous_max
+
+
+def count_trees_seen_on_left(heights: np.ndarray) -> np.ndarray:
+    """
+    Count the trees every tree of a stack of height maps sees towards the
+    first column, up to the first one at least as tall
+
+    :param heights: 3D array of heights, one height map per input
+    :type heights: np.ndarray
+
+    :return: viewing distance of each tree on its left
+    :rtype: np.ndarray
+    """
+    columns = np.arange(heights.shape[2])
+    distance = np.zeros(heights.shape, dtype=np.int64)
+    blocker = np.zeros(heights.shape, dtype=np.int64)
+
+    # one pass per tree height, 10 at most, instead of one per column
+    for level in np.unique(heights):
+        # column of the last tree at least this tall, the edge one if none
+        tall_columns = np.where(heights >= level, columns, 0)
+        last_tall = np.maximum.accumulate(tall_columns, axis=2)
+        blocker[..., 1:] = last_tall[..., :-1]
+        at_level = heights == level
+        distance[at_level] = (columns - blocker)[at_level]
+    return distance
+
+
+def look_from_each_side(
+    look_left: Callable[[np.ndarray], np.ndarray], heights: np.ndarray
+) -> List[np.ndarray]:
+    """
+    Apply a function looking left to the 4 rotations of a stack of height
+    maps, so that every tree looks in the 4 directions
+
+    :param look_left: function of a 3D array of heights looking left
+    :type look_left: Callable[[np.ndarray], np.ndarray]
+
+    :param heights: 3D array of heights, one height map per input
+    :type heights: np.ndarray
+
+    :return: result of each direction, in the orientation of heights
+    :rtype: List[np.ndarray]
+    """
+    results = []
+    for turns in range(4):
+        rotated = look_left(np.rot90(heights, turns, axes=(1, 2)))
+        results.append(np.rot90(rotated, -turns, axes=(1, 2)))
+    return results
+
+
+def find_visible_trees(heights: np.ndarray) -> np.ndarray:
+    """
+    Check which trees of a stack of height maps are visible from an edge
+
+    :param heights: 3D array of heights, one height map per input
+    :type heights: np.ndarray
+
+    :return: whether each tree is visible
+    :rtype: np.ndarray
+    """
+    sides = look_from_each_side(is_visible_from_left, heights)
+    return np.logical_or.reduce(sides)
+
+
+def compute_scenic_scores(heights: np.ndarray) -> np.ndarray:
+    """
+    Compute the scenic score of every tree of a stack of height maps
+
+    :param heights: 3D array of heights, one height map per input
+    :type heights: np.ndarray
+
+    :return: scenic score of each tree
+    :rtype: np.ndarray
+    """
+    sides = look_from_each_side(count_trees_seen_on_left, heights)
+    return np.prod(sides, axis=0)
+
+
+@implementations.implements(count_visible_trees, "vectorized")
+def count_visible_trees_vectorized(height_map: np.ndarray) -> int:
+    """
+    Count number of trees visible from perimeter, with find_visible_trees
+
+    :param height_map: 2D array of heights
+    :type height_map: np.ndarray
+
+    :return: Total count of trees visible from perimeter
+    :rtype: int
+    """
+    return int(find_visible_trees(height_map[np.newaxis]).sum())
+
+
+@implementations.implements(get_max_scenic_score, "vectorized")
+def get_max_scenic_score_vectorized(height_map: np.ndarray) -> int:
+    """
+    Find the maximum scenic score given the height map, with
+    compute_scenic_scores
+
+    :param height_map: 2D array of heights
+    :type height_map: np.ndarray
+
+    :return: Maximum possible scenic score
+    :rtype: int
+    """
+    return int(compute_scenic_scores(height_map[np.newaxis]).max())
+
+
+def solve_batch(raw_data_list: List[str]) -> List[Tuple[int, int]]:
+    """
+    Solves both parts for many inputs at once. Height maps of the same
+    shape are stacked, then every tree of the stack looks in the 4
+    directions at once.
+
+    :param raw_data_list: Raw text of every input
+    :type raw_data_list: List[str]
+
+    :return: Answers to part 1 and part 2 of every input
+    :rtype: List[Tuple[int, int]]
+    """
+    height_maps = [parse_data_to_array(raw) for raw in raw_data_list]
+    shapes: Dict[Tuple[int, ...], List[int]] = {}
+    for index, height_map in enumerate(height_maps):
+        shapes.setdefault(height_map.shape, []).append(index)
+
+    answers = [(0, 0)] * len(height_maps)
+    for indices in shapes.values():
+        heights = np.stack([height_maps[index] for index in indices])
+        visible = find_visible_trees(heights)
+        scores = compute_scenic_scores(heights)
+        for index, map_visible, map_scores in zip(indices, visible, scores):
+            answers[index] = (int(map_visible.sum()), int(map_scores.max()))
+    return answers
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     data = utils.get_raw_data("./src/aoc2022/data/day8.txt")
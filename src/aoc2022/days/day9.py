@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 import math
 from enum import Enum
-from typing import List, Set, Tuple
+from typing import TYPE_CHECKING, List, Set, Tuple
 
-import numpy as np
+from src.aoc2022 import jit, profiling, utils
 
-from src.aoc2022 import utils
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
 
 
 class Move(Enum):
@@ -30,24 +35,49 @@ class Move(Enum):
     """
 
 
-def parse_data_to_array(raw_data: str) -> List[Tuple[Move, int]]:
+STEPS = {
+    Move.LEFT: (-1, 0),
+    Move.RIGHT: (1, 0),
+    Move.UP: (0, 1),
+    Move.DOWN: (0, -1),
+}
+"""
+Change of the head position for every move
+"""
+
+
+def parse_data_to_array(raw_data: utils.lines_type) -> List[Tuple[Move, int]]:
     """
     Parse the raw data into a 1D list of move Tuples
 
-    :param raw_data: Raw data containing numerical data
-    :type raw_data: str
+    :param raw_data: Raw data containing numerical data, or lines
+    :type raw_data: Union[str, Iterable[str]]
 
     :return: parsed matrix of values
     :rtype: List[Tuple[Move, int]]
     """
     parsed_list = []
-    for line in raw_data.split("\n"):
+    for line in utils.split_lines(raw_data):
         move, count = line.split(" ")
         parsed_list.append((Move(move), int(count)))
 
     return parsed_list
 
 
+def sign(value: int) -> int:
+    """
+    Sign of an integer, without the cost of a NumPy call on a scalar
+
+    :param value: integer to get the sign of
+    :type value: int
+
+    :return: -1, 0 or 1
+    :rtype: int
+    """
+    return (value > 0) - (value < 0)
+
+
+@profiling.profiled
 def get_tail_update(
     head_pos: Tuple[int, int], tail_pos: Tuple[int, int]
 ) -> Tuple[int, int]:
@@ -58,8 +88,8 @@ def get_tail_update(
     L2_distance = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
 
     if L2_distance >= 2:
-        x_move = np.sign(x1 - x2)
-        y_move = np.sign(y1 - y2)
+        x_move = sign(x1 - x2)
+        y_move = sign(y1 - y2)
 
         return (x2 + x_move, y2 + y_move)
     else:
@@ -114,6 +144,118 @@ def get_multi_knot_positions(
     return unique_positions
 
 
+@jit.kernel
+def move_knots(
+    steps: np.ndarray,
+    counts: np.ndarray,
+    num_knots: int,
+) -> np.ndarray:
+    """
+    Compiled loop of get_multi_knot_positions
+
+    :param steps: (dx, dy) change of the head position of every move
+    :type steps: np.ndarray
+
+    :param counts: number of times every move is repeated
+    :type counts: np.ndarray
+
+    :param num_knots: number of knots in the rope
+    :type num_knots: int
+
+    :return: unique (x, y) positions visited by the tail
+    :rtype: np.ndarray
+    """
+    # no knot goes further than the total number of steps, which bounds
+    # the keys of the positions
+    reach = counts.sum()
+    width = 2 * reach + 1
+    knots = np.zeros((num_knots, 2), dtype=np.int64)
+    keys = np.empty(reach, dtype=np.int64)
+    done = 0
+    for move in range(len(steps)):
+        for _ in range(counts[move]):
+            knots[0, 0] += steps[move, 0]
+            knots[0, 1] += steps[move, 1]
+            for j in range(1, num_knots):
+                dx = knots[j - 1, 0] - knots[j, 0]
+                dy = knots[j - 1, 1] - knots[j, 1]
+                # same as an L2 distance of at least 2
+                if dx * dx + dy * dy >= 4:
+                    knots[j, 0] += (dx > 0) - (dx < 0)
+                    knots[j, 1] += (dy > 0) - (dy < 0)
+            tail_x = knots[num_knots - 1, 0] + reach
+            tail_y = knots[num_knots - 1, 1] + reach
+            keys[done] = tail_x * width + tail_y
+            done += 1
+
+    unique_keys = np.unique(keys)
+    positions = np.empty((len(unique_keys), 2), dtype=np.int64)
+    positions[:, 0] = unique_keys // width - reach
+    positions[:, 1] = unique_keys % width - reach
+    return positions
+
+
+@jit.accelerates(get_multi_knot_positions)
+def get_multi_knot_positions_compiled(
+    moves: List[Tuple[Move, int]], num_knots: int
+) -> Set[Tuple[int, int]]:
+    """
+    Find the positions visited by the tail of a rope with a compiled loop
+
+    :param moves: list of moves applied to the head
+    :type moves: List[Tuple[Move, int]]
+
+    :param num_knots: number of knots in the rope
+    :type num_knots: int
+
+    :return: unique tail positions
+    :rtype: Set[Tuple[int, int]]
+    """
+    steps = np.array([STEPS[move] for move, _ in moves], dtype=np.int64)
+    counts = np.array([count for _, count in moves], dtype=np.int64)
+    positions = move_knots(steps.reshape(-1, 2), counts, num_knots)
+    return set(zip(positions[:, 0].tolist(), positions[:, 1].tolist()))
+
+
+def parse_input(raw_data: utils.lines_type) -> List[Tuple[Move, int]]:
+    """
+    Parses the puzzle input for the runner
+
+    :param raw_data: Raw data containing the moves, or lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: parsed list of moves
+    :rtype: List[Tuple[Move, int]]
+    """
+    return parse_data_to_array(raw_data)
+
+
+def solve_part_1(moves: List[Tuple[Move, int]]) -> int:
+    """
+    Computes the answer to part 1, the positions visited by a 2-knot tail
+
+    :param moves: list of moves applied to the head
+    :type moves: List[Tuple[Move, int]]
+
+    :return: number of unique tail positions
+    :rtype: int
+    """
+    return len(get_knot_positions(moves))
+
+
+def solve_part_2(moves: List[Tuple[Move, int]]) -> int:
+    """
+    Computes the answer to part 2, the positions visited by a 10-knot tail
+
+    :param moves: list of moves applied to the head
+    :type moves: List[Tuple[Move, int]]
+
+    :return: number of unique tail positions
+    :rtype: int
+    """
+    return len(get_multi_knot_positions(moves, 10))
+
+
 if __name__ == "__main__":  # pragma: no cover
 
     data = utils.get_raw_data("./src/aoc2022/data/day9.txt")
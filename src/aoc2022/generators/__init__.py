@@ -0,0 +1,136 @@
+import importlib
+import random
+from types import ModuleType
+from typing import Iterator
+
+CHUNK_SIZE = 1 << 16
+"""
+Approximate number of characters buffered before a chunk is emitted
+"""
+
+
+def get_generator(day: int) -> ModuleType:
+    """
+    Get the generator module for a day
+
+    :param day: day number
+    :type day: int
+
+    :return: the ``generators.dayN`` module
+    :rtype: ModuleType
+    """
+    try:
+        return importlib.import_module(f"{__name__}.day{day}")
+    except ModuleNotFoundError:
+        raise ValueError(f"No input generator for day {day}")
+
+
+def scaled_count(base_count: int, scale: float) -> int:
+    """
+    Scale a base item count, keeping at least one item
+
+    :param base_count: number of items at scale 1
+    :type base_count: int
+
+    :param scale: multiplier applied to the base count
+    :type scale: float
+
+    :return: scaled item count
+    :rtype: int
+    """
+    if scale <= 0:
+        raise ValueError(f"Invalid scale {scale}")
+    return max(1, int(round(base_count * scale)))
+
+
+def iter_input(day: int, scale: float = 1.0, seed: int = 0) -> Iterator[str]:
+    """
+    Generate a puzzle input as a stream of text chunks, so that inputs far
+    larger than memory can be written to disk. A scale of 1 produces an
+    input of roughly the same size as the real puzzle input.
+
+    :param day: day number
+    :type day: int
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param seed: seed for the random number generator
+    :type seed: int
+
+    :return: generator of text chunks, which concatenate to the input
+    :rtype: Iterator[str]
+    """
+    generator = get_generator(day)
+    rng = random.Random(seed)
+
+    # single line inputs provide their own chunking
+    if hasattr(generator, "iter_chunks"):
+        yield from generator.iter_chunks(scale, rng)
+        return
+
+    buffer = []
+    buffered = 0
+    first = True
+    for line in generator.iter_lines(scale, rng):
+        if not first:
+            buffer.append("\n")
+        buffer.append(line)
+        buffered += len(line) + 1
+        first = False
+        if buffered >= CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def generate_input(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """
+    Generate a puzzle input in memory
+
+    :param day: day number
+    :type day: int
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param seed: seed for the random number generator
+    :type seed: int
+
+    :return: the generated puzzle input
+    :rtype: str
+    """
+    return "".join(iter_input(day, scale, seed))
+
+
+def write_input(
+    day: int,
+    file_path: str,
+    scale: float = 1.0,
+    seed: int = 0,
+) -> int:
+    """
+    Generate a puzzle input and stream it to a file
+
+    :param day: day number
+    :type day: int
+
+    :param file_path: path of the file to write
+    :type file_path: str
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param seed: seed for the random number generator
+    :type seed: int
+
+    :return: number of characters written
+    :rtype: int
+    """
+    num_chars = 0
+    with open(file_path, "w", newline="\n") as file:
+        for chunk in iter_input(day, scale, seed):
+            num_chars += file.write(chunk)
+    return num_chars
@@ -0,0 +1,21 @@
+import argparse
+import sys
+
+from src.aoc2022 import generators
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        prog="python -m src.aoc2022.generators",
+        description="Generate a synthetic puzzle input for a day.",
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    if args.output is None:
+        for chunk in generators.iter_input(args.day, args.scale, args.seed):
+            sys.stdout.write(chunk)
+    else:
+        generators.write_input(args.day, args.output, args.scale, args.seed)
@@ -0,0 +1,30 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_GROUPS = 250
+"""
+Number of groups in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate groups of calorie counts separated by blank lines
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    num_groups = scaled_count(BASE_NUM_GROUPS, scale)
+    for i in range(num_groups):
+        if i > 0:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1_000, 70_000))
@@ -0,0 +1,33 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_INSTRUCTIONS = 140
+"""
+Number of instructions in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate CPU instructions, one per line
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    register_value = 1
+    for _ in range(scaled_count(BASE_NUM_INSTRUCTIONS, scale)):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            # pull the register back towards the screen so it stays visible
+            value = rng.randint(-20, 20) + (20 - register_value) // 4
+            register_value += value
+            yield f"addx {value}"
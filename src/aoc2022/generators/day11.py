@@ -0,0 +1,59 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_MONKEYS = 8
+"""
+Number of monkeys in an input of scale 1
+"""
+
+DIVISORS = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+"""
+Candidate divisors for the monkey tests, which bound their common multiple
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate monkey descriptions separated by blank lines. Monkeys never
+    throw items to themselves. Inputs never shrink below the base number of
+    monkeys, with fewer monkeys the items keep going through the squaring
+    monkey and the worry levels explode.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    num_monkeys = scaled_count(BASE_NUM_MONKEYS, scale)
+    num_monkeys = max(BASE_NUM_MONKEYS, num_monkeys)
+    # like the real input, a single monkey squares the worry level
+    squaring_monkey = rng.randrange(num_monkeys)
+    for idx in range(num_monkeys):
+        if idx > 0:
+            yield ""
+
+        items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))]
+
+        if idx == squaring_monkey:
+            operation = "old * old"
+        elif rng.random() < 0.5:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+
+        targets = [i for i in range(num_monkeys) if i != idx]
+        true_throw = rng.choice(targets)
+        false_throw = rng.choice(targets)
+
+        yield f"Monkey {idx}:"
+        yield f"  Starting items: {', '.join(items)}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {rng.choice(DIVISORS)}"
+        yield f"    If true: throw to monkey {true_throw}"
+        yield f"    If false: throw to monkey {false_throw}"
@@ -0,0 +1,56 @@
+import math
+import random
+import string
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_WIDTH = 172
+"""
+Width of the height map in an input of scale 1
+"""
+
+BASE_HEIGHT = 41
+"""
+Height of the height map in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate a height map rising from west to east, dotted with sinkholes.
+    The row of ``S`` and the last column are kept clear of sinkholes so the
+    end is always reachable from the start. The scale applies to the area.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    side_scale = math.sqrt(scale)
+    width = max(26, scaled_count(BASE_WIDTH, side_scale))
+    height = scaled_count(BASE_HEIGHT, side_scale)
+
+    letters = string.ascii_lowercase
+    base_heights = [x * 26 // width for x in range(width)]
+
+    start_row = rng.randrange(height)
+    end_row = rng.randrange(height)
+
+    for y in range(height):
+        row = []
+        for x, base_height in enumerate(base_heights):
+            cell_height = base_height
+            is_clear = y == start_row or x == width - 1
+            if not is_clear and rng.random() < 0.1:
+                cell_height = max(0, base_height - rng.randint(1, 3))
+            row.append(letters[cell_height])
+        if y == start_row:
+            row[0] = "S"
+        if y == end_row:
+            row[-1] = "E"
+        yield "".join(row)
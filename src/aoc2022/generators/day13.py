@@ -0,0 +1,54 @@
+import json
+import random
+from typing import Iterator
+
+from src.aoc2022.days.day13 import val_type
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_PAIRS = 150
+"""
+Number of packet pairs in an input of scale 1
+"""
+
+MAX_DEPTH = 4
+"""
+Maximum nesting depth of the generated packets
+"""
+
+
+def random_packet(rng: random.Random, depth: int = 0) -> val_type:
+    """
+    Draw a random packet value
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :param depth: nesting depth of the value being drawn
+    :type depth: int
+
+    :return: random packet value
+    :rtype: Union[List, int]
+    """
+    if depth > 0 and (depth >= MAX_DEPTH or rng.random() < 0.5):
+        return rng.randint(0, 10)
+    return [random_packet(rng, depth + 1) for _ in range(rng.randint(0, 7))]
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate pairs of packets separated by blank lines
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    for i in range(scaled_count(BASE_NUM_PAIRS, scale)):
+        if i > 0:
+            yield ""
+        for _ in range(2):
+            yield json.dumps(random_packet(rng), separators=(",", ":"))
@@ -0,0 +1,58 @@
+import math
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_PATHS = 150
+"""
+Number of rock paths in an input of scale 1
+"""
+
+BASE_WIDTH = 80
+"""
+Horizontal extent of the rock paths in an input of scale 1
+"""
+
+BASE_DEPTH = 160
+"""
+Vertical extent of the rock paths in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate rock paths made of alternating horizontal and vertical segments
+    below the sand source at (500, 0). The extent of the cave grows with the
+    square root of the scale so its area grows with the scale.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    side_scale = math.sqrt(scale)
+    half_width = scaled_count(BASE_WIDTH, side_scale) // 2
+    depth = scaled_count(BASE_DEPTH, side_scale)
+
+    min_x, max_x = 500 - half_width, 500 + half_width
+    min_y, max_y = 12, 12 + depth
+
+    for _ in range(scaled_count(BASE_NUM_PATHS, scale)):
+        x = rng.randint(min_x, max_x)
+        y = rng.randint(min_y, max_y)
+        points = [f"{x},{y}"]
+        horizontal = rng.random() < 0.5
+        for _ in range(rng.randint(1, 4)):
+            step = rng.choice([-1, 1]) * rng.randint(1, 6)
+            if horizontal:
+                x = min(max_x, max(min_x, x + step))
+            else:
+                y = min(max_y, max(min_y, y + step))
+            points.append(f"{x},{y}")
+            horizontal = not horizontal
+        yield " -> ".join(points)
@@ -0,0 +1,42 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_SENSORS = 26
+"""
+Number of sensors in an input of scale 1
+"""
+
+MAX_COORDINATE = 4_000_000
+"""
+Sensors are placed in the square [0, MAX_COORDINATE]
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate sensors and their closest beacons, one pair per line. The
+    sensors are placed uniformly at random, so unlike the real input the
+    search area is not guaranteed to have exactly one uncovered position.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    max_radius = MAX_COORDINATE // 4
+    for _ in range(scaled_count(BASE_NUM_SENSORS, scale)):
+        sensor_x = rng.randint(0, MAX_COORDINATE)
+        sensor_y = rng.randint(0, MAX_COORDINATE)
+        radius = rng.randint(1, max_radius)
+        dx = rng.randint(-radius, radius)
+        dy = rng.choice([-1, 1]) * (radius - abs(dx))
+        yield (
+            f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at "
+            f"x={sensor_x + dx}, y={sensor_y + dy}"
+        )
@@ -0,0 +1,78 @@
+import random
+import string
+from typing import Iterator, List, Set
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_VALVES = 60
+"""
+Number of valves in an input of scale 1
+"""
+
+NUM_WORKING_VALVES = 15
+"""
+Maximum number of valves with a non-zero flow rate. The search is
+exponential in this number, so it does not grow with the scale.
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate a connected network of valves that includes the start ``AA``.
+    The scale grows the number of valves and tunnels.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    num_valves = max(2, scaled_count(BASE_NUM_VALVES, scale))
+
+    name_length = 2
+    while len(string.ascii_uppercase) ** name_length < num_valves:
+        name_length += 1
+
+    def to_name(index: int) -> str:
+        letters = []
+        for _ in range(name_length):
+            index, remainder = divmod(index, len(string.ascii_uppercase))
+            letters.append(string.ascii_uppercase[remainder])
+        return "".join(reversed(letters))
+
+    # index 0 is the start valve AA
+    num_names = len(string.ascii_uppercase) ** name_length
+    indices = [0] + rng.sample(range(1, num_names), num_valves - 1)
+    names = [to_name(index) for index in indices]
+    start = names[0]
+    rng.shuffle(names)
+
+    # random spanning tree so the network is connected, plus extra tunnels
+    tunnels: List[Set[int]] = [set() for _ in range(num_valves)]
+    for i in range(1, num_valves):
+        j = rng.randrange(i)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    for _ in range(num_valves // 2):
+        i, j = rng.randrange(num_valves), rng.randrange(num_valves)
+        if i != j:
+            tunnels[i].add(j)
+            tunnels[j].add(i)
+
+    working = [i for i in range(num_valves) if names[i] != start]
+    working = rng.sample(working, min(NUM_WORKING_VALVES, len(working)))
+    flow_rates = [0] * num_valves
+    for i in working:
+        flow_rates[i] = rng.randint(3, 25)
+
+    for i in range(num_valves):
+        neighbours = [names[j] for j in sorted(tunnels[i])]
+        rng.shuffle(neighbours)
+        if len(neighbours) == 1:
+            connections = f"tunnel leads to valve {neighbours[0]}"
+        else:
+            connections = f"tunnels lead to valves {', '.join(neighbours)}"
+        yield f"Valve {names[i]} has flow rate={flow_rates[i]}; {connections}"
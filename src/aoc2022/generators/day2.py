@@ -0,0 +1,27 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_ROUNDS = 2_500
+"""
+Number of rounds in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate rounds of rock-paper-scissors, one per line
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    rounds = [f"{left} {right}" for left in "ABC" for right in "XYZ"]
+    for _ in range(scaled_count(BASE_NUM_ROUNDS, scale)):
+        yield rng.choice(rounds)
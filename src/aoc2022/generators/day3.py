@@ -0,0 +1,67 @@
+import random
+import string
+from typing import Iterator, List
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_GROUPS = 100
+"""
+Number of groups of 3 rucksacks in an input of scale 1
+"""
+
+
+def make_compartment(
+    letters: List[str], required: List[str], rng: random.Random
+) -> List[str]:
+    """
+    Draw the items of a compartment, making sure the required items are in it
+
+    :param letters: letters that can be used to fill the compartment
+    :type letters: List[str]
+
+    :param required: letters that must appear in the compartment
+    :type required: List[str]
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: shuffled items of the compartment
+    :rtype: List[str]
+    """
+    size = rng.randint(8, 16)
+    items = required + rng.choices(letters, k=size - len(required))
+    rng.shuffle(items)
+    return items
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate rucksacks in groups of 3. Each rucksack shares exactly one item
+    type between its compartments and each group shares exactly one badge.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    alphabet = list(string.ascii_letters)
+    for _ in range(scaled_count(BASE_NUM_GROUPS, scale)):
+        letters = alphabet.copy()
+        rng.shuffle(letters)
+        badge = letters.pop()
+        for i in range(3):
+            # each elf gets a private set of 17 letters so only the badge is
+            # common to the whole group
+            private = letters[17 * i : 17 * (i + 1)]  # noqa: E203
+            shared = private[0]
+            left = make_compartment(private[1:9], [shared, badge], rng)
+            right = make_compartment(private[9:], [shared], rng)
+            # both compartments must have the same size
+            size = max(len(left), len(right))
+            left += rng.choices(private[1:9], k=size - len(left))
+            right += rng.choices(private[9:], k=size - len(right))
+            yield "".join(left) + "".join(right)
@@ -0,0 +1,28 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_PAIRS = 1_000
+"""
+Number of pairs of sections in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate pairs of section assignments, one pair per line
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    for _ in range(scaled_count(BASE_NUM_PAIRS, scale)):
+        first_start, first_end = sorted(rng.randint(1, 99) for _ in range(2))
+        second_start, second_end = sorted(rng.randint(1, 99) for _ in range(2))
+        yield f"{first_start}-{first_end},{second_start}-{second_end}"
@@ -0,0 +1,48 @@
+import random
+import string
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+NUM_STACKS = 9
+"""
+Number of stacks, the input format only supports single digit labels
+"""
+
+BASE_NUM_MOVES = 500
+"""
+Number of moves in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate the starting stacks followed by a list of moves. Moves never
+    take more crates than the source stack holds.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    heights = [rng.randint(1, 8) for _ in range(NUM_STACKS)]
+    for level in range(max(heights), 0, -1):
+        cells = [
+            f"[{rng.choice(string.ascii_uppercase)}]" if h >= level else "   "
+            for h in heights
+        ]
+        yield " ".join(cells)
+    yield " ".join(f" {i + 1} " for i in range(NUM_STACKS))
+    yield ""
+
+    for _ in range(scaled_count(BASE_NUM_MOVES, scale)):
+        start = rng.choice([i for i, h in enumerate(heights) if h > 0])
+        stop = rng.choice([i for i in range(NUM_STACKS) if i != start])
+        num_crates = rng.randint(1, heights[start])
+        heights[start] -= num_crates
+        heights[stop] += num_crates
+        yield f"move {num_crates} from {start + 1} to {stop + 1}"
@@ -0,0 +1,43 @@
+import random
+import string
+from typing import Iterator
+
+from src.aoc2022.generators import CHUNK_SIZE, scaled_count
+
+BASE_LENGTH = 4_096
+"""
+Length of the datastream in an input of scale 1
+"""
+
+MARKER_LENGTH = 14
+"""
+Length of the run of distinct characters placed at the end of the stream
+"""
+
+
+def iter_chunks(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate a datastream whose start-of-packet and start-of-message markers
+    are both at its very end, so that detectors have to scan all of it. The
+    body only uses 3 distinct characters so no earlier marker exists.
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of text chunks, which concatenate to the stream
+    :rtype: Iterator[str]
+    """
+    length = max(MARKER_LENGTH, scaled_count(BASE_LENGTH, scale))
+    alphabet = list(string.ascii_lowercase)
+    rng.shuffle(alphabet)
+    body_alphabet = alphabet[:3]
+
+    remaining = length - MARKER_LENGTH
+    while remaining > 0:
+        size = min(remaining, CHUNK_SIZE)
+        yield "".join(rng.choices(body_alphabet, k=size))
+        remaining -= size
+    yield "".join(alphabet[3 : 3 + MARKER_LENGTH])  # noqa: E203
@@ -0,0 +1,101 @@
+import math
+import random
+import string
+from typing import Iterator, List, Set, Tuple
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_DIRECTORIES = 200
+"""
+Number of directories in an input of scale 1
+"""
+
+
+def random_name(rng: random.Random) -> str:
+    """
+    Draw a random file or directory name
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: random lowercase name
+    :rtype: str
+    """
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+
+
+def list_directory(
+    num_subdirectories: int, rng: random.Random
+) -> Tuple[List[str], List[str]]:
+    """
+    Draw the content of a directory and the matching ``ls`` output
+
+    :param num_subdirectories: number of subdirectories to create
+    :type num_subdirectories: int
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: names of the subdirectories and lines of the ``ls`` command
+    :rtype: Tuple[List[str], List[str]]
+    """
+    names: Set[str] = set()
+    while len(names) < num_subdirectories:
+        names.add(random_name(rng))
+    subdirectories = sorted(names)
+
+    entries = [f"dir {name}" for name in subdirectories]
+    for _ in range(rng.randint(0, 4)):
+        filename = random_name(rng)
+        if rng.random() < 0.5:
+            filename += "." + random_name(rng)[:3]
+        entries.append(f"{rng.randint(1_000, 300_000)} {filename}")
+    rng.shuffle(entries)
+
+    return subdirectories, ["$ ls"] + entries
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate a terminal session exploring a random directory tree depth
+    first, the tree is never materialized
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    budget = scaled_count(BASE_NUM_DIRECTORIES, scale) - 1
+    # every directory above the max depth has at least one child while the
+    # budget lasts, which leaves enough room for all the directories
+    max_depth = max(8, math.ceil(math.log2(budget + 1)) + 4)
+
+    def draw_num_subdirectories(depth: int) -> int:
+        if budget <= 0 or depth >= max_depth:
+            return 0
+        return min(budget, rng.randint(1, 4))
+
+    yield "$ cd /"
+    subdirectories, lines = list_directory(draw_num_subdirectories(0), rng)
+    budget -= len(subdirectories)
+    yield from lines
+
+    stack = [(subdirectories, 0)]
+    while stack:
+        pending, depth = stack[-1]
+        if pending:
+            dirname = pending.pop()
+            yield f"$ cd {dirname}"
+            num_subdirectories = draw_num_subdirectories(depth + 1)
+            subdirectories, lines = list_directory(num_subdirectories, rng)
+            budget -= len(subdirectories)
+            yield from lines
+            stack.append((subdirectories, depth + 1))
+        else:
+            stack.pop()
+            if stack:
+                yield "$ cd .."
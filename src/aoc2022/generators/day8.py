@@ -0,0 +1,29 @@
+import math
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_SIDE = 99
+"""
+Side length of the square grid in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate a square grid of tree heights, the scale applies to the area
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    side = scaled_count(BASE_SIDE, math.sqrt(scale))
+    digits = "0123456789"
+    for _ in range(side):
+        yield "".join(rng.choices(digits, k=side))
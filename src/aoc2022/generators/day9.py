@@ -0,0 +1,26 @@
+import random
+from typing import Iterator
+
+from src.aoc2022.generators import scaled_count
+
+BASE_NUM_MOVES = 2_000
+"""
+Number of moves in an input of scale 1
+"""
+
+
+def iter_lines(scale: float, rng: random.Random) -> Iterator[str]:
+    """
+    Generate moves of the head of the rope, one per line
+
+    :param scale: size multiplier relative to the real puzzle input
+    :type scale: float
+
+    :param rng: random number generator
+    :type rng: random.Random
+
+    :return: generator of input lines
+    :rtype: Iterator[str]
+    """
+    for _ in range(scaled_count(BASE_NUM_MOVES, scale)):
+        yield f"{rng.choice('LRUD')} {rng.randint(1, 20)}"
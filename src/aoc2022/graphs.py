@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+
+from src.aoc2022 import jit, utils
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
+
+NODE_DTYPE = "int32"
+"""
+Type of the node numbers stored in the graphs, enough for 10k x 10k grids
+"""
+
+GRID_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+"""
+Moves between neighbouring cells of a grid
+"""
+
+
+class CSRGraph(NamedTuple):
+    """
+    Data class representing a directed graph in compressed sparse row
+    form, the neighbours of node i being
+    ``targets[offsets[i]:offsets[i + 1]]``
+
+    :param offsets: start of the neighbours of every node in targets, plus
+        the total number of edges
+    :type offsets: np.ndarray
+
+    :param targets: neighbours of every node, node after node
+    :type targets: np.ndarray
+    """
+
+    offsets: np.ndarray
+    targets: np.ndarray
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes of the graph"""
+        return len(self.offsets) - 1
+
+
+def from_grid(
+    values: np.ndarray,
+    can_move: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> CSRGraph:
+    """
+    Build the graph of the moves between neighbouring cells of a grid. The
+    node of a cell is its index in the flattened grid, see
+    ``np.ravel_multi_index``.
+
+    :param values: 2D grid of cell values
+    :type values: np.ndarray
+
+    :param can_move: given the values of the cells moved from and of the
+        cells moved to, flags whether each move is allowed
+    :type can_move: Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+    :return: the graph
+    :rtype: CSRGraph
+    """
+    num_rows, num_columns = values.shape
+    nodes = np.arange(values.size, dtype=NODE_DTYPE).reshape(values.shape)
+    shape = (num_rows, num_columns, len(GRID_STEPS))
+    neighbours = np.zeros(shape, dtype=NODE_DTYPE)
+    allowed = np.zeros(shape, dtype=bool)
+    for step, (dx, dy) in enumerate(GRID_STEPS):
+        # cells that have a neighbour in this direction, and the neighbours
+        rows = slice(max(-dx, 0), num_rows - max(dx, 0))
+        columns = slice(max(-dy, 0), num_columns - max(dy, 0))
+        next_rows = slice(max(dx, 0), num_rows - max(-dx, 0))
+        next_columns = slice(max(dy, 0), num_columns - max(-dy, 0))
+
+        neighbours[rows, columns, step] = nodes[next_rows, next_columns]
+        allowed[rows, columns, step] = can_move(
+            values[rows, columns], values[next_rows, next_columns]
+        )
+
+    # the cells are in node order, so the allowed moves are too
+    offsets = np.zeros(values.size + 1, dtype=np.int64)
+    np.cumsum(allowed.sum(axis=2).ravel(), out=offsets[1:])
+    return CSRGraph(offsets, neighbours[allowed])
+
+
+def from_adjacency(
+    connections: Dict[str, List[str]],
+) -> Tuple[CSRGraph, List[str]]:
+    """
+    Build a graph from the neighbours of named nodes
+
+    :param connections: node name to the names of its neighbours
+    :type connections: Dict[str, List[str]]
+
+    :return: the graph, and the name of every node
+    :rtype: Tuple[CSRGraph, List[str]]
+    """
+    index = {name: i for i, name in enumerate(connections)}
+    for neighbours in connections.values():
+        for neighbour in neighbours:
+            index.setdefault(neighbour, len(index))
+    names = list(index)
+
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    targets: List[int] = []
+    for i, name in enumerate(names):
+        neighbours = connections.get(name, [])
+        targets.extend(index[neighbour] for neighbour in neighbours)
+        offsets[i + 1] = len(targets)
+    return CSRGraph(offsets, np.array(targets, dtype=NODE_DTYPE)), names
+
+
+def expand(
+    graph: CSRGraph,
+    frontier: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gather the neighbours of many nodes at once
+
+    :param graph: the graph
+    :type graph: CSRGraph
+
+    :param frontier: nodes whose neighbours are gathered
+    :type frontier: np.ndarray
+
+    :return: the neighbours, node after node, and the number of neighbours
+        of every node
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    offsets, targets = graph
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+
+    # positions in targets of the neighbours of every frontier node
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    neighbours = targets[shifts + np.arange(int(counts.sum()))]
+    return neighbours, counts
+
+
+def bfs(graph: CSRGraph, sources: Sequence[int]) -> np.ndarray:
+    """
+    Compute the number of edges from the nearest source to every node, one
+    frontier of nodes at a time so that each level is expanded with array
+    operations
+
+    :param graph: the graph
+    :type graph: CSRGraph
+
+    :param sources: nodes at distance 0, a single one for a single source
+        search
+    :type sources: Sequence[int]
+
+    :return: distance of every node, -1 for the unreachable ones
+    :rtype: np.ndarray
+    """
+    distances = np.full(graph.num_nodes, -1, dtype=np.int64)
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+    distances[frontier] = 0
+
+    level = 0
+    while frontier.size > 0:
+        level += 1
+        neighbours, _ = expand(graph, frontier)
+        frontier = np.unique(neighbours[distances[neighbours] == -1])
+        distances[frontier] = level
+    return distances
+
+
+@jit.kernel
+def bfs_queue(
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    sources: np.ndarray,
+    distances: np.ndarray,
+) -> None:
+    """
+    Compiled breadth first search over a queue of nodes, filling the
+    distances in place
+
+    :param offsets: offsets of the graph
+    :type offsets: np.ndarray
+
+    :param targets: targets of the graph
+    :type targets: np.ndarray
+
+    :param sources: nodes at distance 0
+    :type sources: np.ndarray
+
+    :param distances: -1 for every node, updated with the distances
+    :type distances: np.ndarray
+    """
+    # every node enters the queue once, so it never wraps around
+    queue = np.empty(len(distances), dtype=np.int64)
+    size = 0
+    for source in sources:
+        if distances[source] == -1:
+            distances[source] = 0
+            queue[size] = source
+            size += 1
+
+    head = 0
+    while head < size:
+        node = queue[head]
+        head += 1
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbour = targets[edge]
+            if distances[neighbour] == -1:
+                distances[neighbour] = distances[node] + 1
+                queue[size] = neighbour
+                size += 1
+
+
+@jit.accelerates(bfs)
+def bfs_compiled(graph: CSRGraph, sources: Sequence[int]) -> np.ndarray:
+    """
+    Compute the number of edges from the nearest source to every node, with
+    a compiled queue based search
+
+    :param graph: the graph
+    :type graph: CSRGraph
+
+    :param sources: nodes at distance 0
+    :type sources: Sequence[int]
+
+    :return: distance of every node, -1 for the unreachable ones
+    :rtype: np.ndarray
+    """
+    distances = np.full(graph.num_nodes, -1, dtype=np.int64)
+    nodes = np.asarray(sources, dtype=np.int64)
+    bfs_queue(graph.offsets, graph.targets, nodes, distances)
+    return distances
+
+
+def all_pairs_bfs(graph: CSRGraph) -> np.ndarray:
+    """
+    Compute the number of edges between every pair of nodes, with the
+    searches from every node advancing together one level at a time
+
+    :param graph: the graph
+    :type graph: CSRGraph
+
+    :return: matrix whose row i holds the distances from node i, -1 for
+        the unreachable nodes
+    :rtype: np.ndarray
+    """
+    num_nodes = graph.num_nodes
+    distances = np.full((num_nodes, num_nodes), -1, dtype=np.int64)
+    origins = np.arange(num_nodes)
+    frontier = np.arange(num_nodes)
+    distances[origins, frontier] = 0
+
+    level = 0
+    while frontier.size > 0:
+        level += 1
+        neighbours, counts = expand(graph, frontier)
+        origins = np.repeat(origins, counts)
+        is_new = distances[origins, neighbours] == -1
+
+        # each (origin, node) pair enters the next frontier once
+        pairs = np.unique(origins[is_new] * num_nodes + neighbours[is_new])
+        origins, frontier = np.divmod(pairs, num_nodes)
+        distances[origins, frontier] = level
+    return distances
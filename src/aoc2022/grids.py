@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import mmap
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from src.aoc2022 import utils
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
+
+grid_source_type = Union[str, bytes, mmap.mmap, utils.lines_type]
+
+WHITESPACE = b" \t\r\n"
+"""
+Bytes stripped from both ends of a grid
+"""
+
+
+class Grid(NamedTuple):
+    """
+    Data class representing a rectangular grid of characters
+
+    :param values: one byte per cell, translated if a table was given,
+        indexed by row then column
+    :type values: np.ndarray
+
+    :param markers: marker character to the (row, column) of its first
+        occurrence, for the markers found in the grid
+    :type markers: Dict[str, Tuple[int, int]]
+    """
+
+    values: np.ndarray
+    markers: Dict[str, Tuple[int, int]]
+
+
+def make_table(mapping: Mapping[str, int]) -> bytes:
+    """
+    Build a translation table for load_grid, mapping some characters to
+    values and leaving the other ones unchanged
+
+    :param mapping: character to value, from 0 to 255
+    :type mapping: Mapping[str, int]
+
+    :return: 256 byte translation table
+    :rtype: bytes
+    """
+    table = bytearray(range(256))
+    for char, value in mapping.items():
+        table[ord(char)] = value
+    return bytes(table)
+
+
+def to_buffer(raw_data: grid_source_type) -> Union[bytes, mmap.mmap]:
+    """
+    Get the bytes of a grid given as text, bytes or lines
+
+    :param raw_data: raw text, bytes returned by map_raw_data, or lines
+    :type raw_data: Union[str, bytes, mmap.mmap, Iterable[str]]
+
+    :return: bytes of the grid, rows separated by newlines
+    :rtype: Union[bytes, mmap.mmap]
+    """
+    if isinstance(raw_data, str):
+        return raw_data.encode()
+    if isinstance(raw_data, (bytes, mmap.mmap)):
+        return raw_data
+    return "\n".join(utils.split_lines(raw_data)).encode()
+
+
+def load_grid(
+    raw_data: grid_source_type,
+    table: Optional[bytes] = None,
+    markers: str = "",
+) -> Grid:
+    """
+    Load a rectangular block of text into a 2D array of bytes in a single
+    pass, without looping over the cells in Python. Rows may end with
+    ``\\n`` or ``\\r\\n``.
+
+    :param raw_data: raw text, bytes returned by map_raw_data, or lines
+    :type raw_data: Union[str, bytes, mmap.mmap, Iterable[str]]
+
+    :param table: optional 256 byte translation table, see make_table,
+        applied after the markers are located
+    :type table: Optional[bytes]
+
+    :param markers: characters whose position is reported, e.g. ``SE``
+    :type markers: str
+
+    :return: uint8 array of the cells and positions of the markers
+    :rtype: Grid
+    """
+    buffer = to_buffer(raw_data)
+    start, end = 0, len(buffer)
+    while start < end and buffer[start] in WHITESPACE:
+        start += 1
+    while end > start and buffer[end - 1] in WHITESPACE:
+        end -= 1
+    size = end - start
+    data = np.frombuffer(buffer, dtype=np.uint8, count=size, offset=start)
+    if data.size == 0:
+        return Grid(np.zeros((0, 0), dtype=np.uint8), {})
+
+    first_newline = buffer.find(b"\n", start, end)
+    if first_newline == -1:
+        stride = data.size + 1
+    else:
+        stride = first_newline - start + 1
+    crlf = stride > 1 and first_newline != -1 and data[stride - 2] == ord("\r")
+    width = stride - 2 if crlf else stride - 1
+
+    # the last row has no terminator
+    num_rows, remainder = divmod(data.size + stride - width, stride)
+    terminators = data[stride - 1 :: stride]  # noqa: E203
+    is_rectangular = (
+        remainder == 0
+        and bool(np.all(terminators == ord("\n")))
+        and np.count_nonzero(data == ord("\n")) == num_rows - 1
+    )
+    if not is_rectangular:
+        raise ValueError("The rows of the grid have different lengths")
+
+    # rows are read in place, skipping the line terminators
+    cells = np.lib.stride_tricks.as_strided(
+        data, shape=(num_rows, width), strides=(stride, 1), writeable=False
+    )
+
+    positions = {}
+    for marker in markers:
+        found = buffer.find(marker.encode(), start, end)
+        if found != -1:
+            row, column = divmod(found - start, stride)
+            positions[marker] = (row, column)
+
+    if table is not None:
+        # bytes.translate runs at memory speed, unlike a NumPy lookup
+        source = buffer if isinstance(buffer, bytes) else buffer[:]
+        translated = np.frombuffer(
+            source.translate(table),
+            dtype=np.uint8,
+            count=data.size,
+            offset=start,
+        )
+        cells = np.lib.stride_tricks.as_strided(
+            translated,
+            shape=(num_rows, width),
+            strides=(stride, 1),
+            writeable=False,
+        )
+    return Grid(cells.copy(), positions)
@@ -0,0 +1,102 @@
+import contextlib
+import importlib
+from typing import Callable, Dict, Iterator
+
+REGISTRY: Dict[str, Dict[str, Callable]] = {}
+"""
+Solver name, ``dayN.function``, to implementation name to function. Every
+solver has a ``reference`` implementation, the original function, against
+which the other ones are checked.
+"""
+
+REFERENCE = "reference"
+"""
+Name of the original implementation of every solver
+"""
+
+
+def get_solver_name(function: Callable) -> str:
+    """
+    Get the registry name of a top level function, ``dayN.function``
+
+    :param function: function defined at the top level of a module
+    :type function: Callable
+
+    :return: name of the function prefixed by the last part of its module
+    :rtype: str
+    """
+    return f"{function.__module__.rsplit('.', 1)[-1]}.{function.__qualname__}"
+
+
+def implements(reference: Callable, name: str) -> Callable:
+    """
+    Decorator declaring a function as another implementation of a solver,
+    taking the same arguments and returning the same answer. The decorated
+    function is returned unchanged.
+
+    :param reference: original implementation of the solver, a top level
+        function of a day module
+    :type reference: Callable
+
+    :param name: name of the implementation, e.g. ``vectorized``
+    :type name: str
+
+    :return: decorator registering the function
+    :rtype: Callable
+    """
+    solver_name = get_solver_name(reference)
+
+    def register(function: Callable) -> Callable:
+        solver = REGISTRY.setdefault(solver_name, {REFERENCE: reference})
+        if name in solver:
+            raise ValueError(f"{solver_name} already has a {name} version")
+        solver[name] = function
+        return function
+
+    return register
+
+
+def select(solver_name: str, name: str) -> Callable:
+    """
+    Make every call of a solver through its module use an implementation,
+    for instance to turn a fast path on in production
+
+    :param solver_name: registry name of the solver, ``dayN.function``
+    :type solver_name: str
+
+    :param name: name of the implementation, ``reference`` to restore the
+        original function
+    :type name: str
+
+    :return: the implementation now in use
+    :rtype: Callable
+    """
+    function = REGISTRY[solver_name][name]
+    reference = REGISTRY[solver_name][REFERENCE]
+    module = importlib.import_module(reference.__module__)
+    setattr(module, reference.__name__, function)
+    return function
+
+
+@contextlib.contextmanager
+def using(solver_name: str, name: str) -> Iterator[Callable]:
+    """
+    Use an implementation of a solver inside a block, then restore the
+    implementation that was in use before
+
+    :param solver_name: registry name of the solver, ``dayN.function``
+    :type solver_name: str
+
+    :param name: name of the implementation
+    :type name: str
+
+    :return: context manager yielding the implementation in use
+    :rtype: Iterator[Callable]
+    """
+    reference = REGISTRY[solver_name][REFERENCE]
+    module = importlib.import_module(reference.__module__)
+    previous = getattr(module, reference.__name__)
+    try:
+        yield select(solver_name, name)
+    finally:
+        setattr(module, reference.__name__, previous)
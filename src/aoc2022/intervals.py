@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+from src.aoc2022 import utils
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = utils.lazy_import("numpy")
+
+bounds_type = Union["np.ndarray", List[int], Tuple[int, ...]]
+
+
+def merge(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    join_touching: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge closed integer intervals into sorted disjoint ones. Intervals that
+    overlap are merged, and so are by default the ones that touch, such as
+    [0, 2] and [3, 5]. Empty ones, with an end before their start, are
+    dropped.
+
+    :param starts: first integer of every interval
+    :type starts: np.ndarray
+
+    :param ends: last integer of every interval
+    :type ends: np.ndarray
+
+    :param join_touching: whether intervals that only touch are merged
+    :type join_touching: bool
+
+    :return: starts and ends of the merged intervals
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    not_empty = starts <= ends
+    starts, ends = starts[not_empty], ends[not_empty]
+    if starts.size == 0:
+        return starts, ends
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    reach = np.maximum.accumulate(ends)
+
+    # an interval opens a new group when it starts after the integer
+    # following everything covered before it, or after that last integer
+    # when touching intervals are kept apart
+    is_first = np.empty(starts.size, dtype=bool)
+    is_first[0] = True
+    is_first[1:] = starts[1:] > reach[:-1] + int(join_touching)
+    firsts = np.flatnonzero(is_first)
+    lasts = np.append(firsts[1:] - 1, starts.size - 1)
+    return starts[firsts], reach[lasts]
+
+
+def intersection_sizes(
+    first_starts: np.ndarray,
+    first_ends: np.ndarray,
+    second_starts: np.ndarray,
+    second_ends: np.ndarray,
+) -> np.ndarray:
+    """
+    Count the integers shared by each pair of closed intervals
+
+    :param first_starts: start of the first interval of every pair
+    :type first_starts: np.ndarray
+
+    :param first_ends: end of the first interval of every pair
+    :type first_ends: np.ndarray
+
+    :param second_starts: start of the second interval of every pair
+    :type second_starts: np.ndarray
+
+    :param second_ends: end of the second interval of every pair
+    :type second_ends: np.ndarray
+
+    :return: size of the intersection of every pair, 0 if disjoint
+    :rtype: np.ndarray
+    """
+    start = np.maximum(first_starts, second_starts)
+    end = np.minimum(first_ends, second_ends)
+    return np.maximum(end - start + 1, 0)
+
+
+def find_first_gaps(
+    starts: np.ndarray, ends: np.ndarray, low: int, high: int
+) -> np.ndarray:
+    """
+    Find, for many rows of intervals at once, the first integer of
+    [low, high] covered by no interval of the row
+
+    :param starts: 2D array, the starts of the intervals of every row
+    :type starts: np.ndarray
+
+    :param ends: 2D array, the ends of the intervals of every row, empty
+        intervals being allowed
+    :type ends: np.ndarray
+
+    :param low: first integer of the searched range
+    :type low: int
+
+    :param high: last integer of the searched range
+    :type high: int
+
+    :return: first uncovered integer of every row, -1 if the row covers
+        the whole range
+    :rtype: np.ndarray
+    """
+    # empty intervals are moved past the range and cover nothing
+    empty = ends < starts
+    starts = np.where(empty, high + 1, starts)
+    ends = np.where(empty, low - 1, ends)
+
+    order = np.argsort(starts, axis=1)
+    starts = np.take_along_axis(starts, order, axis=1)
+    ends = np.take_along_axis(ends, order, axis=1)
+
+    # last integer covered without a gap before each interval
+    reach = np.maximum(np.maximum.accumulate(ends, axis=1), low - 1)
+    covered = np.empty_like(reach)
+    covered[:, 0] = low - 1
+    covered[:, 1:] = reach[:, :-1]
+
+    gaps = np.where(starts > covered + 1, covered + 1, reach[:, -1:] + 1)
+    first_gaps = gaps.min(axis=1)
+    return np.where(first_gaps <= high, first_gaps, -1)
+
+
+class IntervalSet:
+    """
+    Union of closed integer intervals, kept as sorted disjoint intervals in
+    two NumPy arrays so that bulk operations run without Python loops
+
+    :param starts: first integer of every interval
+    :type starts: Union[np.ndarray, List[int], Tuple[int, ...]]
+
+    :param ends: last integer of every interval, intervals ending before
+        their start are empty
+    :type ends: Union[np.ndarray, List[int], Tuple[int, ...]]
+
+    :param join_touching: whether intervals that only touch are merged
+    :type join_touching: bool
+    """
+
+    def __init__(
+        self,
+        starts: bounds_type = (),
+        ends: bounds_type = (),
+        join_touching: bool = True,
+    ):
+        self.join_touching = join_touching
+        self.starts, self.ends = merge(
+            np.asarray(starts, dtype=np.int64),
+            np.asarray(ends, dtype=np.int64),
+            join_touching,
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.to_list()})"
+
+    def add(self, starts: bounds_type, ends: bounds_type) -> IntervalSet:
+        """
+        Insert many intervals at once
+
+        :param starts: first integer of every new interval
+        :type starts: Union[np.ndarray, List[int], Tuple[int, ...]]
+
+        :param ends: last integer of every new interval
+        :type ends: Union[np.ndarray, List[int], Tuple[int, ...]]
+
+        :return: the union of this set and of the new intervals
+        :rtype: IntervalSet
+        """
+        return IntervalSet(
+            np.concatenate((self.starts, np.asarray(starts, dtype=np.int64))),
+            np.concatenate((self.ends, np.asarray(ends, dtype=np.int64))),
+            self.join_touching,
+        )
+
+    def clip(self, low: int, high: int) -> IntervalSet:
+        """
+        Restrict the set to a bounding range
+
+        :param low: first integer kept
+        :type low: int
+
+        :param high: last integer kept
+        :type high: int
+
+        :return: the intersection of this set and of [low, high]
+        :rtype: IntervalSet
+        """
+        starts = np.maximum(self.starts, low)
+        ends = np.minimum(self.ends, high)
+        return IntervalSet(starts, ends, self.join_touching)
+
+    def length(self) -> int:
+        """
+        Count the integers covered by the set
+
+        :return: total length of the intervals
+        :rtype: int
+        """
+        return int((self.ends - self.starts + 1).sum())
+
+    def contains(self, points: bounds_type) -> np.ndarray:
+        """
+        Check which points are in the set, with a binary search per point
+
+        :param points: integers to look up
+        :type points: Union[np.ndarray, List[int], Tuple[int, ...]]
+
+        :return: flag per point, whether it is in the set
+        :rtype: np.ndarray
+        """
+        points = np.asarray(points, dtype=np.int64)
+        if len(self) == 0:
+            return np.zeros(points.shape, dtype=bool)
+        # last interval starting at or before each point, -1 if none
+        index = np.searchsorted(self.starts, points, side="right") - 1
+        return (index >= 0) & (points <= self.ends[index])
+
+    def count_members(self, points: bounds_type) -> int:
+        """
+        Count the points that are in the set
+
+        :param points: integers to look up, counted as often as given
+        :type points: Union[np.ndarray, List[int], Tuple[int, ...]]
+
+        :return: number of points in the set
+        :rtype: int
+        """
+        return int(np.count_nonzero(self.contains(points)))
+
+    def to_list(self) -> List[Tuple[int, int]]:
+        """
+        Get the intervals as Python tuples
+
+        :return: sorted (start, end) of every interval
+        :rtype: List[Tuple[int, int]]
+        """
+        return list(zip(self.starts.tolist(), self.ends.tolist()))
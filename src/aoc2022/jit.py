@@ -0,0 +1,76 @@
+import functools
+import importlib
+import importlib.util
+import os
+from typing import Callable, Optional
+
+from src.aoc2022 import implementations
+
+NUMBA = "numba"
+"""
+Name of the implementations compiled with Numba
+"""
+
+AVAILABLE = (
+    importlib.util.find_spec("numba") is not None
+    and os.environ.get("AOC2022_DISABLE_JIT", "") == ""
+)
+"""
+Whether the Numba kernels are used, which requires Numba to be installed
+and ``AOC2022_DISABLE_JIT`` to be unset. Otherwise the days keep their
+pure Python code.
+"""
+
+
+def kernel(function: Callable) -> Callable:
+    """
+    Decorator compiling a function with ``numba.njit`` on its first call,
+    so that importing a day does not import Numba. Compiled code is cached
+    on disk next to the module. Without Numba the function runs as is.
+
+    :param function: function using only what Numba's nopython mode
+        supports
+    :type function: Callable
+
+    :return: the lazily compiled function
+    :rtype: Callable
+    """
+    compiled: Optional[Callable] = None
+
+    @functools.wraps(function)
+    def call(*args):
+        nonlocal compiled
+        if compiled is None:
+            if not AVAILABLE:
+                compiled = function
+            else:
+                numba = importlib.import_module("numba")
+                compiled = numba.njit(cache=True)(function)
+        return compiled(*args)
+
+    return call
+
+
+def accelerates(reference: Callable) -> Callable:
+    """
+    Decorator declaring the Numba version of a solver. When Numba is
+    available, it is registered as the ``numba`` implementation and
+    selected, so that the module uses it in place of the reference. The
+    decorated function is returned unchanged.
+
+    :param reference: original implementation of the solver, a top level
+        function of a module
+    :type reference: Callable
+
+    :return: decorator registering the function
+    :rtype: Callable
+    """
+
+    def register(function: Callable) -> Callable:
+        if AVAILABLE:
+            implementations.implements(reference, NUMBA)(function)
+            solver_name = implementations.get_solver_name(reference)
+            implementations.select(solver_name, NUMBA)
+        return function
+
+    return register
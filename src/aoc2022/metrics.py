@@ -0,0 +1,61 @@
+from typing import Dict
+
+COUNTERS: Dict[str, int] = {}
+"""
+Registry of every work counter, name to count since the last reset. Names
+are ``dayN.what_is_counted``.
+"""
+
+
+def increment(name: str, amount: int = 1):
+    """
+    Add to a counter. Hot loops should count in a local variable and call
+    this once per call of the instrumented function.
+
+    :param name: name of the counter
+    :type name: str
+
+    :param amount: amount added to the counter
+    :type amount: int
+    """
+    COUNTERS[name] = COUNTERS.get(name, 0) + amount
+
+
+def snapshot() -> Dict[str, int]:
+    """
+    Copy the current value of every counter
+
+    :return: Dict of counter name, count
+    :rtype: Dict[str, int]
+    """
+    return dict(COUNTERS)
+
+
+def difference(
+    before: Dict[str, int],
+    after: Dict[str, int],
+) -> Dict[str, int]:
+    """
+    Compute the work done between two snapshots
+
+    :param before: earlier snapshot
+    :type before: Dict[str, int]
+
+    :param after: later snapshot
+    :type after: Dict[str, int]
+
+    :return: Dict of counter name, increase, for the counters that changed
+    :rtype: Dict[str, int]
+    """
+    return {
+        name: count - before.get(name, 0)
+        for name, count in after.items()
+        if count != before.get(name, 0)
+    }
+
+
+def reset():
+    """
+    Reset every counter
+    """
+    COUNTERS.clear()
@@ -0,0 +1,290 @@
+import contextlib
+import functools
+import importlib
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+REGISTRY: List[Tuple[str, str]] = []
+"""
+Module name and qualified name of every function decorated with profiled
+"""
+
+active_profiler: Optional["Profiler"] = None
+"""
+Profiler currently recording, if any
+"""
+
+
+class FunctionStats:
+    """
+    Accumulated cost of a profiled function or phase
+
+    :param calls: number of calls
+    :type calls: int
+
+    :param wall_time: total wall time including callees, in seconds
+    :type wall_time: float
+
+    :param cpu_time: total CPU time of the process including callees, in
+        seconds
+    :type cpu_time: float
+
+    :param peak_memory: largest increase of the traced memory during one
+        call, in bytes
+    :type peak_memory: int
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convert the stats to a JSON compatible dict
+
+        :return: Dict of stat name, value
+        :rtype: Dict[str, float]
+        """
+        return {
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class Frame:
+    """
+    A call in progress
+
+    :param name: name of the function or phase
+    :type name: str
+
+    :param start_memory: traced memory when the call started, in bytes
+    :type start_memory: int
+    """
+
+    def __init__(self, name: str, start_memory: int):
+        self.name = name
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+        self.child_time = 0.0
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+
+def profiled(function: Callable) -> Callable:
+    """
+    Register a top level function or a method for profiling. The function
+    is returned unchanged, it is only wrapped while a Profiler is active, so
+    the decorator costs nothing when profiling is disabled.
+
+    Only calls made through the module or class attribute are recorded,
+    which includes recursive calls and calls from the same module. The
+    function should return a value rather than a generator, since only the
+    call itself is timed.
+
+    :param function: function to register
+    :type function: Callable
+
+    :return: the same function
+    :rtype: Callable
+    """
+    key = (function.__module__, function.__qualname__)
+    if key not in REGISTRY:
+        REGISTRY.append(key)
+    return function
+
+
+def phase(name: str) -> ContextManager:
+    """
+    Record a block of code as a frame of the active Profiler, or do nothing
+    when profiling is disabled
+
+    :param name: name of the phase, without spaces or semicolons
+    :type name: str
+
+    :return: context manager wrapping the phase
+    :rtype: ContextManager
+    """
+    if active_profiler is None:
+        return contextlib.nullcontext()
+    return active_profiler.phase(name)
+
+
+class Profiler:
+    """
+    Context manager recording the wall time, CPU time, call count and peak
+    memory of the phases and of the registered functions. Nested calls are
+    aggregated into collapsed stacks, the input format of flamegraph tools.
+
+    :param trace_memory: whether to trace allocations, which is needed for
+        the peak memory but slows the profiled code down
+    :type trace_memory: bool
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stats: Dict[str, FunctionStats] = {}
+        self.collapsed: Dict[str, float] = {}
+        self.stack: List[Frame] = []
+        self.patched: List[Tuple[Any, str, Callable]] = []
+        self.started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        global active_profiler
+        if active_profiler is not None:
+            raise RuntimeError("A profiler is already active")
+        active_profiler = self
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+        for module_name, qualname in REGISTRY:
+            owner: Any = importlib.import_module(module_name)
+            *owner_names, attribute = qualname.split(".")
+            for owner_name in owner_names:
+                owner = getattr(owner, owner_name)
+            function = getattr(owner, attribute)
+            name = f"{module_name.rsplit('.', 1)[-1]}.{qualname}"
+            setattr(owner, attribute, self.wrap(function, name))
+            self.patched.append((owner, attribute, function))
+        return self
+
+    def __exit__(self, *exc_info):
+        global active_profiler
+        for owner, attribute, function in reversed(self.patched):
+            setattr(owner, attribute, function)
+        self.patched = []
+
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        active_profiler = None
+
+    def wrap(self, function: Callable, name: str) -> Callable:
+        """
+        Wrap a function so that every call is recorded as a frame
+
+        :param function: function to wrap
+        :type function: Callable
+
+        :param name: name of the frame
+        :type name: str
+
+        :return: the wrapper
+        :rtype: Callable
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.push(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.pop()
+
+        return wrapper
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Record a block of code as a frame
+
+        :param name: name of the phase, without spaces or semicolons
+        :type name: str
+        """
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop()
+
+    def push(self, name: str):
+        """
+        Start a frame
+
+        :param name: name of the function or phase
+        :type name: str
+        """
+        memory = 0
+        if tracemalloc.is_tracing():
+            memory, peak = tracemalloc.get_traced_memory()
+            if self.stack:
+                parent = self.stack[-1]
+                parent.peak_memory = max(parent.peak_memory, peak)
+            tracemalloc.reset_peak()
+        self.stack.append(Frame(name, memory))
+
+    def pop(self):
+        """
+        End the innermost frame and add its cost to the stats
+        """
+        wall_time = time.perf_counter()
+        cpu_time = time.process_time()
+        frame = self.stack.pop()
+        wall_time -= frame.start_wall
+        cpu_time -= frame.start_cpu
+
+        if tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            frame.peak_memory = max(frame.peak_memory, peak)
+            tracemalloc.reset_peak()
+
+        stats = self.stats.setdefault(frame.name, FunctionStats())
+        stats.calls += 1
+        stats.wall_time += wall_time
+        stats.cpu_time += cpu_time
+        memory = frame.peak_memory - frame.start_memory
+        stats.peak_memory = max(stats.peak_memory, memory)
+
+        path = ";".join([f.name for f in self.stack] + [frame.name])
+        self_time = wall_time - frame.child_time
+        self.collapsed[path] = self.collapsed.get(path, 0.0) + self_time
+
+        if self.stack:
+            parent = self.stack[-1]
+            parent.child_time += wall_time
+            parent.peak_memory = max(parent.peak_memory, frame.peak_memory)
+
+    def to_json(self) -> str:
+        """
+        Render the stats as JSON
+
+        :return: JSON object of frame name, stats
+        :rtype: str
+        """
+        stats = {name: s.to_dict() for name, s in self.stats.items()}
+        return json.dumps(stats, indent=2, sort_keys=True)
+
+    def to_collapsed(self) -> str:
+        """
+        Render the self time of every stack as collapsed stacks, one
+        ``frame;frame;frame microseconds`` line per stack
+
+        :return: collapsed stacks
+        :rtype: str
+        """
+        lines = [
+            f"{path} {round(seconds * 1e6)}"
+            for path, seconds in sorted(self.collapsed.items())
+        ]
+        return "\n".join(lines) + "\n"
+
+    def save(self, path_prefix: str):
+        """
+        Write ``<prefix>.json`` with the stats and ``<prefix>.collapsed``
+        with the collapsed stacks
+
+        :param path_prefix: path of the files without extension
+        :type path_prefix: str
+        """
+        with open(f"{path_prefix}.json", "w") as file:
+            file.write(self.to_json() + "\n")
+        with open(f"{path_prefix}.collapsed", "w") as file:
+            file.write(self.to_collapsed())
@@ -0,0 +1,326 @@
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import pkgutil
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+from src.aoc2022 import cache, days, profiling, utils
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "data")
+"""
+Directory containing the puzzle input for each day
+"""
+
+PARTS = (1, 2)
+"""
+Parts solved for every day
+"""
+
+answer_type = Union[int, str]
+
+
+class PartResult(NamedTuple):
+    """
+    Data class representing the outcome of solving one part of one day
+
+    :param day: day number
+    :type day: int
+
+    :param part: part number, 1 or 2
+    :type part: int
+
+    :param answer: answer returned by the solver
+    :type answer: Union[int, str]
+
+    :param parse_time: wall time spent parsing the input, in seconds
+    :type parse_time: float
+
+    :param solve_time: wall time spent solving the part, in seconds
+    :type solve_time: float
+
+    :param cached: whether the answer was loaded from the answer cache, in
+        which case the lookup is timed as the solve phase
+    :type cached: bool
+    """
+
+    day: int
+    part: int
+    answer: answer_type
+    parse_time: float
+    solve_time: float
+    cached: bool = False
+
+
+def discover_days() -> Dict[int, str]:
+    """
+    Find every ``dayN`` module in the ``days`` package
+
+    :return: Dict of day number, fully qualified module name
+    :rtype: Dict[int, str]
+    """
+    day_modules = {}
+    for module_info in pkgutil.iter_modules(days.__path__):
+        match = re.fullmatch(r"day(\d+)", module_info.name)
+        if match is not None:
+            module_name = f"{days.__name__}.{module_info.name}"
+            day_modules[int(match.group(1))] = module_name
+    return dict(sorted(day_modules.items()))
+
+
+def get_data_path(day: int, data_directory: str = DATA_DIRECTORY) -> str:
+    """
+    Get the path of the puzzle input for a day
+
+    :param day: day number
+    :type day: int
+
+    :param data_directory: directory containing the ``dayN.txt`` files
+    :type data_directory: str
+
+    :return: path of the puzzle input
+    :rtype: str
+    """
+    return os.path.join(data_directory, f"day{day}.txt")
+
+
+def solve_part(
+    day: int,
+    part: int,
+    data_path: str,
+    cache_directory: Optional[str] = None,
+) -> PartResult:
+    """
+    Parse the input and solve a single part of a day, timing both phases.
+    With a cache directory, the answer is loaded from the answer cache when
+    neither the input nor the code of the parser and of the solver changed,
+    and parsed inputs are loaded from the parse cache.
+
+    :param day: day number
+    :type day: int
+
+    :param part: part number, 1 or 2
+    :type part: int
+
+    :param data_path: path of the puzzle input
+    :type data_path: str
+
+    :param cache_directory: directory of the caches, disabled if None
+    :type cache_directory: Optional[str]
+
+    :return: answer and timings for the part
+    :rtype: PartResult
+    """
+    module = importlib.import_module(discover_days()[day])
+    solver = getattr(module, f"solve_part_{part}")
+
+    if cache_directory is None:
+        raw_data = utils.get_raw_data(data_path)
+        start = time.perf_counter()
+        with profiling.phase(f"day{day}.parse_input"):
+            parsed_data = module.parse_input(raw_data)
+        parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with profiling.phase(f"day{day}.solve_part_{part}"):
+            answer = solver(parsed_data)
+        solve_time = time.perf_counter() - start
+
+        return PartResult(day, part, answer, parse_time, solve_time)
+
+    start = time.perf_counter()
+    input_hash = cache.hash_file(data_path)
+    code_hash = cache.get_code_hash(solver, module.parse_input)
+    answer_cache = cache.AnswerCache(cache_directory)
+    try:
+        answer = answer_cache.load(day, part, input_hash, code_hash)
+        lookup_time = time.perf_counter() - start
+        return PartResult(day, part, answer, 0.0, lookup_time, True)
+    except KeyError:
+        pass
+
+    # a parse cache hit is timed as the parse phase
+    start = time.perf_counter()
+    parse_cache = cache.ParseCache(cache_directory)
+    with profiling.phase(f"day{day}.parse_input"):
+        parsed_data = parse_cache.parse(module, data_path, input_hash)
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with profiling.phase(f"day{day}.solve_part_{part}"):
+        answer = solver(parsed_data)
+    solve_time = time.perf_counter() - start
+
+    answer_cache.store(day, part, input_hash, code_hash, answer)
+    return PartResult(day, part, answer, parse_time, solve_time)
+
+
+def run_days(
+    day_numbers: Optional[Sequence[int]] = None,
+    parts: Sequence[int] = PARTS,
+    max_workers: Optional[int] = None,
+    data_directory: str = DATA_DIRECTORY,
+    cache_directory: Optional[str] = None,
+) -> List[PartResult]:
+    """
+    Solve the selected days on a process pool. Each part is an independent
+    job so the total wall time is close to that of the slowest part.
+
+    :param day_numbers: days to run, all discovered days if None
+    :type day_numbers: Optional[Sequence[int]]
+
+    :param parts: parts to run for each day
+    :type parts: Sequence[int]
+
+    :param max_workers: number of worker processes, one per CPU if None, 0
+        to solve the parts one after the other in this process
+    :type max_workers: Optional[int]
+
+    :param data_directory: directory containing the ``dayN.txt`` files
+    :type data_directory: str
+
+    :param cache_directory: directory of the caches, disabled if None
+    :type cache_directory: Optional[str]
+
+    :return: results ordered by day and part
+    :rtype: List[PartResult]
+    """
+    available_days = discover_days()
+    if day_numbers is None:
+        day_numbers = list(available_days.keys())
+
+    for day in day_numbers:
+        if day not in available_days:
+            raise ValueError(f"Invalid day {day}")
+
+    jobs = [
+        (day, part, get_data_path(day, data_directory), cache_directory)
+        for day in day_numbers
+        for part in parts
+    ]
+
+    if max_workers == 0:
+        results = [solve_part(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(solve_part, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def format_table(results: List[PartResult]) -> str:
+    """
+    Render the results as a plain text table
+
+    :param results: results to render
+    :type results: List[PartResult]
+
+    :return: rendered table
+    :rtype: str
+    """
+    header = ("day", "part", "parse (s)", "solve (s)", "answer")
+    rows = [header]
+    for r in results:
+        answer = str(r.answer)
+        if "\n" in answer:
+            answer = answer.replace("\n", " | ")
+        if r.cached:
+            answer += " (cached)"
+        rows.append(
+            (
+                str(r.day),
+                str(r.part),
+                f"{r.parse_time:.4f}",
+                f"{r.solve_time:.4f}",
+                answer,
+            )
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = [
+        "  ".join(value.ljust(width) for value, width in zip(row, widths))
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def format_json(results: List[PartResult]) -> str:
+    """
+    Render the results as JSON
+
+    :param results: results to render
+    :type results: List[PartResult]
+
+    :return: JSON list with one object per part
+    :rtype: str
+    """
+    return json.dumps([r._asdict() for r in results], indent=2)
+
+
+def main(argv: Optional[Sequence[str]] = None):  # pragma: no cover
+    """
+    Command line entry point, see ``python -m src.aoc2022 --help``
+
+    :param argv: command line arguments, ``sys.argv`` if None
+    :type argv: Optional[Sequence[str]]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.aoc2022",
+        description="Solve Advent of Code 2022 days in parallel.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        help="days to run (default: all)",
+    )
+    parser.add_argument(
+        "--parts", nargs="+", type=int, default=list(PARTS), choices=PARTS
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--data-dir", default=DATA_DIRECTORY)
+    parser.add_argument("--cache-dir", default=cache.DEFAULT_CACHE_DIRECTORY)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="always parse and solve"
+    )
+    parser.add_argument("--format", choices=("table", "json"), default="table")
+    parser.add_argument(
+        "--profile",
+        metavar="PREFIX",
+        help="solve in this process and write PREFIX.json with the profiled "
+        "phases and functions and PREFIX.collapsed for flamegraph tools",
+    )
+    args = parser.parse_args(argv)
+
+    profiler = None
+    if args.profile is not None:
+        # import the days first so that their profiled functions are patched
+        for module_name in discover_days().values():
+            importlib.import_module(module_name)
+        profiler = profiling.Profiler()
+
+    start = time.perf_counter()
+    with profiler or contextlib.nullcontext():
+        results = run_days(
+            day_numbers=args.days or None,
+            parts=args.parts,
+            max_workers=0 if profiler else args.workers,
+            data_directory=args.data_dir,
+            cache_directory=None if args.no_cache else args.cache_dir,
+        )
+    total_time = time.perf_counter() - start
+
+    if profiler is not None:
+        profiler.save(args.profile)
+
+    if args.format == "json":
+        print(format_json(results))
+    else:
+        print(format_table(results))
+        print(f"\nTotal wall time: {total_time:.2f}s")
@@ -0,0 +1,381 @@
+import argparse
+import asyncio
+import importlib
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple
+
+from src.aoc2022 import runner, utils
+
+DEFAULT_HOST = "127.0.0.1"
+"""
+Address the server listens on, local connections only
+"""
+
+DEFAULT_PORT = 8022
+"""
+TCP port the server listens on
+"""
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+"""
+Largest puzzle input accepted, in bytes
+"""
+
+ROUTE = re.compile(r"/day/(\d+)/part/(\d+)")
+"""
+Path of the solve requests, ``POST /day/<day>/part/<part>``
+"""
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class RequestError(Exception):
+    """
+    Error answered with an HTTP status other than 200
+
+    :param status: HTTP status code
+    :type status: int
+
+    :param message: description sent to the client
+    :type message: str
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def warm_up():
+    """
+    Import every day in a worker process, before its first job, so that
+    requests do not pay for the imports and the lookup tables
+    """
+    for module_name in runner.discover_days().values():
+        importlib.import_module(module_name)
+    # the days import NumPy lazily, load it now rather than during a job
+    getattr(utils.lazy_import("numpy"), "ndarray")
+
+
+def solve_input(day: int, part: int, raw_data: str) -> runner.answer_type:
+    """
+    Parse a puzzle input and solve one part, the job run by the workers
+
+    :param day: day number
+    :type day: int
+
+    :param part: part number, 1 or 2
+    :type part: int
+
+    :param raw_data: raw text of the puzzle input
+    :type raw_data: str
+
+    :return: answer returned by the solver
+    :rtype: Union[int, str]
+    """
+    module = importlib.import_module(runner.discover_days()[day])
+    solver = getattr(module, f"solve_part_{part}")
+    return solver(module.parse_input(raw_data))
+
+
+async def read_request(
+    reader: asyncio.StreamReader,
+) -> Tuple[str, str, bytes]:
+    """
+    Read an HTTP/1.1 request with a ``Content-Length`` body
+
+    :param reader: stream of the client connection
+    :type reader: asyncio.StreamReader
+
+    :return: method, path and body of the request
+    :rtype: Tuple[str, str, bytes]
+    """
+    request_line = await reader.readline()
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ")
+    except ValueError:
+        raise RequestError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise RequestError(400, "Invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise RequestError(413, f"Inputs are limited to {MAX_BODY_SIZE} bytes")
+    body = await reader.readexactly(length)
+    return method, path, body
+
+
+def format_response(status: int, payload: Dict) -> bytes:
+    """
+    Render an HTTP/1.1 response with a JSON body
+
+    :param status: HTTP status code
+    :type status: int
+
+    :param payload: JSON compatible body
+    :type payload: Dict
+
+    :return: raw response
+    :rtype: bytes
+    """
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class SolveServer:
+    """
+    Local server solving puzzle inputs on warm worker processes. Clients
+    send ``POST /day/<day>/part/<part>`` with the input as body and receive
+    ``{"answer": ...}``. Each day may only occupy day_limit workers, so that
+    a flood of slow jobs cannot starve the quick days.
+
+    :param max_workers: number of worker processes, one per CPU if None
+        with at least 2
+    :type max_workers: Optional[int]
+
+    :param day_limit: maximum number of jobs of a single day running at the
+        same time, all workers but one if None
+    :type day_limit: Optional[int]
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        day_limit: Optional[int] = None,
+    ):
+        self.max_workers = max_workers or max(2, os.cpu_count() or 1)
+        self.day_limit = day_limit or max(1, self.max_workers - 1)
+        self.days = runner.discover_days()
+        self.semaphores: Dict[int, asyncio.Semaphore] = {}
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    async def __aenter__(self) -> "SolveServer":
+        # forked workers would inherit the client sockets and keep them open
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_up,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def get_semaphore(self, day: int) -> asyncio.Semaphore:
+        """
+        Get the semaphore capping the number of running jobs of a day
+
+        :param day: day number
+        :type day: int
+
+        :return: semaphore of the day
+        :rtype: asyncio.Semaphore
+        """
+        if day not in self.semaphores:
+            self.semaphores[day] = asyncio.Semaphore(self.day_limit)
+        return self.semaphores[day]
+
+    async def solve(
+        self,
+        day: int,
+        part: int,
+        raw_data: str,
+    ) -> runner.answer_type:
+        """
+        Solve one part of a puzzle input on a worker, waiting for a slot if
+        the day already runs day_limit jobs
+
+        :param day: day number
+        :type day: int
+
+        :param part: part number, 1 or 2
+        :type part: int
+
+        :param raw_data: raw text of the puzzle input
+        :type raw_data: str
+
+        :return: answer returned by the solver
+        :rtype: Union[int, str]
+        """
+        if day not in self.days or part not in runner.PARTS:
+            raise RequestError(404, f"Invalid day {day} or part {part}")
+        if self.executor is None:
+            raise RuntimeError("The server is not started")
+
+        loop = asyncio.get_running_loop()
+        async with self.get_semaphore(day):
+            return await loop.run_in_executor(
+                self.executor, solve_input, day, part, raw_data
+            )
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """
+        Answer one request of a client connection
+
+        :param reader: stream of the client connection
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream of the client connection
+        :type writer: asyncio.StreamWriter
+        """
+        try:
+            method, path, body = await read_request(reader)
+            match = ROUTE.fullmatch(path)
+            if match is None:
+                raise RequestError(404, f"Unknown path {path}")
+            if method != "POST":
+                raise RequestError(405, "Use POST with the input as body")
+            try:
+                raw_data = body.decode()
+            except UnicodeDecodeError:
+                raise RequestError(400, "The input is not valid UTF-8")
+
+            day, part = int(match.group(1)), int(match.group(2))
+            answer = await self.solve(day, part, raw_data)
+            response = format_response(200, {"answer": answer})
+        except RequestError as error:
+            response = format_response(error.status, {"error": error.message})
+        except asyncio.IncompleteReadError:
+            response = format_response(400, {"error": "Truncated body"})
+        except Exception as error:  # the solver failed on this input
+            message = f"{type(error).__name__}: {error}"
+            response = format_response(500, {"error": message})
+
+        writer.write(response)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_path: Optional[str] = None,
+    ) -> asyncio.AbstractServer:
+        """
+        Start listening on a TCP port, or on a Unix socket if a path is
+        given
+
+        :param host: address to listen on
+        :type host: str
+
+        :param port: TCP port, 0 to pick a free one
+        :type port: int
+
+        :param unix_path: path of the Unix socket, TCP if None
+        :type unix_path: Optional[str]
+
+        :return: the listening asyncio server
+        :rtype: asyncio.AbstractServer
+        """
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self.handle, unix_path)
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    day_limit: Optional[int] = None,
+):  # pragma: no cover
+    """
+    Run the solve server until cancelled
+
+    :param host: address to listen on
+    :type host: str
+
+    :param port: TCP port
+    :type port: int
+
+    :param unix_path: path of the Unix socket, TCP if None
+    :type unix_path: Optional[str]
+
+    :param max_workers: number of worker processes
+    :type max_workers: Optional[int]
+
+    :param day_limit: maximum number of running jobs per day
+    :type day_limit: Optional[int]
+    """
+    async with SolveServer(max_workers, day_limit) as solve_server:
+        server = await solve_server.start(host, port, unix_path)
+        address = unix_path or f"http://{host}:{port}"
+        print(f"Solving on {address} with {solve_server.max_workers} workers")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: Optional[Sequence[str]] = None):  # pragma: no cover
+    """
+    Command line entry point, see ``python -m src.aoc2022.server --help``
+
+    :param argv: command line arguments, ``sys.argv`` if None
+    :type argv: Optional[Sequence[str]]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.aoc2022.server",
+        description="Solve puzzle inputs sent with "
+        "POST /day/<day>/part/<part> on warm worker processes.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a socket")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--day-limit",
+        type=int,
+        default=None,
+        help="maximum number of running jobs per day",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.unix,
+                args.workers,
+                args.day_limit,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,3 +1,15 @@
+import contextlib
+import importlib.util
+import mmap
+import sys
+from types import ModuleType
+from typing import Iterable, Iterator, List, Union
+
+buffer_type = Union[bytes, mmap.mmap]
+lines_type = Union[str, Iterable[str]]
+blocks_type = Union[str, Iterable[List[str]]]
+
+
 def get_raw_data(file_path: str) -> str:
     """Returns the raw data from a path
 
@@ -11,3 +23,140 @@ def get_raw_data(file_path: str) -> str:
     with open(file_path, "r") as file:
         data = file.read()
     return data
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Imports a module on the first access to one of its attributes, so
+    that heavy dependencies such as NumPy only slow down the days that use
+    them. Modules already imported are returned as is.
+
+    :param name: fully qualified module name
+    :type name: str
+
+    :return: the module, loaded on first use
+    :rtype: ModuleType
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    # bind a submodule to its package, as the import statement does, for
+    # the code using it as an attribute, e.g. asyncio with concurrent
+    parent_name, _, child_name = name.rpartition(".")
+    if parent_name:
+        setattr(importlib.import_module(parent_name), child_name, module)
+    return module
+
+
+def split_lines(raw_data: lines_type) -> Iterable[str]:
+    """Splits the raw data into lines. Raw text is stripped before being split,
+    lines coming from an iterator such as iter_lines are passed through with
+    the blank lines skipped.
+
+    :param raw_data: Raw text, or iterable of lines
+    :type raw_data: Union[str, Iterable[str]]
+
+    :return: iterable of lines
+    :rtype: Iterable[str]
+    """
+    if isinstance(raw_data, str):
+        return raw_data.strip().split("\n")
+    return (line for line in raw_data if line.strip() != "")
+
+
+def split_blocks(raw_data: blocks_type) -> Iterable[List[str]]:
+    """Splits the raw data into blocks of lines separated by blank lines.
+    Blocks coming from an iterator such as iter_blocks are passed through.
+
+    :param raw_data: Raw text, or iterable of blocks of lines
+    :type raw_data: Union[str, Iterable[List[str]]]
+
+    :return: iterable of blocks, each block being a list of lines
+    :rtype: Iterable[List[str]]
+    """
+    if isinstance(raw_data, str):
+        return [
+            block.strip("\n").split("\n")
+            for block in raw_data.split("\n\n")
+            if block.strip() != ""
+        ]
+    return raw_data
+
+
+@contextlib.contextmanager
+def map_raw_data(file_path: str) -> Iterator[buffer_type]:
+    """Maps a file into memory as a read-only bytes-like view, so that large
+    inputs can be scanned without being copied into a string
+
+    :param file_path: filepath for data
+    :type file_path: str
+
+    :return: context manager yielding the mapped bytes
+    :rtype: Iterator[Union[bytes, mmap.mmap]]
+    """
+    with open(file_path, "rb") as file:
+        try:
+            view = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            yield b""
+            return
+        try:
+            yield view
+        finally:
+            view.close()
+
+
+def iter_lines(source: Union[str, buffer_type]) -> Iterator[str]:
+    """Lazily iterates over the lines of a file or of a mapped buffer, with
+    the line terminators removed
+
+    :param source: filepath for data, or bytes returned by map_raw_data
+    :type source: Union[str, bytes, mmap.mmap]
+
+    :return: iterator of lines
+    :rtype: Iterator[str]
+    """
+    if isinstance(source, str):
+        with open(source, "r") as file:
+            for line in file:
+                yield line.rstrip("\n")
+        return
+
+    start = 0
+    size = len(source)
+    while start < size:
+        end = source.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield source[start:end].decode().rstrip("\r")
+        start = end + 1
+
+
+def iter_blocks(source: Union[str, buffer_type]) -> Iterator[List[str]]:
+    """Lazily iterates over the blocks of lines of a file or of a mapped
+    buffer, where blocks are separated by blank lines
+
+    :param source: filepath for data, or bytes returned by map_raw_data
+    :type source: Union[str, bytes, mmap.mmap]
+
+    :return: iterator of blocks, each block being a list of lines
+    :rtype: Iterator[List[str]]
+    """
+    block: List[str] = []
+    for line in iter_lines(source):
+        if line.strip() == "":
+            if block:
+                yield block
+            block = []
+        else:
+            block.append(line)
+    if block:
+        yield block
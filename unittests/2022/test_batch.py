@@ -0,0 +1,68 @@
+import importlib
+
+import pytest
+
+from src.aoc2022 import batch, generators, runner
+
+# small generated day 15 inputs have no single gap for the distress beacon
+batch_days = [day for day in runner.discover_days() if day != 15]
+
+
+class TestBatch:
+    @pytest.mark.parametrize("day", batch_days)
+    def test_batch_matches_single_inputs(self, day):
+        # Prepare
+        module = importlib.import_module(runner.discover_days()[day])
+        raw_data_list = []
+        for seed in range(3):
+            raw_data = generators.generate_input(day, scale=0.1, seed=seed)
+            raw_data_list.append(raw_data)
+        expected = [
+            (
+                module.solve_part_1(module.parse_input(raw_data)),
+                module.solve_part_2(module.parse_input(raw_data)),
+            )
+            for raw_data in raw_data_list
+        ]
+
+        # Run
+        answers = batch.solve_inputs(day, raw_data_list)
+
+        # Assert
+        assert answers == expected
+
+    @pytest.mark.parametrize("day", [1, 2, 4, 8, 10])
+    def test_vectorized_days(self, day):
+        # Prepare
+        module = importlib.import_module(runner.discover_days()[day])
+        raw_data = generators.generate_input(day, scale=0.2, seed=1)
+
+        # Run
+        answers = module.solve_batch([raw_data, raw_data])
+        no_answers = module.solve_batch([])
+
+        # Assert
+        assert answers[0] == answers[1]
+        assert all(type(answer) in (int, str) for answer in answers[0])
+        assert no_answers == []
+
+    def test_solve_batch_on_process_pool(self, tmp_path):
+        # Prepare
+        data_paths = []
+        for seed in range(5):
+            data_path = tmp_path / f"day4_{seed}.txt"
+            generators.write_input(4, str(data_path), scale=0.1, seed=seed)
+            data_paths.append(str(data_path))
+
+        # Run
+        in_process = batch.solve_batch(4, data_paths, max_workers=0)
+        on_pool = batch.solve_batch(4, data_paths, max_workers=2, chunk_size=2)
+
+        # Assert
+        assert len(in_process) == 5
+        assert on_pool == in_process
+
+    def test_invalid_day(self):
+        # Run / Assert
+        with pytest.raises(ValueError):
+            batch.solve_batch(42, [])
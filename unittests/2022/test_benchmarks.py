@@ -0,0 +1,203 @@
+import functools
+import os
+
+import pytest
+
+from benchmarks import differential, harness, startup
+from benchmarks.cases import CASES, DIFFERENTIAL_CASES, BenchmarkCase
+from src.aoc2022 import implementations, jit, runner
+from src.aoc2022.days import day1
+
+
+class TestBenchmarks:
+    def test_case_names_are_unique(self):
+        # Prepare
+        names = [case.name for case in CASES]
+
+        # Assert
+        assert len(names) == len(set(names))
+
+    def test_every_case_has_a_baseline(self):
+        # Prepare
+        baseline_path = os.path.join("benchmarks", "baseline.json")
+
+        # Run
+        baseline = harness.load_results(baseline_path)
+
+        # Assert
+        assert baseline is not None
+        for case in CASES:
+            scales = {str(scale) for scale in case.scales}
+            assert set(baseline.get(case.name, {})) == scales, case.name
+
+    def test_measure(self):
+        # Prepare
+        case = BenchmarkCase(
+            "day1.get_largest_group_sum",
+            1,
+            day1.get_largest_group_sum,
+            lambda parsed: (parsed,),
+        )
+
+        # Run
+        measurement = harness.measure(case, scale=0.1, repeats=2)
+
+        # Assert
+        assert measurement.seconds > 0
+        assert measurement.peak_memory >= 0
+        assert measurement.counters == {}
+
+    def test_measure_counts_work(self):
+        # Prepare
+        case = next(c for c in CASES if c.name == "day12.get_distance_matrix")
+
+        # Run
+        measurement = harness.measure(case, scale=0.1, repeats=1)
+
+        # Assert
+        assert measurement.counters["day12.bfs_nodes_expanded"] > 0
+
+    def test_counters_are_not_compared(self):
+        # Prepare
+        baseline = {"case": {"1": {"seconds": 1.0, "peak_memory": 1e6}}}
+        metrics = {"seconds": 1.0, "peak_memory": 1e6, "day1.work": 9.0}
+        results = {"case": {"1": metrics}}
+
+        # Run
+        regressions = harness.compare_to_baseline(results, baseline, 0.5)
+        rendered = harness.format_scaling(results)
+
+        # Assert
+        assert regressions == []
+        assert "day1.work=9" in rendered
+
+    def test_compare_to_baseline(self):
+        # Prepare
+        baseline = {
+            "slow": {"1": {"seconds": 1.0, "peak_memory": 1e6}},
+            "fast": {"1": {"seconds": 1.0, "peak_memory": 1e6}},
+        }
+        results = {
+            "slow": {"1": {"seconds": 2.0, "peak_memory": 1e6}},
+            "fast": {"1": {"seconds": 1.2, "peak_memory": 1e6}},
+            "new": {"1": {"seconds": 5.0, "peak_memory": 1e6}},
+        }
+
+        # Run
+        regressions = harness.compare_to_baseline(results, baseline, 0.5)
+
+        # Assert
+        expected = harness.Regression("slow", "1", "seconds", 1.0, 2.0)
+        assert regressions == [expected]
+
+    def test_compare_to_baseline_ignores_noise(self):
+        # Prepare
+        baseline = {"case": {"1": {"seconds": 1e-5, "peak_memory": 100}}}
+        results = {"case": {"1": {"seconds": 1e-4, "peak_memory": 1000}}}
+
+        # Run
+        regressions = harness.compare_to_baseline(results, baseline, 0.5)
+
+        # Assert
+        assert regressions == []
+
+    def test_save_and_load_results(self, tmp_path):
+        # Prepare
+        file_path = str(tmp_path / "results.json")
+        results = {"case": {"1": {"seconds": 0.5, "peak_memory": 1024}}}
+
+        # Run
+        missing = harness.load_results(file_path)
+        harness.save_results(results, file_path)
+        loaded = harness.load_results(file_path)
+
+        # Assert
+        assert missing is None
+        assert loaded == results
+
+    def test_parse_importtime(self):
+        # Prepare
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   src.aoc2022.utils\n"
+            "import time:       300 |       1500 | src.aoc2022.days.day1\n"
+        )
+
+        # Run
+        import_time = startup.parse_importtime(stderr, "src.aoc2022.days.day1")
+
+        # Assert
+        assert import_time == 0.0015
+
+    @pytest.mark.parametrize("day", [1, 8, 12])
+    def test_days_do_not_import_numpy(self, day):
+        # Prepare
+        module = runner.discover_days()[day]
+
+        # Run
+        measurement = startup.measure_startup(module, repeats=1)
+
+        # Assert
+        assert measurement.heavy_imports == []
+        assert 0 < measurement.import_time < measurement.process_time
+
+    def test_every_implemented_solver_is_compared(self):
+        # Prepare
+        case_names = {case.name for case in CASES}
+
+        # Assert
+        assert set(implementations.REGISTRY) <= set(DIFFERENTIAL_CASES)
+        if jit.AVAILABLE:
+            assert set(DIFFERENTIAL_CASES) == set(implementations.REGISTRY)
+        assert set(DIFFERENTIAL_CASES.values()) <= case_names
+
+    @pytest.mark.parametrize("solver_name", list(DIFFERENTIAL_CASES))
+    def test_implementations_agree(self, solver_name):
+        # Prepare
+        if solver_name not in implementations.REGISTRY:
+            pytest.skip(f"{solver_name} has a single implementation here")
+        cases = {case.name: case for case in CASES}
+        case = cases[DIFFERENTIAL_CASES[solver_name]]
+
+        # Run
+        comparisons = differential.compare(solver_name, case, 0.2, repeats=1)
+
+        # Assert
+        names = [c.implementation for c in comparisons]
+        assert names == list(implementations.REGISTRY[solver_name])
+        assert all(c.agrees for c in comparisons)
+        assert comparisons[0].speedup == 1
+
+    def test_rebind(self):
+        # Prepare
+        case_solver = functools.partial(day1.get_largest_group_sum, 1)
+        candidates = [day1.get_largest_group_sum]
+
+        # Run
+        rebound = differential.rebind(case_solver, candidates, max)
+        kept = differential.rebind(case_solver, [min], max)
+
+        # Assert
+        assert rebound.func is max and rebound.args == (1,)
+        assert kept is case_solver
+
+    def test_using_references(self):
+        # Prepare
+        solver_name = "day1.get_largest_group_sum"
+        reference = day1.get_largest_group_sum
+        selected = implementations.select(solver_name, "vectorized")
+
+        # Run
+        try:
+            with differential.using_references(solver_name):
+                compared = day1.get_largest_group_sum
+            with differential.using_references("day8.get_max_scenic_score"):
+                pinned = day1.get_largest_group_sum
+            restored = day1.get_largest_group_sum
+        finally:
+            implementations.select(solver_name, implementations.REFERENCE)
+
+        # Assert
+        assert compared is selected
+        assert pinned is reference
+        assert restored is selected
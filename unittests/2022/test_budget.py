@@ -0,0 +1,103 @@
+import itertools
+
+from src.aoc2022 import budget, utils
+from src.aoc2022.days import day15, day16
+
+
+def make_clock():
+    """Clock advancing by one second at every reading"""
+    return itertools.count().__next__
+
+
+class TestBudget:
+    def test_progress_reports(self):
+        # Prepare
+        reports = []
+        clock = make_clock()
+        loop_budget = budget.Budget(
+            progress=lambda done, total: reports.append((done, total)),
+            interval=2,
+            clock=clock,
+        )
+
+        # Run
+        carried_on = [loop_budget.tick(i, 5) for i in range(5)]
+
+        # Assert
+        assert carried_on == [True] * 5
+        assert reports == [(0, 5), (2, 5), (4, 5)]
+        assert loop_budget.complete
+
+    def test_deadline(self):
+        # Prepare
+        loop_budget = budget.Budget(seconds=3, clock=make_clock())
+
+        # Run
+        carried_on = [loop_budget.tick(i, 5) for i in range(5)]
+
+        # Assert
+        assert carried_on == [True, True, False, False, False]
+        assert not loop_budget.complete
+
+    def test_run_within(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day15_sample.txt"
+        locations = day15.parse_input(utils.get_raw_data(test_data_path))
+        reports = []
+
+        # Run
+        result = budget.run_within(
+            day15.find_tuning_frequency,
+            locations,
+            20,
+            seconds=60,
+            progress=lambda done, total: reports.append((done, total)),
+        )
+
+        # Assert
+        assert result == budget.Budgeted(56_000_011, True)
+        assert reports == [(0, 21)]
+
+    def test_day15_stops_at_deadline(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day15_sample.txt"
+        locations = day15.parse_input(utils.get_raw_data(test_data_path))
+        rows = []
+        row_budget = budget.Budget(
+            seconds=5,
+            progress=lambda done, total: rows.append(done),
+            interval=0,
+            clock=make_clock(),
+        )
+
+        # Run
+        frequency = day15.find_tuning_frequency(
+            locations,
+            20,
+            row_budget,
+            block_size=1,
+        )
+
+        # Assert
+        assert frequency == -1
+        assert rows == [0, 1, 2, 3, 4]
+        assert not row_budget.complete
+
+    def test_day16_returns_best_partition_so_far(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day16_sample.txt"
+        graph = day16.parse_input(utils.get_raw_data(test_data_path))
+        partition_budget = budget.Budget(seconds=10, clock=make_clock())
+
+        # Run
+        _, _, score = day16.get_optimal_dual_sequence(
+            graph,
+            "AA",
+            26,
+            partition_budget,
+        )
+        _, _, best_score = day16.get_optimal_dual_sequence(graph, "AA", 26)
+
+        # Assert
+        assert 0 < score < best_score == 1707
+        assert not partition_budget.complete
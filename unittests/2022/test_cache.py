@@ -0,0 +1,280 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.aoc2022 import cache, graphs, grids, intervals, runner, utils
+from src.aoc2022.days import day1, day8, day11, day12, day14, day15
+
+sample_day1 = "1000\n2000\n\n3000\n\n4000"
+
+
+def helper_function(x):
+    return x + 1
+
+
+def uses_helper(x):
+    return helper_function(x) * 2
+
+
+def does_not_use_helper(x):
+    return x * 2
+
+
+class TestCache:
+    def test_hash_file(self, tmp_path):
+        # Prepare
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text(sample_day1)
+        second.write_text(sample_day1 + "0")
+
+        # Run
+        first_hash = cache.hash_file(str(first), chunk_size=3)
+        second_hash = cache.hash_file(str(second), chunk_size=3)
+
+        # Assert
+        assert first_hash == cache.hash_file(str(first))
+        assert first_hash != second_hash
+
+    def test_code_hash_follows_calls(self, monkeypatch):
+        # Prepare
+        before = cache.get_code_hash(uses_helper)
+        unrelated_before = cache.get_code_hash(does_not_use_helper)
+        getsource = cache.inspect.getsource
+
+        def edited_getsource(obj):
+            if obj is helper_function:
+                return "def helper_function(x):\n    return x + 2\n"
+            return getsource(obj)
+
+        # Run
+        monkeypatch.setattr(cache.inspect, "getsource", edited_getsource)
+        after = cache.get_code_hash(uses_helper)
+        unrelated_after = cache.get_code_hash(does_not_use_helper)
+
+        # Assert
+        assert before != after
+        assert unrelated_before == unrelated_after
+
+    @pytest.mark.parametrize(
+        "helper,function",
+        [
+            (grids.load_grid, day8.parse_input),
+            (graphs.from_grid, day12.solve_part_1),
+            (intervals.find_first_gaps, day15.solve_part_2),
+            (intervals.IntervalSet, day15.count_scanned_location_vectorized),
+        ],
+    )
+    def test_code_hash_follows_helpers(self, monkeypatch, helper, function):
+        # Prepare
+        before = cache.get_code_hash(function)
+        unrelated_before = cache.get_code_hash(day1.solve_part_1)
+        getsource = cache.inspect.getsource
+
+        def edited_getsource(obj):
+            if obj is helper:
+                return getsource(obj) + "    # edited\n"
+            return getsource(obj)
+
+        # Run
+        monkeypatch.setattr(cache.inspect, "getsource", edited_getsource)
+        after = cache.get_code_hash(function)
+        unrelated_after = cache.get_code_hash(day1.solve_part_1)
+
+        # Assert
+        assert before != after
+        assert unrelated_before == unrelated_after
+
+    def test_runner_misses_after_helper_edit(self, tmp_path, monkeypatch):
+        # Prepare
+        (tmp_path / "day8.txt").write_text("30373\n25512\n65332\n33549\n35390")
+        data_path = str(tmp_path / "day8.txt")
+        cache_directory = str(tmp_path / "cache")
+        runner.solve_part(8, 1, data_path, cache_directory)
+        getsource = cache.inspect.getsource
+
+        def edited_getsource(obj):
+            if obj is grids.load_grid:
+                return getsource(obj) + "    # edited\n"
+            return getsource(obj)
+
+        # Run
+        unchanged = runner.solve_part(8, 1, data_path, cache_directory)
+        monkeypatch.setattr(cache.inspect, "getsource", edited_getsource)
+        edited = runner.solve_part(8, 1, data_path, cache_directory)
+        parsed = os.listdir(os.path.join(cache_directory, "parsed"))
+
+        # Assert
+        assert unchanged.cached
+        assert not edited.cached
+        assert edited.answer == 21
+        assert len(parsed) == 2
+
+    def test_code_hash_is_stable(self):
+        # Run
+        first = cache.get_code_hash(day14.parse_input)
+        second = cache.get_code_hash(day14.parse_input)
+
+        # Assert
+        assert first == second
+        assert first != cache.get_code_hash(day8.parse_input)
+
+    @pytest.mark.parametrize(
+        "parsed,extension",
+        [
+            (np.arange(12).reshape(3, 4), ".npy"),
+            ((np.ones((2, 2)), (1, 2), None), ".npz"),
+            ([[1, 2], [3]], ".pkl"),
+        ],
+    )
+    def test_store_and_load(self, tmp_path, parsed, extension):
+        # Prepare
+        parse_cache = cache.ParseCache(str(tmp_path))
+
+        # Run
+        stored = parse_cache.store("key", parsed)
+        loaded = parse_cache.load("key")
+
+        # Assert
+        assert stored
+        assert os.listdir(parse_cache.directory) == ["key" + extension]
+        assert isinstance(loaded, type(parsed))
+        assert repr(loaded) == repr(parsed)
+
+    def test_unpicklable_is_not_stored(self, tmp_path):
+        # Prepare
+        parse_cache = cache.ParseCache(str(tmp_path))
+        parsed = day11.parse_input(
+            utils.get_raw_data("./unittests/2022/test_data/day11_sample.txt")
+        )
+
+        # Run
+        stored = parse_cache.store("key", parsed)
+
+        # Assert
+        assert not stored
+        with pytest.raises(KeyError):
+            parse_cache.load("key")
+
+    def test_parse_hits_on_unchanged_input(self, tmp_path, monkeypatch):
+        # Prepare
+        data_path = tmp_path / "day1.txt"
+        data_path.write_text(sample_day1)
+        parse_cache = cache.ParseCache(str(tmp_path / "cache"))
+        calls = []
+        parse_input = day1.parse_input
+
+        def counting_parse_input(raw_data):
+            calls.append(raw_data)
+            return parse_input(raw_data)
+
+        monkeypatch.setattr(day1, "parse_input", counting_parse_input)
+
+        # Run
+        first = parse_cache.parse(day1, str(data_path))
+        second = parse_cache.parse(day1, str(data_path))
+        data_path.write_text(sample_day1 + "\n\n5000")
+        third = parse_cache.parse(day1, str(data_path))
+
+        # Assert
+        assert first == second == [[1000, 2000], [3000], [4000]]
+        assert third == [[1000, 2000], [3000], [4000], [5000]]
+        assert len(calls) == 2
+
+    def test_evict_least_recently_used(self, tmp_path):
+        # Prepare
+        parse_cache = cache.ParseCache(str(tmp_path), size_limit=2500)
+        array = np.zeros(100)  # 928 bytes as .npy
+        parse_cache.store("oldest", array)
+        parse_cache.store("newest", array)
+        oldest_path = os.path.join(parse_cache.directory, "oldest.npy")
+        newest_path = os.path.join(parse_cache.directory, "newest.npy")
+        os.utime(oldest_path, (1, 1))
+        os.utime(newest_path, (2, 2))
+        parse_cache.load("oldest")  # now the most recently used
+
+        # Run
+        parse_cache.store("latest", array)
+
+        # Assert
+        assert sorted(os.listdir(parse_cache.directory)) == [
+            "latest.npy",
+            "oldest.npy",
+        ]
+
+    def test_runner_with_cache(self, tmp_path):
+        # Prepare
+        (tmp_path / "day1.txt").write_text(sample_day1)
+        data_path = str(tmp_path / "day1.txt")
+        cache_directory = str(tmp_path / "cache")
+
+        # Run
+        first = runner.solve_part(1, 2, data_path, cache_directory)
+        second = runner.solve_part(1, 2, data_path, cache_directory)
+
+        # Assert
+        assert first.answer == second.answer == 3000 + 3000 + 4000
+        assert len(os.listdir(os.path.join(cache_directory, "parsed"))) == 1
+
+    @pytest.mark.parametrize("answer", [42, "line 1\nline 2"])
+    def test_answer_store_and_load(self, tmp_path, answer):
+        # Prepare
+        answer_cache = cache.AnswerCache(str(tmp_path))
+
+        # Run
+        answer_cache.store(1, 2, "input", "code", answer)
+        loaded = answer_cache.load(1, 2, "input", "code")
+
+        # Assert
+        assert loaded == answer
+        with pytest.raises(KeyError):
+            answer_cache.load(1, 2, "input", "edited code")
+        with pytest.raises(KeyError):
+            answer_cache.load(1, 1, "input", "code")
+
+    def test_answer_connections_are_closed(self, tmp_path, monkeypatch):
+        # Prepare
+        connections = []
+        connect = cache.sqlite3.connect
+
+        def recording_connect(*args, **kwargs):
+            connections.append(connect(*args, **kwargs))
+            return connections[-1]
+
+        monkeypatch.setattr(cache.sqlite3, "connect", recording_connect)
+
+        # Run
+        answer_cache = cache.AnswerCache(str(tmp_path))
+        answer_cache.store(1, 2, "input", "code", 42)
+        answer_cache.load(1, 2, "input", "code")
+
+        # Assert
+        assert len(connections) == 3
+        for connection in connections:
+            with pytest.raises(cache.sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+
+    def test_runner_reuses_answers(self, tmp_path, monkeypatch):
+        # Prepare
+        (tmp_path / "day1.txt").write_text(sample_day1)
+        data_path = str(tmp_path / "day1.txt")
+        cache_directory = str(tmp_path / "cache")
+        runner.solve_part(1, 1, data_path, cache_directory)
+        runner.solve_part(1, 2, data_path, cache_directory)
+        get_code_hash = cache.get_code_hash
+
+        def edited_get_code_hash(*functions):
+            if functions[0] is day1.solve_part_2:
+                return "edited"
+            return get_code_hash(*functions)
+
+        # Run
+        monkeypatch.setattr(cache, "get_code_hash", edited_get_code_hash)
+        part_1 = runner.solve_part(1, 1, data_path, cache_directory)
+        part_2 = runner.solve_part(1, 2, data_path, cache_directory)
+
+        # Assert
+        assert part_1.cached
+        assert not part_2.cached
+        assert (part_1.answer, part_2.answer) == (4000, 10_000)
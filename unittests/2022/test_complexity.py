@@ -0,0 +1,56 @@
+import pytest
+
+from benchmarks import harness
+from benchmarks.cases import CASES, GROWTH_BOUNDS
+
+ATTEMPTS = 3
+"""
+Number of fits before a bound is reported as exceeded, a solver with a
+worse complexity exceeds it on every attempt while noise rarely does
+"""
+
+
+def bound_id(bound):
+    return bound.case
+
+
+class TestComplexity:
+    @pytest.mark.parametrize(
+        "exponent",
+        [0.5, 1, 2],
+    )
+    def test_fit_exponent(self, exponent):
+        # Prepare
+        sizes = [1, 2, 4, 8]
+        seconds = [0.003 * size**exponent for size in sizes]
+
+        # Run
+        fitted = harness.fit_exponent(sizes, seconds)
+
+        # Assert
+        assert fitted == pytest.approx(exponent)
+
+    def test_bounds_name_cases(self):
+        # Prepare
+        case_names = {case.name for case in CASES}
+
+        # Run
+        bound_names = {bound.case for bound in GROWTH_BOUNDS}
+
+        # Assert
+        assert bound_names <= case_names
+
+    @pytest.mark.parametrize("bound", GROWTH_BOUNDS, ids=bound_id)
+    def test_growth_within_bound(self, bound):
+        # Prepare
+        case = {case.name: case for case in CASES}[bound.case]
+
+        # Run
+        exponents = []
+        for _ in range(ATTEMPTS):
+            exponents.append(harness.measure_growth(case, bound.scales))
+            if exponents[-1] <= bound.max_exponent:
+                break
+
+        # Assert
+        assert min(exponents) <= bound.max_exponent
@@ -1,11 +1,27 @@
+import io
+import random
+import subprocess
+import sys
+import tracemalloc
+
 import hypothesis.strategies as st
+import numpy as np
+import pytest
 from hypothesis import given
 
+from src.aoc2022 import generators
 from src.aoc2022.days import day1
 
 non_neg_integer = st.integers(min_value=0, max_value=100_000)
 integer_list = st.lists(non_neg_integer, min_size=1, max_size=1024)
 list_of_lists = st.lists(integer_list, min_size=3, max_size=64)
+small_integer_list = st.lists(st.integers(0, 3), min_size=0, max_size=3)
+tied_groups = st.lists(small_integer_list, min_size=0, max_size=16)
+top_k = st.integers(min_value=0, max_value=20)
+# a value added to the last group, None to end the group
+leaderboard_updates = st.lists(
+    st.one_of(st.none(), st.integers(0, 3)), min_size=0, max_size=48
+)
 
 
 class TestDay1:
@@ -86,3 +102,267 @@ class TestDay1:
         assert top_groups[0][1] == sorted_sums[-3]  # 3rd largest
         assert top_groups[1][1] == sorted_sums[-2]  # 2nd largest
         assert top_groups[2][1] == sorted_sums[-1]  # largest
+
+    def test_parse_data_to_groups(self):
+        # Prepare
+        raw_data = "\n  1000\n2000\n\n\n4000\n \n5000\r\n6000\r\n"
+
+        # Run
+        groups = day1.parse_data_to_groups(raw_data)
+        from_bytes = day1.parse_data_to_groups(raw_data.encode())
+        from_blocks = day1.parse_data_to_groups([["1000", "2000"], ["4000"]])
+
+        # Assert
+        assert groups.values.tolist() == [1000, 2000, 4000, 5000, 6000]
+        assert groups.offsets.tolist() == [0, 2, 3, 5]
+        assert from_bytes.offsets.tolist() == [0, 2, 3, 5]
+        assert from_blocks.offsets.tolist() == [0, 2, 3]
+        assert day1.parse_data_to_groups("").offsets.tolist() == [0]
+
+    def test_get_group_sums(self):
+        # Prepare
+        groups = day1.to_groups([[1, 2], [], [3], []])
+
+        # Run
+        sums = day1.get_group_sums(groups)
+
+        # Assert
+        assert sums.tolist() == [3, 0, 3, 0]
+
+    def test_select_top_k(self):
+        # Prepare
+        sums = np.array([5, 9, 5, 1, 9])
+
+        # Run
+        top_2 = day1.select_top_k(sums, 2)
+        top_3 = day1.select_top_k(sums, 3)
+        top_7 = day1.select_top_k(sums, 7)
+
+        # Assert
+        assert top_2 == [(4, 9), (1, 9)]
+        assert top_3 == [(0, 5), (4, 9), (1, 9)]
+        assert top_7[:2] == [(0, -1), (0, -1)]
+        assert top_7[2:] == [(3, 1), (2, 5), (0, 5), (4, 9), (1, 9)]
+
+    @given(tied_groups)  # property-based testing
+    def test_property_based_vectorized_matches_loops(self, groups):
+        # Run
+        largest = day1.get_largest_group_sum_vectorized(groups)
+        top_3 = day1.get_3_largest_group_sum_vectorized(groups)
+
+        # Assert
+        assert largest == day1.get_largest_group_sum(groups)
+        assert top_3 == day1.get_3_largest_group_sum(groups)
+
+    def test_example_based_get_k_largest_group_sum(self):
+        # Prepare
+        input_data = [[1000, 2000], [4000], [3000], [500], [1500, 1500]]
+
+        # Run
+        top_2 = day1.get_k_largest_group_sum(input_data, 2)
+        top_7 = day1.get_k_largest_group_sum(input_data, 7)
+
+        # Assert
+        assert top_2 == [(0, 3000), (1, 4000)]
+        assert top_7 == [
+            (0, -1),
+            (0, -1),
+            (3, 500),
+            (4, 3000),
+            (2, 3000),
+            (0, 3000),
+            (1, 4000),
+        ]
+        assert day1.get_k_largest_group_sum(input_data, 0) == []
+
+    @given(tied_groups, top_k)  # property-based testing
+    def test_property_based_get_k_largest_group_sum(self, groups, k):
+        # prepare
+        ranked = sorted(
+            ((sum(group), -idx) for idx, group in enumerate(groups)),
+            reverse=True,
+        )
+        expected = [(-neg_idx, sum_) for sum_, neg_idx in ranked[:k]][::-1]
+        expected = [(0, -1)] * (k - len(expected)) + expected
+
+        # Run
+        top_k = day1.get_k_largest_group_sum(groups, k)
+        top_k_vectorized = day1.get_k_largest_group_sum_vectorized(groups, k)
+
+        # Assert
+        assert top_k == expected
+        assert top_k_vectorized == expected
+
+    def test_solve_stream(self):
+        # Prepare
+        raw_data = "1000\n2000\n\n\n4000\n  \n5000\n6000\n\n7000\n"
+        groups = day1.parse_input(raw_data)
+        expected = (day1.solve_part_1(groups), day1.solve_part_2(groups))
+
+        # Run
+        answers = day1.solve_stream(io.StringIO(raw_data))
+        top_2 = day1.stream_k_largest_group_sum(raw_data.split("\n"), 2)
+
+        # Assert
+        assert answers == expected
+        assert top_2 == day1.get_k_largest_group_sum(groups, 2)
+        assert day1.solve_stream([]) == (-1, -3)
+
+    def test_stream_memory_is_flat(self):
+        # Prepare
+        generator = generators.get_generator(1)
+        peaks = []
+
+        # Run
+        for scale in (1, 16):
+            lines = generator.iter_lines(scale, random.Random(0))
+            tracemalloc.start()
+            try:
+                day1.stream_k_largest_group_sum(lines, 10)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+
+        # Assert
+        assert peaks[1] < 16 * 1024
+        assert peaks[1] < 2 * peaks[0]
+
+    def test_split_into_chunks(self):
+        # Prepare
+        raw_data = generators.generate_input(1, 0.5, 0)
+        buffer = raw_data.replace("\n", "\r\n").encode()
+        expected = day1.parse_data_to_groups(buffer).offsets.size - 1
+
+        for chunk_bytes in (1, 7, 100, 1000, len(buffer)):
+            # Run
+            chunks = day1.split_into_chunks(buffer, chunk_bytes)
+            counts = [
+                day1.parse_data_to_groups(buffer[start:end]).offsets.size - 1
+                for start, end in chunks
+            ]
+
+            # Assert
+            starts = [start for start, _ in chunks]
+            ends = [end for _, end in chunks]
+            assert starts[0] == 0 and ends[-1] == len(buffer)
+            assert starts[1:] == ends[:-1]
+            assert sum(counts) == expected
+
+    def test_merge_chunk_tops(self):
+        # Prepare
+        chunk_tops = [
+            day1.ChunkTop(3, [(2, 5), (0, 9)]),
+            day1.ChunkTop(0, []),
+            day1.ChunkTop(2, [(1, 5), (0, 9)]),
+        ]
+
+        # Run
+        top_3 = day1.merge_chunk_tops(chunk_tops, 3)
+        top_5 = day1.merge_chunk_tops(chunk_tops, 5)
+
+        # Assert
+        assert top_3 == [(2, 5), (3, 9), (0, 9)]
+        assert top_5 == [(0, -1), (4, 5), (2, 5), (3, 9), (0, 9)]
+
+    def test_get_k_largest_group_sum_parallel(self, tmp_path):
+        # Prepare
+        file_path = str(tmp_path / "day1.txt")
+        generators.write_input(1, file_path, 2, 0)
+        groups = day1.parse_input(generators.generate_input(1, 2, 0))
+        expected = day1.get_k_largest_group_sum(groups, 20)
+
+        # Run
+        in_process = day1.get_k_largest_group_sum_parallel(
+            file_path, 20, max_workers=0, chunk_bytes=1000
+        )
+        on_pool = day1.get_k_largest_group_sum_parallel(
+            file_path, 20, max_workers=2, chunk_bytes=1000
+        )
+
+        # Assert
+        assert in_process == expected
+        assert on_pool == expected
+
+    def test_group_leaderboard(self):
+        # Prepare
+        leaderboard = day1.GroupLeaderboard()
+
+        # Run
+        empty = (leaderboard.largest(), leaderboard.top_k_sum(3))
+        leaderboard.add_lines(["1000", "2000", "", "4000", "", "5000"])
+        leaderboard.add_value(6000)
+        leaderboard.add_group([7000, 8000, 9000])
+        leaderboard.add_value(10_000)
+
+        # Assert
+        assert empty == ((0, -1), -3)
+        assert len(leaderboard) == 5
+        assert leaderboard.largest() == (3, 24_000)
+        assert leaderboard.top_k_sum(3) == 45_000
+        assert leaderboard.top_k_sum(7) == 52_000 - 2
+        assert [leaderboard.rank(i) for i in range(5)] == [4, 3, 1, 0, 2]
+        with pytest.raises(IndexError):
+            leaderboard.rank(5)
+
+    @given(leaderboard_updates, top_k)  # property-based testing
+    def test_property_based_group_leaderboard(self, updates, k):
+        # Prepare
+        leaderboard = day1.GroupLeaderboard()
+        groups = []
+        is_open = False
+
+        # Run
+        for value in updates:
+            if value is None:
+                leaderboard.end_group()
+                is_open = False
+            elif is_open:
+                leaderboard.add_value(value)
+                groups[-1].append(value)
+            else:
+                leaderboard.add_value(value)
+                groups.append([value])
+                is_open = True
+
+        # Assert
+        expected = day1.get_k_largest_group_sum(groups, k)
+        ranked = sorted(range(len(groups)), key=lambda i: -sum(groups[i]))
+        assert leaderboard.largest() == day1.get_largest_group_sum(groups)
+        assert leaderboard.top_k_sum(k) == sum(t[1] for t in expected)
+        for rank, idx in enumerate(ranked):
+            assert leaderboard.rank(idx) == rank
+
+    def test_group_leaderboard_checkpoint(self, tmp_path):
+        # Prepare
+        file_path = str(tmp_path / "leaderboard.json")
+        leaderboard = day1.GroupLeaderboard()
+        leaderboard.add_lines(["3", "", "5", "1"])
+        leaderboard.save(file_path)
+
+        # Run
+        resumed = day1.GroupLeaderboard.load(file_path)
+        resumed.add_value(2)
+        leaderboard.add_value(2)
+
+        # Assert
+        assert resumed.to_state() == {"sums": [3, 8], "is_open": True}
+        assert resumed.to_state() == leaderboard.to_state()
+        assert resumed.largest() == (1, 8)
+
+    def test_import_does_not_load_json(self):
+        # Prepare
+        code = (
+            "import sys, src.aoc2022.days.day1; "
+            "print(type(sys.modules.get('json')).__name__)"
+        )
+
+        # Run
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        assert completed.stdout.split() in (["NoneType"], ["_LazyModule"])
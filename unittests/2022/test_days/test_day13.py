@@ -86,3 +86,29 @@ class TestDay13:
 
         # Assert
         assert expected_packets == sorted_packets
+
+    def test_count_ordered_pairs(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day13_sample.txt"
+        input_data = utils.get_raw_data(test_data_path)
+        parsed_data = day13.parse_data_to_array(input_data)
+        expected_sum = 13
+
+        # Run
+        actual_sum = day13.count_ordered_pairs(parsed_data)
+
+        # Assert
+        assert actual_sum == expected_sum
+
+    def test_get_decoder_key(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day13_sample.txt"
+        input_data = utils.get_raw_data(test_data_path)
+        parsed_data = day13.parse_data_to_array(input_data)
+        expected_key = 96  # sample file omits the 8th pair
+
+        # Run
+        actual_key = day13.get_decoder_key(parsed_data)
+
+        # Assert
+        assert actual_key == expected_key
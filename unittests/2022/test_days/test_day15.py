@@ -97,3 +97,45 @@ class TestDay15:
         # Assert
         assert expected_ranges == actual_ranges
         assert actual_count == expected_count
+
+    @pytest.mark.parametrize(
+        "line_number, bounding_range",
+        [
+            (9, None),
+            (10, (0, 20)),
+            (11, (0, 20)),
+            (16, (-1, 8)),
+            (18, (30, 40)),
+            (30, None),
+        ],
+    )
+    def test_vectorized_agrees(self, line_number, bounding_range):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day15_sample.txt"
+        input_data = utils.get_raw_data(test_data_path)
+        parsed_data = day15.parse_data_to_array(input_data)
+        parsed_data += [(0, 30, 0, 29), (3, 30, 3, 29)]  # touching ranges
+
+        # Run
+        actual_result = day15.count_scanned_location_vectorized(
+            parsed_data, line_number, bounding_range
+        )
+        expected_result = day15.count_scanned_location(
+            parsed_data, line_number, bounding_range
+        )
+
+        # Assert
+        assert actual_result == expected_result
+
+    def test_find_tuning_frequency(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day15_sample.txt"
+        input_data = utils.get_raw_data(test_data_path)
+        parsed_data = day15.parse_data_to_array(input_data)
+        expected_frequency = 56_000_011
+
+        # Run
+        actual_frequency = day15.find_tuning_frequency(parsed_data, 20)
+
+        # Assert
+        assert actual_frequency == expected_frequency
@@ -90,3 +90,20 @@ class TestDay8:
 
         # Assert
         assert expected_max_score == actual_max_score
+
+    def test_count_trees_seen_on_left(self):
+        # Prepare
+        heights = parsed_data[np.newaxis]
+        expected_distance = [
+            [0, 1, 2, 3, 1],
+            [0, 1, 1, 1, 2],
+            [0, 1, 1, 1, 1],
+            [0, 1, 2, 1, 4],
+            [0, 1, 1, 3, 1],
+        ]
+
+        # Run
+        distance = day8.count_trees_seen_on_left(heights)
+
+        # Assert
+        assert distance.tolist() == [expected_distance]
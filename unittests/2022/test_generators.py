@@ -0,0 +1,77 @@
+import importlib
+
+import pytest
+
+from src.aoc2022 import generators, runner
+
+all_days = list(runner.discover_days().keys())
+
+
+class TestGenerators:
+    @pytest.mark.parametrize("day", all_days)
+    def test_generated_input_is_solvable(self, day):
+        # Prepare
+        module = importlib.import_module(runner.discover_days()[day])
+        raw_data = generators.generate_input(day, scale=0.1, seed=1234)
+
+        # Run
+        parsed_data = module.parse_input(raw_data)
+        answer = module.solve_part_1(parsed_data)
+
+        # Assert
+        assert isinstance(answer, (int, str))
+
+    @pytest.mark.parametrize("day", all_days)
+    def test_generated_input_is_reproducible(self, day):
+        # Run
+        first = generators.generate_input(day, scale=0.5, seed=1)
+        second = generators.generate_input(day, scale=0.5, seed=1)
+        other = generators.generate_input(day, scale=0.5, seed=2)
+
+        # Assert
+        assert first == second
+        assert first != other
+
+    @pytest.mark.parametrize("day", [1, 2, 4, 6, 8, 9, 10, 13, 15])
+    def test_generated_input_scales(self, day):
+        # Run
+        small = generators.generate_input(day, scale=1, seed=1)
+        large = generators.generate_input(day, scale=4, seed=1)
+
+        # Assert
+        assert 3 < len(large) / len(small) < 5
+
+    def test_day12_end_is_reachable(self):
+        # Prepare
+        day12 = importlib.import_module("src.aoc2022.days.day12")
+
+        for seed in range(10):
+            raw_data = generators.generate_input(12, scale=0.2, seed=seed)
+            parsed_data = day12.parse_input(raw_data)
+
+            # Run
+            path_length = day12.solve_part_1(parsed_data)
+
+            # Assert
+            assert path_length >= 25
+
+    def test_write_input(self, tmp_path):
+        # Prepare
+        file_path = str(tmp_path / "day6.txt")
+        expected_data = generators.generate_input(6, scale=100, seed=3)
+
+        # Run
+        num_chars = generators.write_input(6, file_path, scale=100, seed=3)
+
+        # Assert
+        with open(file_path, "r") as file:
+            assert file.read() == expected_data
+        assert num_chars == len(expected_data) == 409_600
+
+    def test_invalid_day(self):
+        # Run
+        with pytest.raises(ValueError) as exc_info:
+            generators.generate_input(42)
+
+        # Assert
+        assert str(exc_info.value) == "No input generator for day 42"
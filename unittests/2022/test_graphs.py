@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from src.aoc2022 import cache, graphs
+from src.aoc2022.days import day12, day16
+
+
+def can_climb(heights, next_heights):
+    return next_heights - heights <= 1
+
+
+class TestGraphs:
+    def test_from_grid(self):
+        # Prepare
+        values = np.array([[0, 1], [3, 2]])
+
+        # Run
+        graph = graphs.from_grid(values, can_climb)
+
+        # Assert
+        assert graph.num_nodes == 4
+        assert graph.offsets.tolist() == [0, 1, 3, 5, 7]
+        neighbours = [
+            sorted(graph.targets[start:end].tolist())
+            for start, end in zip(graph.offsets[:-1], graph.offsets[1:])
+        ]
+        assert neighbours == [[1], [0, 3], [0, 3], [1, 2]]
+
+    def test_from_adjacency(self):
+        # Prepare
+        connections = {"AA": ["BB", "CC"], "BB": ["AA"], "CC": ["DD"]}
+
+        # Run
+        graph, names = graphs.from_adjacency(connections)
+
+        # Assert
+        assert names == ["AA", "BB", "CC", "DD"]
+        assert graph.offsets.tolist() == [0, 2, 3, 4, 4]
+        assert graph.targets.tolist() == [1, 2, 0, 3]
+
+    def test_bfs(self):
+        # Prepare
+        connections = {"AA": ["BB", "CC"], "BB": ["AA"], "CC": ["DD"]}
+        graph, _ = graphs.from_adjacency(connections)
+
+        # Run
+        single_source = graphs.bfs(graph, [1])
+        multi_source = graphs.bfs(graph, [1, 3])
+        from_sink = graphs.bfs(graph, [3])
+
+        # Assert
+        assert single_source.tolist() == [1, 0, 2, 3]
+        assert multi_source.tolist() == [1, 0, 2, 0]
+        assert from_sink.tolist() == [-1, -1, -1, 0]
+
+    def test_all_pairs_bfs(self):
+        # Prepare
+        connections = {"AA": ["BB", "CC"], "BB": ["AA"], "CC": ["DD"]}
+        graph, _ = graphs.from_adjacency(connections)
+
+        # Run
+        distances = graphs.all_pairs_bfs(graph)
+
+        # Assert
+        expected = [graphs.bfs(graph, [node]) for node in range(4)]
+        np.testing.assert_array_equal(distances, expected)
+        assert distances[0].tolist() == [0, 1, 1, 2]
+
+    @pytest.mark.parametrize(
+        "module, helper_name",
+        [
+            (day12, "from_grid"),
+            (day12, "bfs"),
+            (day16, "from_adjacency"),
+            (day16, "bfs"),
+            (day16, "all_pairs_bfs"),
+        ],
+    )
+    def test_hash_follows_graphs(self, monkeypatch, module, helper_name):
+        # Prepare
+        helper = getattr(graphs, helper_name)  # bfs may be the Numba one
+        solvers = [module.solve_part_1, module.solve_part_2]
+        before = [cache.get_code_hash(s, module.parse_input) for s in solvers]
+        getsource = cache.inspect.getsource
+
+        def edited_getsource(obj):
+            if obj is helper:
+                return getsource(obj) + "    # edited\n"
+            return getsource(obj)
+
+        # Run
+        monkeypatch.setattr(cache.inspect, "getsource", edited_getsource)
+        after = [cache.get_code_hash(s, module.parse_input) for s in solvers]
+
+        # Assert
+        assert before[0] != after[0]
+        assert before[1] != after[1]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from src.aoc2022 import cache, grids, utils
+from src.aoc2022.days import day8, day12
+
+
+class TestGrids:
+    @pytest.mark.parametrize(
+        "raw_data",
+        [
+            "abc\ndef\n",
+            "abc\r\ndef\r\n",
+            "\n\nabc\ndef\n\n",
+            b"abc\ndef",
+            ["abc", "def"],
+        ],
+    )
+    def test_load_grid(self, raw_data):
+        # Prepare
+        expected_values = np.array([[97, 98, 99], [100, 101, 102]])
+
+        # Run
+        values, markers = grids.load_grid(raw_data)
+
+        # Assert
+        assert values.dtype == np.uint8
+        assert values.flags.c_contiguous
+        np.testing.assert_array_equal(values, expected_values)
+        assert markers == {}
+
+    def test_load_grid_with_table_and_markers(self):
+        # Prepare
+        table = grids.make_table({"S": 0, "E": 9, ".": 1, "#": 2})
+
+        # Run
+        values, markers = grids.load_grid("S.#\n#.E", table, "SEX")
+
+        # Assert
+        np.testing.assert_array_equal(values, [[0, 1, 2], [2, 1, 9]])
+        assert markers == {"S": (0, 0), "E": (1, 2)}
+
+    def test_load_mapped_grid(self, tmp_path):
+        # Prepare
+        file_path = tmp_path / "grid.txt"
+        file_path.write_bytes(b"012\n345\n")
+        table = grids.make_table({str(digit): digit for digit in range(10)})
+
+        # Run
+        with utils.map_raw_data(str(file_path)) as buffer:
+            values, _ = grids.load_grid(buffer, table)
+
+        # Assert
+        np.testing.assert_array_equal(values, [[0, 1, 2], [3, 4, 5]])
+
+    def test_load_empty_grid(self):
+        # Run
+        values, markers = grids.load_grid("\n")
+
+        # Assert
+        assert values.shape == (0, 0)
+        assert markers == {}
+
+    @pytest.mark.parametrize("raw_data", ["ab\nc", "ab\n\nab", "a\nb\n\nc"])
+    def test_load_ragged_grid(self, raw_data):
+        # Run / Assert
+        with pytest.raises(ValueError):
+            grids.load_grid(raw_data)
+
+    @pytest.mark.parametrize("helper", [grids.load_grid, grids.to_buffer])
+    @pytest.mark.parametrize("module", [day8, day12])
+    def test_parse_cache_follows_grid_loader(
+        self, tmp_path, monkeypatch, helper, module
+    ):
+        # Prepare
+        parse_cache = cache.ParseCache(str(tmp_path))
+        before = parse_cache.get_key(module, "input")
+        getsource = cache.inspect.getsource
+
+        def edited_getsource(obj):
+            if obj is helper:
+                return getsource(obj) + "    # edited\n"
+            return getsource(obj)
+
+        # Run
+        monkeypatch.setattr(cache.inspect, "getsource", edited_getsource)
+        after = parse_cache.get_key(module, "input")
+
+        # Assert
+        assert before != after
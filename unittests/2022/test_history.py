@@ -0,0 +1,77 @@
+from benchmarks import history
+from benchmarks.cases import CASES
+from src.aoc2022 import runner
+
+
+def make_results(seconds, peak_memory=1024):
+    metrics = {"seconds": seconds, "peak_memory": peak_memory, "day1.work": 3}
+    return {"day1.case": {"1": metrics}}
+
+
+class TestHistory:
+    def test_every_day_is_benchmarked(self):
+        # Prepare
+        days = {case.day for case in CASES}
+
+        # Assert
+        assert days == set(runner.discover_days())
+        assert len(days) == 16
+
+    def test_record_and_load(self, tmp_path):
+        # Prepare
+        file_path = str(tmp_path / "history.sqlite")
+
+        # Run
+        first = history.record(make_results(0.5), file_path, "abc")
+        second = history.record(make_results(0.6), file_path, "def")
+        series = history.load_series(file_path)
+        others = history.load_series(file_path, ["day2"])
+
+        # Assert
+        assert (first, second) == (1, 2)
+        assert list(series["day1.case"]["1"]) == ["peak_memory", "seconds"]
+        assert series["day1.case"]["1"]["seconds"] == [
+            history.Point(1, "abc", 0.5),
+            history.Point(2, "def", 0.6),
+        ]
+        assert others == {}
+
+    def test_find_slowdown(self):
+        # Prepare
+        commits = "abcdef"
+
+        def make_points(*values):
+            points = []
+            for i, value in enumerate(values):
+                points.append(history.Point(i, commits[i], value))
+            return points
+
+        # Run
+        lasting = history.find_slowdown(make_points(1, 1, 2, 3, 2), 0, 0.5)
+        spike = history.find_slowdown(make_points(1, 2, 1, 1), 0, 0.5)
+        noise = history.find_slowdown(make_points(1, 1.2, 1.3), 0, 0.5)
+        latest = history.find_slowdown(make_points(1, 2, 1, 2), 0, 0.5)
+
+        # Assert
+        assert lasting == 2
+        assert spike is None
+        assert noise is None
+        assert latest == 3
+
+    def test_find_slowdowns(self, tmp_path):
+        # Prepare
+        file_path = str(tmp_path / "history.sqlite")
+        runs = [("a", 0.1), ("b", 0.1), ("c", 0.3), ("d", 0.3)]
+        for commit, seconds in runs:
+            history.record(make_results(seconds), file_path, commit)
+        series = history.load_series(file_path)
+
+        # Run
+        slowdowns = history.find_slowdowns(series, 0.5)
+        rendered = history.format_trends(series)
+
+        # Assert
+        expected = history.Slowdown("day1.case", "1", "seconds", "c", 0.1, 0.3)
+        assert slowdowns == [expected]
+        assert "4 runs" in rendered
+        assert "x3.00" in rendered
@@ -0,0 +1,62 @@
+import pytest
+
+from src.aoc2022 import implementations
+from src.aoc2022.days import day3
+
+
+def double(value):
+    return 2 * value
+
+
+class TestImplementations:
+    def test_registry(self):
+        # Run
+        solver = implementations.REGISTRY["day3.get_shared_element"]
+
+        # Assert
+        assert solver["reference"] is day3.get_shared_element
+        assert solver["set"] is day3.get_shared_element_with_set
+
+    def test_implements(self):
+        # Prepare
+        def add(value):
+            return value + value
+
+        # Run
+        decorated = implementations.implements(double, "add")(add)
+        solver = implementations.REGISTRY.pop("test_implementations.double")
+
+        # Assert
+        assert decorated is add
+        assert solver == {"reference": double, "add": add}
+
+    def test_implements_twice(self):
+        # Prepare
+        register = implementations.implements(double, "add")
+        register(lambda value: value + value)
+
+        # Run / Assert
+        with pytest.raises(ValueError):
+            register(lambda value: value * 2)
+        implementations.REGISTRY.pop("test_implementations.double")
+
+    def test_using(self):
+        # Prepare
+        items = [[1, 2, 3, 1], [4, 5, 6, 5]]
+        expected = day3.count_total_priority(items)
+
+        # Run
+        with implementations.using("day3.get_shared_element", "set") as f:
+            in_use = day3.get_shared_element
+            actual = day3.count_total_priority(items)
+
+        # Assert
+        assert in_use is f is day3.get_shared_element_with_set
+        assert actual == expected == 6
+        solver = implementations.REGISTRY["day3.get_shared_element"]
+        assert day3.get_shared_element is solver["reference"]
+
+    def test_select_unknown_implementation(self):
+        # Run / Assert
+        with pytest.raises(KeyError):
+            implementations.select("day3.get_shared_element", "missing")
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from src.aoc2022 import intervals
+
+
+class TestIntervals:
+    def test_merge(self):
+        # Prepare
+        starts = np.array([5, 0, 3, 10, 20, 11])
+        ends = np.array([6, 2, 4, 12, 19, 11])
+
+        # Run
+        merged_starts, merged_ends = intervals.merge(starts, ends)
+
+        # Assert
+        assert merged_starts.tolist() == [0, 10]
+        assert merged_ends.tolist() == [6, 12]
+
+    def test_merge_keeping_touching_apart(self):
+        # Prepare
+        starts = np.array([5, 0, 3, 10, 20, 11])
+        ends = np.array([6, 2, 4, 12, 19, 11])
+
+        # Run
+        merged_starts, merged_ends = intervals.merge(starts, ends, False)
+        interval_set = intervals.IntervalSet(starts, ends, False)
+        clipped = interval_set.add([13], [14]).clip(1, 13)
+
+        # Assert
+        assert merged_starts.tolist() == [0, 3, 5, 10]
+        assert merged_ends.tolist() == [2, 4, 6, 12]
+        assert interval_set.length() == 10
+        assert clipped.to_list()[-2:] == [(10, 12), (13, 13)]
+        assert len(clipped) == 5
+
+    def test_interval_set(self):
+        # Prepare
+        interval_set = intervals.IntervalSet([0, 10], [4, 12])
+
+        # Run
+        extended = interval_set.add([5, 20], [6, 21])
+        clipped = extended.clip(2, 20)
+
+        # Assert
+        assert extended.to_list() == [(0, 6), (10, 12), (20, 21)]
+        assert extended.length() == 12
+        assert clipped.to_list() == [(2, 6), (10, 12), (20, 20)]
+        assert len(clipped) == 3
+
+    @pytest.mark.parametrize(
+        "starts, ends, points, expected_count",
+        [
+            ([0, 10], [4, 12], [-1, 0, 4, 5, 9, 10, 12, 13], 4),
+            ([0], [4], [2, 2, 2], 3),
+            ([], [], [1, 2], 0),
+        ],
+    )
+    def test_count_members(self, starts, ends, points, expected_count):
+        # Prepare
+        interval_set = intervals.IntervalSet(starts, ends)
+
+        # Run
+        count = interval_set.count_members(points)
+
+        # Assert
+        assert count == expected_count
+
+    def test_intersection_sizes(self):
+        # Prepare
+        first = np.array([[2, 4], [2, 8], [5, 7]])
+        second = np.array([[6, 8], [3, 7], [7, 9]])
+
+        # Run
+        sizes = intervals.intersection_sizes(*first.T, *second.T)
+
+        # Assert
+        assert sizes.tolist() == [0, 5, 1]
+
+    def test_find_first_gaps(self):
+        # Prepare
+        starts = np.array([[0, 5], [0, 9], [-5, 3], [8, -9], [2, 0]])
+        ends = np.array([[3, 9], [8, 12], [1, 7], [20, -1], [1, 20]])
+
+        # Run
+        gaps = intervals.find_first_gaps(starts, ends, 0, 9)
+
+        # Assert
+        assert gaps.tolist() == [4, -1, 2, 0, -1]
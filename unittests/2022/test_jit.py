@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from src.aoc2022 import graphs, implementations, jit
+from src.aoc2022.days import day8, day9, day14
+
+needs_numba = pytest.mark.skipif(not jit.AVAILABLE, reason="needs Numba")
+
+
+def add(left, right):
+    return left + right
+
+
+class TestJit:
+    def test_kernel_falls_back_without_numba(self, monkeypatch):
+        # Prepare
+        monkeypatch.setattr(jit, "AVAILABLE", False)
+        kernel = jit.kernel(add)
+
+        # Run
+        result = kernel(2, 3)
+
+        # Assert
+        assert result == 5
+        assert kernel.__wrapped__ is add
+
+    def test_accelerates_does_nothing_without_numba(self, monkeypatch):
+        # Prepare
+        monkeypatch.setattr(jit, "AVAILABLE", False)
+        registry_before = dict(implementations.REGISTRY)
+
+        # Run
+        decorated = jit.accelerates(day9.get_knot_positions)(add)
+
+        # Assert
+        assert decorated is add
+        assert implementations.REGISTRY == registry_before
+
+    @needs_numba
+    def test_kernels_are_selected(self):
+        # Prepare
+        names = [
+            "day8.compute_scenic_score",
+            "day9.get_multi_knot_positions",
+            "day14.simulate_grain_of_sand",
+            "graphs.bfs",
+        ]
+
+        compiled = day9.get_multi_knot_positions_compiled
+
+        # Assert
+        for name in names:
+            assert jit.NUMBA in implementations.REGISTRY[name]
+        assert day9.get_multi_knot_positions is compiled
+
+    @needs_numba
+    def test_bfs_agrees_with_reference(self):
+        # Prepare
+        connections = {"a": ["b"], "b": ["c", "a"], "c": [], "d": ["a"]}
+        graph, _ = graphs.from_adjacency(connections)
+        reference = implementations.REGISTRY["graphs.bfs"]["reference"]
+
+        # Run
+        distances = graphs.bfs_compiled(graph, [0, 1])
+
+        # Assert
+        assert distances.tolist() == [0, 0, 1, -1]
+        assert np.array_equal(distances, reference(graph, [0, 1]))
+
+    @needs_numba
+    def test_knots_agree_with_reference(self):
+        # Prepare
+        raw_data = "R 5\nU 8\nL 8\nD 3\nR 17\nD 10\nL 25\nU 20"
+        moves = day9.parse_data_to_array(raw_data)
+        registered = implementations.REGISTRY["day9.get_multi_knot_positions"]
+        reference = registered["reference"]
+
+        # Run
+        positions = day9.get_multi_knot_positions_compiled(moves, 10)
+
+        # Assert
+        assert len(positions) == 36
+        assert positions == reference(moves, 10)
+        assert day9.get_multi_knot_positions_compiled([], 10) == set()
+
+    @needs_numba
+    def test_scenic_score_agrees_with_reference(self):
+        # Prepare
+        raw_data = "30373\n25512\n65332\n33549\n35390"
+        height_map = day8.parse_data_to_array(raw_data)
+        registered = implementations.REGISTRY["day8.compute_scenic_score"]
+        reference = registered["reference"]
+
+        # Run
+        scores = [
+            day8.compute_scenic_score_compiled(height_map, (x, y))
+            for x in range(5)
+            for y in range(5)
+        ]
+
+        # Assert
+        assert max(scores) == 8
+        assert scores == [
+            reference(height_map, (x, y)) for x in range(5) for y in range(5)
+        ]
+
+    @needs_numba
+    def test_grain_agrees_with_reference(self):
+        # Prepare
+        map_ = np.zeros((5, 4), dtype=np.int8)
+        map_[:, 3] = 1
+        map_[0, 2] = 1
+        registered = implementations.REGISTRY["day14.simulate_grain_of_sand"]
+        reference = registered["reference"]
+
+        # Run
+        settled = day14.simulate_grain_of_sand_compiled(map_, (2, 0))
+        fallen = day14.simulate_grain_of_sand_compiled(map_[:, :3], (2, 0))
+
+        # Assert
+        assert settled == (2, 2)
+        assert settled == reference(map_, (2, 0))
+        assert fallen == reference(map_[:, :3], (2, 0))
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_grain_leaving_on_the_right_raises(self, monkeypatch, compiled):
+        # Prepare
+        if compiled and not jit.AVAILABLE:
+            pytest.skip("needs Numba")
+        name = "day14.simulate_grain_of_sand"
+        registered = implementations.REGISTRY.get(name, {})
+        reference = registered.get("reference", day14.simulate_grain_of_sand)
+        map_ = np.zeros((3, 4), dtype=np.int8)
+        map_[1:, 2] = 1  # the grain can only slide right off the last column
+
+        # Run
+        if not compiled:
+            monkeypatch.setattr(jit, "AVAILABLE", False)
+        kernel = jit.kernel(day14.drop_grain.__wrapped__)
+
+        # Assert
+        with pytest.raises(IndexError):
+            reference(map_, (2, 0))
+        with pytest.raises(IndexError):
+            kernel(map_, 2, 0)
@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks import harness
+from benchmarks.cases import MEMORY_BUDGETS
+from src.aoc2022 import runner
+
+
+def budget_id(budget):
+    return f"day{budget.day}-part{budget.part}"
+
+
+class TestMemory:
+    def test_every_day_has_a_budget(self):
+        # Prepare
+        days = set(runner.discover_days().keys())
+
+        # Run
+        budgeted_days = {budget.day for budget in MEMORY_BUDGETS}
+
+        # Assert
+        assert budgeted_days == days
+
+    @pytest.mark.parametrize("budget", MEMORY_BUDGETS, ids=budget_id)
+    def test_peak_memory_within_budget(self, budget):
+        # Run
+        peak_memory = harness.measure_memory(
+            budget.day,
+            budget.part,
+            budget.scale,
+        )
+
+        # Assert
+        assert peak_memory <= budget.limit
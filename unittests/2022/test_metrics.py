@@ -0,0 +1,105 @@
+from src.aoc2022 import metrics, utils
+from src.aoc2022.days import day10, day12, day13, day14, day16
+
+
+class TestMetrics:
+    def test_increment_and_snapshot(self):
+        # Prepare
+        before = metrics.snapshot()
+
+        # Run
+        metrics.increment("test.calls")
+        metrics.increment("test.items", 5)
+        metrics.increment("test.items", 2)
+        after = metrics.snapshot()
+        metrics.increment("test.items")
+
+        # Assert
+        assert metrics.difference(before, after) == {
+            "test.calls": 1,
+            "test.items": 7,
+        }
+        assert after["test.items"] - before.get("test.items", 0) == 7
+
+    def test_reset(self):
+        # Prepare
+        metrics.increment("test.calls")
+
+        # Run
+        metrics.reset()
+
+        # Assert
+        assert metrics.snapshot() == {}
+
+    def test_day10_cycles(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day10_sample.txt"
+        instructions = day10.parse_input(utils.get_raw_data(test_data_path))
+        before = metrics.snapshot()
+
+        # Run
+        day10.get_total_signal_strength(instructions)
+        counters = metrics.difference(before, metrics.snapshot())
+
+        # Assert
+        assert counters == {"day10.cycles_simulated": 240}
+
+    def test_day12_nodes_expanded(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day12_sample.txt"
+        raw_data = utils.get_raw_data(test_data_path)
+        parsed_map, _, end = day12.parse_input(raw_data)
+        before = metrics.snapshot()
+
+        # Run
+        distances = day12.get_distance_matrix(parsed_map, end)
+        counters = metrics.difference(before, metrics.snapshot())
+
+        # Assert
+        reachable = int((distances >= 0).sum())
+        assert counters == {"day12.bfs_nodes_expanded": reachable}
+
+    def test_day13_comparisons(self):
+        # Prepare
+        packets = [[3], [1], [2], [5], [4]]
+        before = metrics.snapshot()
+
+        # Run
+        day13.sort_packets(packets)
+        counters = metrics.difference(before, metrics.snapshot())
+
+        # Assert
+        assert len(packets) - 1 <= counters["day13.comparisons"] <= 10
+
+    def test_day14_grains_and_steps(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day14_sample.txt"
+        map_, start = day14.parse_input(utils.get_raw_data(test_data_path))
+        before = metrics.snapshot()
+
+        # Run
+        settled_map = day14.simulate_sand_falling(map_, start)
+        counters = metrics.difference(before, metrics.snapshot())
+
+        # Assert
+        assert day14.count_grains_of_sand(settled_map) == 24
+        assert counters["day14.grains_simulated"] == 24 + 1
+        assert counters["day14.cells_stepped"] > 24
+
+    def test_day16_permutations(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day16_sample.txt"
+        graph = day16.parse_input(utils.get_raw_data(test_data_path))
+        valves = ["BB", "CC", "DD"]
+        before = metrics.snapshot()
+
+        # Run
+        permutations = list(graph.time_aware_permutations("AA", {"BB"}, 30))
+        unchanged = metrics.difference(before, metrics.snapshot())
+        day16.get_optimal_sequence(graph, "AA", 30, non_zero_valves=valves)
+        counters = metrics.difference(before, metrics.snapshot())
+
+        # Assert
+        assert len(permutations) == 1
+        assert unchanged == {}
+        assert counters == {"day16.permutations_yielded": 6}
@@ -0,0 +1,105 @@
+import contextlib
+import json
+
+import pytest
+
+from src.aoc2022 import profiling
+from src.aoc2022.days import day13
+
+
+def outer(depth):
+    allocated = [0] * 10_000
+    if depth == 0:
+        return len(allocated)
+    return inner(depth)
+
+
+def inner(depth):
+    return outer(depth - 1)
+
+
+profiling.profiled(outer)
+profiling.profiled(inner)
+
+
+class TestProfiling:
+    def test_disabled_profiling_has_no_wrapper(self):
+        # Prepare
+        function = day13.__dict__["element_is_equal"]
+
+        # Run
+        decorated = profiling.profiled(function)
+
+        # Assert
+        assert decorated is function
+        assert day13.element_is_equal is function
+        assert profiling.active_profiler is None
+        assert isinstance(profiling.phase("noop"), contextlib.nullcontext)
+
+    def test_profiler_records_calls(self):
+        # Prepare
+        function = day13.element_is_equal
+        packets = [[1, [2, 3]], [1, [2, 4]], [[1], 5], [0]]
+
+        # Run
+        with profiling.Profiler() as profiler:
+            with profiling.phase("sort"):
+                sorted_packets = day13.sort_packets(packets)
+
+        # Assert
+        assert day13.element_is_equal is function
+        assert sorted_packets == [[0], [1, [2, 3]], [1, [2, 4]], [[1], 5]]
+        stats = profiler.stats["day13.element_is_equal"]
+        assert stats.calls >= len(packets) - 1
+        assert stats.wall_time >= 0
+        assert stats.cpu_time >= 0
+        assert profiler.stats["sort"].calls == 1
+        assert "sort;day13.element_is_equal" in profiler.collapsed
+
+    def test_nested_frames(self):
+        # Run
+        with profiling.Profiler() as profiler:
+            result = outer(1)
+
+        # Assert
+        assert result == 10_000
+        assert profiler.stats["test_profiling.outer"].calls == 2
+        assert profiler.stats["test_profiling.inner"].calls == 1
+        assert profiler.stats["test_profiling.outer"].peak_memory >= 80_000
+        assert set(profiler.collapsed) == {
+            "test_profiling.outer",
+            "test_profiling.outer;test_profiling.inner",
+            "test_profiling.outer;test_profiling.inner;test_profiling.outer",
+        }
+
+    def test_only_one_active_profiler(self):
+        # Run / Assert
+        with profiling.Profiler():
+            with pytest.raises(RuntimeError):
+                with profiling.Profiler():
+                    pass
+        assert profiling.active_profiler is None
+
+    def test_save(self, tmp_path):
+        # Prepare
+        path_prefix = str(tmp_path / "profile")
+        with profiling.Profiler(trace_memory=False) as profiler:
+            with profiling.phase("parse"):
+                with profiling.phase("inner"):
+                    pass
+
+        # Run
+        profiler.save(path_prefix)
+
+        # Assert
+        with open(path_prefix + ".json") as file:
+            stats = json.load(file)
+        with open(path_prefix + ".collapsed") as file:
+            lines = file.read().splitlines()
+        assert stats["parse"]["calls"] == 1
+        assert stats["inner"]["peak_memory"] == 0
+        assert [line.split(" ")[0] for line in lines] == [
+            "parse",
+            "parse;inner",
+        ]
+        assert all(int(line.split(" ")[1]) >= 0 for line in lines)
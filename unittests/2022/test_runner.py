@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from src.aoc2022 import runner
+
+sample_day1 = "\n\n".join(
+    ["1000\n2000\n3000", "4000", "5000\n6000", "7000\n8000\n9000", "10000"]
+)
+sample_day6 = "mjqjpqmgbljsphdztnvjfqwrcgsmlb"
+
+
+class TestRunner:
+    def test_discover_days(self):
+        # Run
+        actual_days = runner.discover_days()
+
+        # Assert
+        assert list(actual_days.keys()) == list(range(1, 17))
+        assert actual_days[16] == "src.aoc2022.days.day16"
+
+    def test_solve_part(self):
+        # Prepare
+        test_data_path = "./unittests/2022/test_data/day10_sample.txt"
+
+        # Run
+        actual_result = runner.solve_part(10, 1, test_data_path)
+
+        # Assert
+        assert actual_result.day == 10
+        assert actual_result.part == 1
+        assert actual_result.answer == 13140
+        assert actual_result.parse_time >= 0
+        assert actual_result.solve_time >= 0
+
+    def test_run_days(self, tmp_path):
+        # Prepare
+        (tmp_path / "day1.txt").write_text(sample_day1)
+        (tmp_path / "day6.txt").write_text(sample_day6)
+        expected_answers = {
+            (1, 1): 24_000,
+            (1, 2): 45_000,
+            (6, 1): 7,
+            (6, 2): 19,
+        }
+        data_dir = str(tmp_path)
+
+        # Run
+        results = runner.run_days([6, 1], data_directory=data_dir)
+        actual_answers = {(r.day, r.part): r.answer for r in results}
+
+        # Assert
+        assert actual_answers == expected_answers
+        assert [(r.day, r.part) for r in results] == sorted(expected_answers)
+
+    def test_run_days_invalid_day(self):
+        # Run
+        with pytest.raises(ValueError) as exc_info:
+            runner.run_days([42])
+
+        # Assert
+        assert str(exc_info.value) == "Invalid day 42"
+
+    def test_format_results(self):
+        # Prepare
+        results = [
+            runner.PartResult(1, 1, 24_000, 0.5, 0.25),
+            runner.PartResult(10, 2, "#.\n.#", 0.0, 1.0),
+        ]
+
+        # Run
+        table = runner.format_table(results)
+        parsed_json = json.loads(runner.format_json(results))
+
+        # Assert
+        assert table.split("\n")[0].split() == [
+            "day",
+            "part",
+            "parse",
+            "(s)",
+            "solve",
+            "(s)",
+            "answer",
+        ]
+        assert "24000" in table
+        assert "#. | .#" in table
+        assert parsed_json[0] == {
+            "day": 1,
+            "part": 1,
+            "answer": 24_000,
+            "parse_time": 0.5,
+            "solve_time": 0.25,
+            "cached": False,
+        }
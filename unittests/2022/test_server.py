@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+from src.aoc2022 import server
+
+sample_day1 = "\n\n".join(
+    ["1000\n2000\n3000", "4000", "5000\n6000", "7000\n8000\n9000", "10000"]
+)
+
+
+async def send(port, path, body=b"", method="POST"):
+    reader, writer = await asyncio.open_connection(server.DEFAULT_HOST, port)
+    head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+    writer.write(head.encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    status_line, _, payload = response.partition(b"\r\n\r\n")
+    return int(status_line.split(b" ")[1]), json.loads(payload)
+
+
+def run_with_server(client, day_limit=None):
+    async def run():
+        async with server.SolveServer(2, day_limit) as solve_server:
+            tcp_server = await solve_server.start(port=0)
+            port = tcp_server.sockets[0].getsockname()[1]
+            async with tcp_server:
+                return await client(solve_server, port)
+
+    return asyncio.run(run())
+
+
+class TestServer:
+    def test_solve_requests(self):
+        # Prepare
+        async def client(solve_server, port):
+            return await asyncio.gather(
+                send(port, "/day/1/part/1", sample_day1.encode()),
+                send(port, "/day/1/part/2", sample_day1.encode()),
+                send(port, "/day/6/part/1", b"mjqjpqmgbljsphdztnvjfqwrcgsmlb"),
+            )
+
+        # Run
+        responses = run_with_server(client)
+
+        # Assert
+        assert responses == [
+            (200, {"answer": 24_000}),
+            (200, {"answer": 45_000}),
+            (200, {"answer": 7}),
+        ]
+
+    def test_errors(self):
+        # Prepare
+        async def client(solve_server, port):
+            return await asyncio.gather(
+                send(port, "/day/42/part/1"),
+                send(port, "/day/1/part/3"),
+                send(port, "/solve"),
+                send(port, "/day/1/part/1", method="GET"),
+                send(port, "/day/4/part/1", b"not an input"),
+            )
+
+        # Run
+        responses = run_with_server(client)
+        statuses = [status for status, _ in responses]
+
+        # Assert
+        assert statuses == [404, 404, 404, 405, 500]
+        assert responses[-1][1]["error"].startswith("ValueError")
+
+    def test_day_limit(self):
+        # Prepare
+        async def client(solve_server, port):
+            day6_slot = solve_server.get_semaphore(6)
+            await day6_slot.acquire()  # day 6 is at its limit
+
+            day6_request = asyncio.ensure_future(
+                send(port, "/day/6/part/1", b"bvwbjplbgvbhsrlpgdmjqwftvncz")
+            )
+            day1_response = await send(port, "/day/1/part/1", b"1\n2\n\n4")
+            day6_waited = not day6_request.done()
+
+            day6_slot.release()
+            return day1_response, day6_waited, await day6_request
+
+        # Run
+        responses = run_with_server(client, day_limit=1)
+        day1_response, day6_waited, day6_response = responses
+
+        # Assert
+        assert day1_response == (200, {"answer": 4})
+        assert day6_waited
+        assert day6_response == (200, {"answer": 5})
@@ -1,4 +1,12 @@
-from src.aoc2022 import utils
+import importlib
+import sys
+
+import pytest
+
+from src.aoc2022 import generators, runner, utils
+
+all_days = list(runner.discover_days().keys())
+block_days = [1, 5, 11, 13]
 
 
 class TestUtils:
@@ -17,3 +25,123 @@ class TestUtils:
 
         # assert
         assert actual_data == expected_data
+
+    def test_map_file(self):
+        # Prepare
+        file_path = "./unittests/2022/test_data/dummy.txt"
+        with open(file_path, "rb") as file:
+            expected_data = file.read()
+
+        # Run
+        with utils.map_raw_data(file_path) as view:
+            actual_data = view[:]
+
+        # Assert
+        assert actual_data == expected_data
+
+    def test_map_empty_file(self, tmp_path):
+        # Prepare
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+
+        # Run
+        with utils.map_raw_data(str(file_path)) as view:
+            actual_data = view[:]
+
+        # Assert
+        assert actual_data == b""
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_iter_lines(self, tmp_path, newline):
+        # Prepare
+        file_path = str(tmp_path / "lines.txt")
+        with open(file_path, "w", newline=newline) as file:
+            file.write("first\nsecond\n\nlast")
+        expected = ["first", "second", "", "last"]
+
+        # Run
+        from_file = list(utils.iter_lines(file_path))
+        with utils.map_raw_data(file_path) as view:
+            from_view = list(utils.iter_lines(view))
+
+        # Assert
+        assert from_file == expected
+        assert from_view == expected
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_iter_blocks(self, tmp_path, newline):
+        # Prepare
+        file_path = str(tmp_path / "blocks.txt")
+        with open(file_path, "w", newline=newline) as file:
+            file.write("\n1\n2\n\n3\n\n\n4\n5\n")
+        expected = [["1", "2"], ["3"], ["4", "5"]]
+
+        # Run
+        from_file = list(utils.iter_blocks(file_path))
+        with utils.map_raw_data(file_path) as view:
+            from_view = list(utils.iter_blocks(view))
+
+        # Assert
+        assert from_file == expected
+        assert from_view == expected
+
+    def test_lazy_import(self, monkeypatch):
+        # Prepare
+        name = "json.tool"
+        sys.modules.pop(name, None)
+        package = importlib.import_module("json")
+        monkeypatch.delattr(package, "tool", raising=False)
+
+        # Run
+        module = utils.lazy_import(name)
+        is_lazy = type(module).__name__ == "_LazyModule"
+        main = module.main
+
+        # Assert
+        assert is_lazy
+        assert callable(main)
+        assert utils.lazy_import(name) is module
+        assert package.tool is module
+        with pytest.raises(ModuleNotFoundError):
+            utils.lazy_import("not_an_installed_module")
+
+    def test_split_lines(self):
+        # Run
+        from_text = utils.split_lines("\na\nb\n")
+        from_lines = utils.split_lines(iter(["a", "", "b", " "]))
+
+        # Assert
+        assert list(from_text) == ["a", "b"]
+        assert list(from_lines) == ["a", "b"]
+
+    def test_split_blocks(self):
+        # Run
+        from_text = utils.split_blocks("a\nb\n\nc\n")
+        from_blocks = utils.split_blocks(iter([["a", "b"], ["c"]]))
+
+        # Assert
+        assert list(from_text) == [["a", "b"], ["c"]]
+        assert list(from_blocks) == [["a", "b"], ["c"]]
+
+    @pytest.mark.parametrize("day", all_days)
+    def test_parse_input_from_stream(self, tmp_path, day):
+        # Prepare
+        module = importlib.import_module(runner.discover_days()[day])
+        raw_data = generators.generate_input(day, scale=0.1, seed=4)
+        file_path = str(tmp_path / f"day{day}.txt")
+        with open(file_path, "w", newline="\r\n") as file:
+            file.write(raw_data + "\n")
+        expected = module.solve_part_1(module.parse_input(raw_data))
+
+        # Run
+        with utils.map_raw_data(file_path) as view:
+            if day == 6:
+                stream = view
+            elif day in block_days:
+                stream = utils.iter_blocks(view)
+            else:
+                stream = utils.iter_lines(view)
+            actual = module.solve_part_1(module.parse_input(stream))
+
+        # Assert
+        assert actual == expected